@@ -1,3 +1,5 @@
+import atexit
+import logging
 import os
 import sys
 from pathlib import Path
@@ -11,19 +13,27 @@ from alembic import context
 # backend/alembic/env.py -> parents[1] == backend/
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-# Import models so Base.metadata is populated for autogenerate
-import app.db.models  # noqa: F401, E402
-from app.chat.memory_models import Conversation, Message  # noqa: F401, E402
-from app.db.base import Base  # noqa: E402
-
 config = context.config
 
 # Interpret the config file for Python logging.
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
-# Set metadata for 'autogenerate' support
-target_metadata = Base.metadata
+# Keep per-statement engine logging off so batched backfills are not dominated by log I/O.
+if os.getenv("ALEMBIC_QUIET_SQL", "1") == "1":
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+
+
+def _load_metadata():
+    """
+    Import the model tree so Base.metadata is populated for autogenerate.
+    Deferred so offline SQL generation only pays for the version graph.
+    """
+    import app.db.models  # noqa: F401
+    from app.chat.memory_models import Conversation, Message  # noqa: F401
+    from app.db.base import Base
+
+    return Base.metadata
 
 
 def get_database_url() -> str:
@@ -37,10 +47,17 @@ def get_database_url() -> str:
     return config.get_main_option("sqlalchemy.url")
 
 
+DATABASE_URL = get_database_url()
+
+# One pooled connection is reused for the whole run; widen via MIGRATION_POOL for
+# batched data migrations that need more than one connection.
+MIGRATION_POOL_SIZE = int(os.getenv("MIGRATION_POOL", "1"))
+
+
 def run_migrations_offline() -> None:
-    url = get_database_url()
+    target_metadata = _load_metadata() if getattr(config.cmd_opts, "autogenerate", False) else None
     context.configure(
-        url=url,
+        url=DATABASE_URL,
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
@@ -51,21 +68,38 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
+def _get_engine():
+    """
+    env.py is re-executed for every command, so the engine is cached on config.attributes:
+    a harness that runs several commands with one Config (downgrade then upgrade) reuses it.
+    """
+    engine = config.attributes.get("engine")
+    if engine is None:
+        # Override sqlalchemy.url in config with our resolved DB URL
+        section = config.get_section(config.config_ini_section) or {}
+        section["sqlalchemy.url"] = DATABASE_URL
+
+        engine = engine_from_config(
+            section,
+            prefix="sqlalchemy.",
+            poolclass=pool.QueuePool,
+            pool_size=MIGRATION_POOL_SIZE,
+            max_overflow=0,
+            pool_pre_ping=True,
+            pool_use_lifo=True,
+        )
+        config.attributes["engine"] = engine
+        atexit.register(engine.dispose)
+    return engine
+
+
 def run_migrations_online() -> None:
-    # Override sqlalchemy.url in config with our resolved DB URL
-    section = config.get_section(config.config_ini_section) or {}
-    section["sqlalchemy.url"] = get_database_url()
-
-    connectable = engine_from_config(
-        section,
-        prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
-    )
+    connectable = _get_engine()
 
     with connectable.connect() as connection:
         context.configure(
             connection=connection,
-            target_metadata=target_metadata,
+            target_metadata=_load_metadata(),
             compare_type=True,
         )
 
@@ -0,0 +1,47 @@
+"""add refresh tokens active index
+
+Revision ID: 05abc2cf33b3
+Revises: e84aa01a9f65
+Create Date: 2026-10-15 15:30:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.migration_helpers import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = "05abc2cf33b3"
+down_revision: Union[str, Sequence[str], None] = "e84aa01a9f65"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_refresh_tokens() -> bool:
+    # refresh_tokens is created by init_db on fresh installs (with this index); only
+    # databases that already have the table need it added here.
+    if op.get_context().as_sql:
+        return True
+    return sa.inspect(op.get_bind()).has_table("refresh_tokens")
+
+
+def upgrade() -> None:
+    if not _has_refresh_tokens():
+        return
+
+    create_index_concurrently(
+        "ix_refresh_tokens_user_active",
+        "refresh_tokens",
+        ["user_id", "tenant_id", "created_at"],
+        postgresql_where=sa.text("revoked_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    if not _has_refresh_tokens():
+        return
+
+    drop_index_concurrently("ix_refresh_tokens_user_active", "refresh_tokens")
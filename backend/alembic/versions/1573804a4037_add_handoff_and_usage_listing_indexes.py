@@ -0,0 +1,44 @@
+"""add handoff and usage listing indexes
+
+Revision ID: 1573804a4037
+Revises: 4a9f7c2d1e6b
+Create Date: 2026-10-15 09:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from app.db.migration_helpers import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = "1573804a4037"
+down_revision: Union[str, Sequence[str], None] = "4a9f7c2d1e6b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    create_index_concurrently(
+        "ix_handoff_tenant_status_created",
+        "handoff_requests",
+        ["tenant_id", "status", sa.text("created_at DESC")],
+    )
+    create_index_concurrently(
+        "ix_handoff_open_by_tenant",
+        "handoff_requests",
+        ["tenant_id", sa.text("created_at DESC")],
+        postgresql_where=sa.text("status NOT IN ('closed', 'resolved')"),
+    )
+    create_index_concurrently(
+        "ix_usage_events_tenant_created",
+        "tenant_usage_events",
+        ["tenant_id", sa.text("created_at DESC")],
+    )
+
+
+def downgrade() -> None:
+    drop_index_concurrently("ix_usage_events_tenant_created", "tenant_usage_events")
+    drop_index_concurrently("ix_handoff_open_by_tenant", "handoff_requests")
+    drop_index_concurrently("ix_handoff_tenant_status_created", "handoff_requests")
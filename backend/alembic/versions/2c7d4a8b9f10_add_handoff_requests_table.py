@@ -8,6 +8,8 @@ Create Date: 2026-02-24
 from alembic import op
 import sqlalchemy as sa
 
+from app.db.migration_helpers import create_index_concurrently, drop_index_concurrently
+
 
 # revision identifiers, used by Alembic.
 revision = "2c7d4a8b9f10"
@@ -35,13 +37,13 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
     )
 
-    op.create_index(op.f("ix_handoff_requests_tenant_id"), "handoff_requests", ["tenant_id"], unique=False)
-    op.create_index(op.f("ix_handoff_requests_conversation_id"), "handoff_requests", ["conversation_id"], unique=False)
-    op.create_index(op.f("ix_handoff_requests_user_id"), "handoff_requests", ["user_id"], unique=False)
+    create_index_concurrently(op.f("ix_handoff_requests_tenant_id"), "handoff_requests", ["tenant_id"], unique=False)
+    create_index_concurrently(op.f("ix_handoff_requests_conversation_id"), "handoff_requests", ["conversation_id"], unique=False)
+    create_index_concurrently(op.f("ix_handoff_requests_user_id"), "handoff_requests", ["user_id"], unique=False)
 
 
 def downgrade() -> None:
-    op.drop_index(op.f("ix_handoff_requests_user_id"), table_name="handoff_requests")
-    op.drop_index(op.f("ix_handoff_requests_conversation_id"), table_name="handoff_requests")
-    op.drop_index(op.f("ix_handoff_requests_tenant_id"), table_name="handoff_requests")
+    drop_index_concurrently(op.f("ix_handoff_requests_user_id"), "handoff_requests")
+    drop_index_concurrently(op.f("ix_handoff_requests_conversation_id"), "handoff_requests")
+    drop_index_concurrently(op.f("ix_handoff_requests_tenant_id"), "handoff_requests")
     op.drop_table("handoff_requests")
@@ -0,0 +1,53 @@
+"""store refresh token hash as bytea
+
+Revision ID: 3c9d41e7b2a8
+Revises: 05abc2cf33b3
+Create Date: 2026-10-15 16:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.migration_helpers import is_postgresql, set_lock_timeout
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3c9d41e7b2a8"
+down_revision: Union[str, Sequence[str], None] = "05abc2cf33b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_refresh_tokens() -> bool:
+    # refresh_tokens is created by init_db on fresh installs (already bytea); only
+    # databases that already have the table need converting.
+    if op.get_context().as_sql:
+        return True
+    return sa.inspect(op.get_bind()).has_table("refresh_tokens")
+
+
+def upgrade() -> None:
+    if not is_postgresql() or not _has_refresh_tokens():
+        return
+
+    # decode(hex) yields exactly the raw sha256 digest, so issued tokens stay valid.
+    # The USING clause rewrites the table and rebuilds its unique index.
+    set_lock_timeout()
+    op.execute(
+        "ALTER TABLE refresh_tokens ALTER COLUMN token_hash TYPE bytea USING decode(token_hash, 'hex')"
+    )
+
+
+def downgrade() -> None:
+    # Code from before this revision looks tokens up by hex sha256 only. Rows written
+    # since then hold keyed BLAKE2b digests, so rolling back past here invalidates every
+    # refresh token issued after the upgrade; those users have to log in again.
+    if not is_postgresql() or not _has_refresh_tokens():
+        return
+
+    set_lock_timeout()
+    op.execute(
+        "ALTER TABLE refresh_tokens ALTER COLUMN token_hash TYPE varchar(128) USING encode(token_hash, 'hex')"
+    )
@@ -10,6 +10,8 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 
+from app.db.migration_helpers import create_index_concurrently, drop_index_concurrently
+
 
 # revision identifiers, used by Alembic.
 revision: str = "4a9f7c2d1e6b"
@@ -30,16 +32,16 @@ def upgrade() -> None:
         sa.Column("created_at", sa.DateTime(), nullable=False),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index(op.f("ix_ops_audit_logs_tenant_id"), "ops_audit_logs", ["tenant_id"], unique=False)
-    op.create_index(op.f("ix_ops_audit_logs_actor_user_id"), "ops_audit_logs", ["actor_user_id"], unique=False)
-    op.create_index(op.f("ix_ops_audit_logs_action_type"), "ops_audit_logs", ["action_type"], unique=False)
-    op.create_index("ix_ops_audit_tenant_created_at", "ops_audit_logs", ["tenant_id", "created_at"], unique=False)
+    create_index_concurrently(op.f("ix_ops_audit_logs_tenant_id"), "ops_audit_logs", ["tenant_id"], unique=False)
+    create_index_concurrently(op.f("ix_ops_audit_logs_actor_user_id"), "ops_audit_logs", ["actor_user_id"], unique=False)
+    create_index_concurrently(op.f("ix_ops_audit_logs_action_type"), "ops_audit_logs", ["action_type"], unique=False)
+    create_index_concurrently("ix_ops_audit_tenant_created_at", "ops_audit_logs", ["tenant_id", "created_at"], unique=False)
 
 
 def downgrade() -> None:
-    op.drop_index("ix_ops_audit_tenant_created_at", table_name="ops_audit_logs")
-    op.drop_index(op.f("ix_ops_audit_logs_action_type"), table_name="ops_audit_logs")
-    op.drop_index(op.f("ix_ops_audit_logs_actor_user_id"), table_name="ops_audit_logs")
-    op.drop_index(op.f("ix_ops_audit_logs_tenant_id"), table_name="ops_audit_logs")
+    drop_index_concurrently("ix_ops_audit_tenant_created_at", "ops_audit_logs")
+    drop_index_concurrently(op.f("ix_ops_audit_logs_action_type"), "ops_audit_logs")
+    drop_index_concurrently(op.f("ix_ops_audit_logs_actor_user_id"), "ops_audit_logs")
+    drop_index_concurrently(op.f("ix_ops_audit_logs_tenant_id"), "ops_audit_logs")
     op.drop_table("ops_audit_logs")
 
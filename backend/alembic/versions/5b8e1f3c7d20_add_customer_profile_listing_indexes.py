@@ -0,0 +1,46 @@
+"""add customer profile listing indexes
+
+Revision ID: 5b8e1f3c7d20
+Revises: 9d2e6b4f1a07
+Create Date: 2026-10-15 17:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from app.db.migration_helpers import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5b8e1f3c7d20"
+down_revision: Union[str, Sequence[str], None] = "9d2e6b4f1a07"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Profile listing: tenant filter + ORDER BY updated_at DESC LIMIT n as an index range scan.
+    create_index_concurrently(
+        "ix_customer_profiles_tenant_updated",
+        "customer_profiles",
+        ["tenant_id", sa.text("updated_at DESC")],
+    )
+    # Batched handle lookup and per-profile handoff counts are tenant-scoped.
+    # conversations already has ix_conversations_tenant_user.
+    create_index_concurrently(
+        "ix_customer_channel_handles_tenant_profile",
+        "customer_channel_handles",
+        ["tenant_id", "customer_profile_id"],
+    )
+    create_index_concurrently(
+        "ix_handoff_requests_tenant_user",
+        "handoff_requests",
+        ["tenant_id", "user_id"],
+    )
+
+
+def downgrade() -> None:
+    drop_index_concurrently("ix_handoff_requests_tenant_user", "handoff_requests")
+    drop_index_concurrently("ix_customer_channel_handles_tenant_profile", "customer_channel_handles")
+    drop_index_concurrently("ix_customer_profiles_tenant_updated", "customer_profiles")
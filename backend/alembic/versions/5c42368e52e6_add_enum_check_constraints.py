@@ -0,0 +1,57 @@
+"""add enum check constraints
+
+Revision ID: 5c42368e52e6
+Revises: e62761ab2f89
+Create Date: 2026-10-15 11:30:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.db.migration_helpers import is_postgresql, set_lock_timeout
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5c42368e52e6"
+down_revision: Union[str, Sequence[str], None] = "e62761ab2f89"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CHANNEL_TYPES = "channel_type IN ('whatsapp', 'messenger', 'instagram', 'facebook')"
+
+CHECK_CONSTRAINTS = [
+    (
+        "ck_handoff_requests_status",
+        "handoff_requests",
+        "status IN ('new', 'open', 'pending_customer', 'resolved', 'closed')",
+    ),
+    (
+        "ck_handoff_requests_priority",
+        "handoff_requests",
+        "priority IN ('low', 'normal', 'high', 'urgent')",
+    ),
+    ("ck_tenant_channel_accounts_channel_type", "tenant_channel_accounts", CHANNEL_TYPES),
+    ("ck_customer_channel_handles_channel_type", "customer_channel_handles", CHANNEL_TYPES),
+]
+
+
+def upgrade() -> None:
+    if not is_postgresql():
+        return
+
+    # NOT VALID takes only a brief lock; the scan in VALIDATE does not block writes.
+    set_lock_timeout()
+    for name, table_name, condition in CHECK_CONSTRAINTS:
+        op.execute(f"ALTER TABLE {table_name} ADD CONSTRAINT {name} CHECK ({condition}) NOT VALID")
+    for name, table_name, _ in CHECK_CONSTRAINTS:
+        op.execute(f"ALTER TABLE {table_name} VALIDATE CONSTRAINT {name}")
+
+
+def downgrade() -> None:
+    if not is_postgresql():
+        return
+
+    for name, table_name, _ in reversed(CHECK_CONSTRAINTS):
+        op.drop_constraint(name, table_name, type_="check")
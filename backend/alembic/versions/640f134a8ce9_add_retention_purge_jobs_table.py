@@ -0,0 +1,51 @@
+"""add retention purge jobs table
+
+Revision ID: 640f134a8ce9
+Revises: e804802adc73
+Create Date: 2026-10-15 13:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.migration_helpers import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = "640f134a8ce9"
+down_revision: Union[str, Sequence[str], None] = "e804802adc73"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "retention_purge_jobs",
+        sa.Column("id", sa.String(length=64), nullable=False),
+        sa.Column("tenant_id", sa.String(length=64), nullable=False),
+        sa.Column("requested_by_user_id", sa.String(length=64), nullable=False),
+        sa.Column("status", sa.String(length=16), nullable=False),
+        sa.Column("audit_cutoff", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("messages_cutoff", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("audit_deleted", sa.Integer(), nullable=False),
+        sa.Column("messages_deleted", sa.Integer(), nullable=False),
+        sa.Column("error", sa.String(length=500), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.CheckConstraint(
+            "status IN ('queued', 'running', 'succeeded', 'failed')",
+            name="ck_retention_purge_jobs_status",
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    create_index_concurrently(
+        op.f("ix_retention_purge_jobs_tenant_id"), "retention_purge_jobs", ["tenant_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    drop_index_concurrently(op.f("ix_retention_purge_jobs_tenant_id"), "retention_purge_jobs")
+    op.drop_table("retention_purge_jobs")
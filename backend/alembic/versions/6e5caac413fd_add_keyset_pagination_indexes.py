@@ -0,0 +1,52 @@
+"""add keyset pagination indexes
+
+Revision ID: 6e5caac413fd
+Revises: 5c42368e52e6
+Create Date: 2026-10-15 12:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.db.migration_helpers import create_index_concurrently, drop_index_concurrently, is_postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6e5caac413fd"
+down_revision: Union[str, Sequence[str], None] = "5c42368e52e6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _rebuild_chat_audit_index(columns: list[str]) -> None:
+    if not is_postgresql():
+        op.drop_index("ix_chat_audit_tenant_created_at", table_name="chat_audit_logs")
+        op.create_index("ix_chat_audit_tenant_created_at", "chat_audit_logs", columns)
+        return
+
+    # Build under a temporary name first so listings never lose their index.
+    create_index_concurrently("ix_chat_audit_tenant_created_at_tmp", "chat_audit_logs", columns)
+    drop_index_concurrently("ix_chat_audit_tenant_created_at", "chat_audit_logs")
+    op.execute("ALTER INDEX ix_chat_audit_tenant_created_at_tmp RENAME TO ix_chat_audit_tenant_created_at")
+
+
+def upgrade() -> None:
+    # (tenant_id, ts, id) lets (ts, id) < (:ts, :id) cursors range-seek instead of skipping OFFSET rows.
+    _rebuild_chat_audit_index(["tenant_id", "created_at", "id"])
+    create_index_concurrently(
+        "ix_conversations_tenant_activity",
+        "conversations",
+        ["tenant_id", "last_activity_at", "id"],
+    )
+    create_index_concurrently(
+        "ix_documents_tenant_created",
+        "documents",
+        ["tenant_id", "created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    drop_index_concurrently("ix_documents_tenant_created", "documents")
+    drop_index_concurrently("ix_conversations_tenant_activity", "conversations")
+    _rebuild_chat_audit_index(["tenant_id", "created_at"])
@@ -8,6 +8,8 @@ Create Date: 2026-02-24
 from alembic import op
 import sqlalchemy as sa
 
+from app.db.migration_helpers import create_index_concurrently, drop_index_concurrently
+
 
 # revision identifiers, used by Alembic.
 revision = "6f1d9a2c4b3e"
@@ -39,14 +41,14 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
     )
 
-    op.create_index(op.f("ix_tenant_usage_events_tenant_id"), "tenant_usage_events", ["tenant_id"], unique=False)
-    op.create_index(op.f("ix_tenant_usage_events_user_id"), "tenant_usage_events", ["user_id"], unique=False)
-    op.create_index(op.f("ix_tenant_usage_events_created_at"), "tenant_usage_events", ["created_at"], unique=False)
+    create_index_concurrently(op.f("ix_tenant_usage_events_tenant_id"), "tenant_usage_events", ["tenant_id"], unique=False)
+    create_index_concurrently(op.f("ix_tenant_usage_events_user_id"), "tenant_usage_events", ["user_id"], unique=False)
+    create_index_concurrently(op.f("ix_tenant_usage_events_created_at"), "tenant_usage_events", ["created_at"], unique=False)
 
 
 def downgrade() -> None:
-    op.drop_index(op.f("ix_tenant_usage_events_created_at"), table_name="tenant_usage_events")
-    op.drop_index(op.f("ix_tenant_usage_events_user_id"), table_name="tenant_usage_events")
-    op.drop_index(op.f("ix_tenant_usage_events_tenant_id"), table_name="tenant_usage_events")
+    drop_index_concurrently(op.f("ix_tenant_usage_events_created_at"), "tenant_usage_events")
+    drop_index_concurrently(op.f("ix_tenant_usage_events_user_id"), "tenant_usage_events")
+    drop_index_concurrently(op.f("ix_tenant_usage_events_tenant_id"), "tenant_usage_events")
     op.drop_table("tenant_usage_events")
     op.drop_table("tenant_usage_limits")
@@ -0,0 +1,39 @@
+"""add id to customer profile listing index
+
+Revision ID: 7f2c9a4e6b31
+Revises: e3a7c5d9b142
+Create Date: 2026-10-15 18:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from app.db.migration_helpers import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7f2c9a4e6b31"
+down_revision: Union[str, Sequence[str], None] = "e3a7c5d9b142"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keyset paging orders and seeks on (updated_at, id); the id tie-breaker must be in
+    # the index for the cursor predicate to stay a range scan.
+    create_index_concurrently(
+        "ix_customer_profiles_tenant_updated_id",
+        "customer_profiles",
+        ["tenant_id", "updated_at", "id"],
+    )
+    drop_index_concurrently("ix_customer_profiles_tenant_updated", "customer_profiles")
+
+
+def downgrade() -> None:
+    create_index_concurrently(
+        "ix_customer_profiles_tenant_updated",
+        "customer_profiles",
+        ["tenant_id", sa.text("updated_at DESC")],
+    )
+    drop_index_concurrently("ix_customer_profiles_tenant_updated_id", "customer_profiles")
@@ -10,6 +10,8 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 
+from app.db.migration_helpers import create_index_concurrently, drop_index_concurrently
+
 
 # revision identifiers, used by Alembic.
 revision: str = "8e9c2a1f5b7d"
@@ -38,19 +40,19 @@ def upgrade() -> None:
         sa.Column("last_used_at", sa.DateTime(), nullable=True),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index(op.f("ix_tenant_channel_accounts_tenant_id"), "tenant_channel_accounts", ["tenant_id"], unique=False)
-    op.create_index(op.f("ix_tenant_channel_accounts_channel_type"), "tenant_channel_accounts", ["channel_type"], unique=False)
-    op.create_index(op.f("ix_tenant_channel_accounts_verify_token"), "tenant_channel_accounts", ["verify_token"], unique=True)
-    op.create_index(op.f("ix_tenant_channel_accounts_phone_number_id"), "tenant_channel_accounts", ["phone_number_id"], unique=False)
-    op.create_index(op.f("ix_tenant_channel_accounts_page_id"), "tenant_channel_accounts", ["page_id"], unique=False)
-    op.create_index(op.f("ix_tenant_channel_accounts_instagram_account_id"), "tenant_channel_accounts", ["instagram_account_id"], unique=False)
+    create_index_concurrently(op.f("ix_tenant_channel_accounts_tenant_id"), "tenant_channel_accounts", ["tenant_id"], unique=False)
+    create_index_concurrently(op.f("ix_tenant_channel_accounts_channel_type"), "tenant_channel_accounts", ["channel_type"], unique=False)
+    create_index_concurrently(op.f("ix_tenant_channel_accounts_verify_token"), "tenant_channel_accounts", ["verify_token"], unique=True)
+    create_index_concurrently(op.f("ix_tenant_channel_accounts_phone_number_id"), "tenant_channel_accounts", ["phone_number_id"], unique=False)
+    create_index_concurrently(op.f("ix_tenant_channel_accounts_page_id"), "tenant_channel_accounts", ["page_id"], unique=False)
+    create_index_concurrently(op.f("ix_tenant_channel_accounts_instagram_account_id"), "tenant_channel_accounts", ["instagram_account_id"], unique=False)
 
 
 def downgrade() -> None:
-    op.drop_index(op.f("ix_tenant_channel_accounts_instagram_account_id"), table_name="tenant_channel_accounts")
-    op.drop_index(op.f("ix_tenant_channel_accounts_page_id"), table_name="tenant_channel_accounts")
-    op.drop_index(op.f("ix_tenant_channel_accounts_phone_number_id"), table_name="tenant_channel_accounts")
-    op.drop_index(op.f("ix_tenant_channel_accounts_verify_token"), table_name="tenant_channel_accounts")
-    op.drop_index(op.f("ix_tenant_channel_accounts_channel_type"), table_name="tenant_channel_accounts")
-    op.drop_index(op.f("ix_tenant_channel_accounts_tenant_id"), table_name="tenant_channel_accounts")
+    drop_index_concurrently(op.f("ix_tenant_channel_accounts_instagram_account_id"), "tenant_channel_accounts")
+    drop_index_concurrently(op.f("ix_tenant_channel_accounts_page_id"), "tenant_channel_accounts")
+    drop_index_concurrently(op.f("ix_tenant_channel_accounts_phone_number_id"), "tenant_channel_accounts")
+    drop_index_concurrently(op.f("ix_tenant_channel_accounts_verify_token"), "tenant_channel_accounts")
+    drop_index_concurrently(op.f("ix_tenant_channel_accounts_channel_type"), "tenant_channel_accounts")
+    drop_index_concurrently(op.f("ix_tenant_channel_accounts_tenant_id"), "tenant_channel_accounts")
     op.drop_table("tenant_channel_accounts")
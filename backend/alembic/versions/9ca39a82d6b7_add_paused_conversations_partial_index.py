@@ -0,0 +1,33 @@
+"""add paused conversations partial index
+
+Revision ID: 9ca39a82d6b7
+Revises: c543344b38b7
+Create Date: 2026-10-15 10:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from app.db.migration_helpers import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9ca39a82d6b7"
+down_revision: Union[str, Sequence[str], None] = "c543344b38b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Only paused rows are indexed, so the index stays tiny and cheap to maintain.
+    create_index_concurrently(
+        "ix_conversations_paused",
+        "conversations",
+        ["tenant_id", sa.text("ai_paused_at DESC")],
+        postgresql_where=sa.text("ai_paused"),
+    )
+
+
+def downgrade() -> None:
+    drop_index_concurrently("ix_conversations_paused", "conversations")
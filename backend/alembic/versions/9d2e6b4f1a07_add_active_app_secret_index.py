@@ -0,0 +1,32 @@
+"""add active app secret index
+
+Revision ID: 9d2e6b4f1a07
+Revises: 3c9d41e7b2a8
+Create Date: 2026-10-15 16:30:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from app.db.migration_helpers import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9d2e6b4f1a07"
+down_revision: Union[str, Sequence[str], None] = "3c9d41e7b2a8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    create_index_concurrently(
+        "ix_tenant_channel_accounts_active_app_secret",
+        "tenant_channel_accounts",
+        ["app_secret"],
+        postgresql_where=sa.text("is_active AND app_secret IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    drop_index_concurrently("ix_tenant_channel_accounts_active_app_secret", "tenant_channel_accounts")
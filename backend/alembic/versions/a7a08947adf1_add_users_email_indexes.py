@@ -0,0 +1,43 @@
+"""add users email indexes
+
+Revision ID: a7a08947adf1
+Revises: b198098f3260
+Create Date: 2026-10-15 14:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.migration_helpers import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7a08947adf1"
+down_revision: Union[str, Sequence[str], None] = "b198098f3260"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # All write paths lowercase emails; normalize any legacy rows so the plain unique
+    # index is case-insensitive in practice.
+    op.execute("UPDATE users SET email = lower(email) WHERE email <> lower(email)")
+
+    if not op.get_context().as_sql:
+        duplicates = op.get_bind().execute(
+            sa.text("SELECT count(*) FROM (SELECT 1 FROM users GROUP BY tenant_id, email HAVING count(*) > 1) d")
+        ).scalar()
+        if duplicates:
+            raise RuntimeError(
+                f"{duplicates} (tenant_id, email) pairs have more than one user; merge them before upgrading"
+            )
+
+    create_index_concurrently("uq_users_tenant_email", "users", ["tenant_id", "email"], unique=True)
+    create_index_concurrently("ix_users_email", "users", ["email"])
+
+
+def downgrade() -> None:
+    drop_index_concurrently("ix_users_email", "users")
+    drop_index_concurrently("uq_users_tenant_email", "users")
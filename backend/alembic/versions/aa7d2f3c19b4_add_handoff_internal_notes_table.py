@@ -10,6 +10,8 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 
+from app.db.migration_helpers import create_index_concurrently, drop_index_concurrently
+
 
 # revision identifiers, used by Alembic.
 revision: str = "aa7d2f3c19b4"
@@ -30,19 +32,19 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(["handoff_id"], ["handoff_requests.id"], ondelete="CASCADE"),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index(
+    create_index_concurrently(
         op.f("ix_handoff_internal_notes_author_user_id"),
         "handoff_internal_notes",
         ["author_user_id"],
         unique=False,
     )
-    op.create_index(
+    create_index_concurrently(
         op.f("ix_handoff_internal_notes_handoff_id"),
         "handoff_internal_notes",
         ["handoff_id"],
         unique=False,
     )
-    op.create_index(
+    create_index_concurrently(
         op.f("ix_handoff_internal_notes_tenant_id"),
         "handoff_internal_notes",
         ["tenant_id"],
@@ -51,8 +53,8 @@ def upgrade() -> None:
 
 
 def downgrade() -> None:
-    op.drop_index(op.f("ix_handoff_internal_notes_tenant_id"), table_name="handoff_internal_notes")
-    op.drop_index(op.f("ix_handoff_internal_notes_handoff_id"), table_name="handoff_internal_notes")
-    op.drop_index(op.f("ix_handoff_internal_notes_author_user_id"), table_name="handoff_internal_notes")
+    drop_index_concurrently(op.f("ix_handoff_internal_notes_tenant_id"), "handoff_internal_notes")
+    drop_index_concurrently(op.f("ix_handoff_internal_notes_handoff_id"), "handoff_internal_notes")
+    drop_index_concurrently(op.f("ix_handoff_internal_notes_author_user_id"), "handoff_internal_notes")
     op.drop_table("handoff_internal_notes")
 
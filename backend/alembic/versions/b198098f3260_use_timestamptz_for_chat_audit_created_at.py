@@ -0,0 +1,41 @@
+"""use timestamptz for chat audit created_at
+
+Revision ID: b198098f3260
+Revises: 640f134a8ce9
+Create Date: 2026-10-15 13:30:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.db.migration_helpers import is_postgresql, set_lock_timeout
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b198098f3260"
+down_revision: Union[str, Sequence[str], None] = "640f134a8ce9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _alter_created_at(target_type: str) -> None:
+    # With the session in UTC, timestamp <-> timestamptz is binary coercible (PG 12+):
+    # no USING clause, so neither the table nor its indexes are rewritten.
+    set_lock_timeout()
+    op.execute("SET LOCAL TIME ZONE 'UTC'")
+    op.execute(f"ALTER TABLE chat_audit_logs ALTER COLUMN created_at TYPE {target_type}")
+
+
+def upgrade() -> None:
+    if not is_postgresql():
+        return
+
+    _alter_created_at("timestamptz")
+
+
+def downgrade() -> None:
+    if not is_postgresql():
+        return
+
+    _alter_created_at("timestamp")
@@ -10,6 +10,8 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 
+from app.db.migration_helpers import backfill_in_batches
+
 
 # revision identifiers, used by Alembic.
 revision: str = 'b3175dbe9bfc'
@@ -23,9 +25,9 @@ def upgrade() -> None:
     op.add_column("documents", sa.Column("visibility", sa.String(length=32), nullable=True))
     op.add_column("documents", sa.Column("tags", sa.JSON(), nullable=True))
 
-    # Backfill existing rows before enforcing NOT NULL constraints.
-    op.execute("UPDATE documents SET visibility = 'public' WHERE visibility IS NULL")
-    op.execute("UPDATE documents SET tags = '[]'::json WHERE tags IS NULL")
+    # Backfill existing rows in batches before enforcing NOT NULL constraints.
+    backfill_in_batches("documents", "visibility = 'public'", "visibility IS NULL")
+    backfill_in_batches("documents", "tags = '[]'::json", "tags IS NULL")
 
     op.alter_column("documents", "visibility", nullable=False)
     op.alter_column("documents", "tags", nullable=False)
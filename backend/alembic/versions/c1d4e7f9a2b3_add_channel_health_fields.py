@@ -10,6 +10,8 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 
+from app.db.migration_helpers import is_postgresql
+
 
 # revision identifiers, used by Alembic.
 revision: str = "c1d4e7f9a2b3"
@@ -19,15 +21,36 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    op.add_column("tenant_channel_accounts", sa.Column("last_webhook_at", sa.DateTime(), nullable=True))
-    op.add_column("tenant_channel_accounts", sa.Column("last_outbound_at", sa.DateTime(), nullable=True))
-    op.add_column("tenant_channel_accounts", sa.Column("last_error", sa.Text(), nullable=True))
-    op.add_column("tenant_channel_accounts", sa.Column("last_error_at", sa.DateTime(), nullable=True))
+    if is_postgresql():
+        op.execute(
+            "ALTER TABLE tenant_channel_accounts "
+            "ADD COLUMN last_webhook_at TIMESTAMP WITHOUT TIME ZONE, "
+            "ADD COLUMN last_outbound_at TIMESTAMP WITHOUT TIME ZONE, "
+            "ADD COLUMN last_error TEXT, "
+            "ADD COLUMN last_error_at TIMESTAMP WITHOUT TIME ZONE"
+        )
+        return
+
+    with op.batch_alter_table("tenant_channel_accounts") as batch_op:
+        batch_op.add_column(sa.Column("last_webhook_at", sa.DateTime(), nullable=True))
+        batch_op.add_column(sa.Column("last_outbound_at", sa.DateTime(), nullable=True))
+        batch_op.add_column(sa.Column("last_error", sa.Text(), nullable=True))
+        batch_op.add_column(sa.Column("last_error_at", sa.DateTime(), nullable=True))
 
 
 def downgrade() -> None:
-    op.drop_column("tenant_channel_accounts", "last_error_at")
-    op.drop_column("tenant_channel_accounts", "last_error")
-    op.drop_column("tenant_channel_accounts", "last_outbound_at")
-    op.drop_column("tenant_channel_accounts", "last_webhook_at")
-
+    if is_postgresql():
+        op.execute(
+            "ALTER TABLE tenant_channel_accounts "
+            "DROP COLUMN last_error_at, "
+            "DROP COLUMN last_error, "
+            "DROP COLUMN last_outbound_at, "
+            "DROP COLUMN last_webhook_at"
+        )
+        return
+
+    with op.batch_alter_table("tenant_channel_accounts") as batch_op:
+        batch_op.drop_column("last_error_at")
+        batch_op.drop_column("last_error")
+        batch_op.drop_column("last_outbound_at")
+        batch_op.drop_column("last_webhook_at")
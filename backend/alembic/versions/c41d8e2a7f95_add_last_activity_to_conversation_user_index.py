@@ -0,0 +1,36 @@
+"""add last activity to conversation user index
+
+Revision ID: c41d8e2a7f95
+Revises: 7f2c9a4e6b31
+Create Date: 2026-10-15 19:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from app.db.migration_helpers import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c41d8e2a7f95"
+down_revision: Union[str, Sequence[str], None] = "7f2c9a4e6b31"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # get_or_create_conversation reuses the latest conversation for (tenant, user); with
+    # last_activity_at in the index that is a single index probe instead of fetch + sort.
+    # The (tenant_id, user_id) prefix still serves every lookup the old index did.
+    create_index_concurrently(
+        "ix_conversations_tenant_user_active",
+        "conversations",
+        ["tenant_id", "user_id", sa.text("last_activity_at DESC")],
+    )
+    drop_index_concurrently("ix_conversations_tenant_user", "conversations")
+
+
+def downgrade() -> None:
+    create_index_concurrently("ix_conversations_tenant_user", "conversations", ["tenant_id", "user_id"])
+    drop_index_concurrently("ix_conversations_tenant_user_active", "conversations")
@@ -10,6 +10,8 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 
+from app.db.migration_helpers import is_postgresql, set_lock_timeout
+
 
 # revision identifiers, used by Alembic.
 revision: str = "c4e8a92db117"
@@ -19,6 +21,17 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
+    set_lock_timeout()
+    if is_postgresql():
+        # Constant DEFAULT + NOT NULL in the same ADD COLUMN is metadata-only on PG11+.
+        op.execute(
+            "ALTER TABLE conversations "
+            "ADD COLUMN ai_paused BOOLEAN DEFAULT false NOT NULL, "
+            "ADD COLUMN ai_paused_at TIMESTAMP WITHOUT TIME ZONE, "
+            "ADD COLUMN ai_paused_by_user_id VARCHAR(64)"
+        )
+        return
+
     op.add_column(
         "conversations",
         sa.Column("ai_paused", sa.Boolean(), nullable=False, server_default=sa.text("false")),
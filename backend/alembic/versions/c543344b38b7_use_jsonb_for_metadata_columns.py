@@ -0,0 +1,71 @@
+"""use jsonb for metadata columns
+
+Revision ID: c543344b38b7
+Revises: 1573804a4037
+Create Date: 2026-10-15 09:30:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.db.migration_helpers import (
+    create_index_concurrently,
+    drop_index_concurrently,
+    is_postgresql,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c543344b38b7"
+down_revision: Union[str, Sequence[str], None] = "1573804a4037"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+JSON_COLUMNS = [
+    ("ops_audit_logs", "metadata_json"),
+    ("tenant_channel_accounts", "metadata_json"),
+    ("tenant_bot_credentials", "allowed_origins"),
+    ("documents", "tags"),
+]
+
+
+def upgrade() -> None:
+    if not is_postgresql():
+        return
+
+    for table_name, column_name in JSON_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table_name} "
+            f"ALTER COLUMN {column_name} TYPE jsonb USING {column_name}::jsonb"
+        )
+
+    create_index_concurrently(
+        "ix_documents_tags_gin",
+        "documents",
+        ["tags"],
+        postgresql_using="gin",
+        postgresql_ops={"tags": "jsonb_path_ops"},
+    )
+    create_index_concurrently(
+        "ix_tenant_bot_credentials_allowed_origins_gin",
+        "tenant_bot_credentials",
+        ["allowed_origins"],
+        postgresql_using="gin",
+        postgresql_ops={"allowed_origins": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    if not is_postgresql():
+        return
+
+    drop_index_concurrently("ix_tenant_bot_credentials_allowed_origins_gin", "tenant_bot_credentials")
+    drop_index_concurrently("ix_documents_tags_gin", "documents")
+
+    for table_name, column_name in reversed(JSON_COLUMNS):
+        op.execute(
+            f"ALTER TABLE {table_name} "
+            f"ALTER COLUMN {column_name} TYPE json USING {column_name}::json"
+        )
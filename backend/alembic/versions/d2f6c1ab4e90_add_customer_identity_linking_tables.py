@@ -10,6 +10,8 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 
+from app.db.migration_helpers import create_index_concurrently, drop_index_concurrently
+
 
 # revision identifiers, used by Alembic.
 revision: str = "d2f6c1ab4e90"
@@ -28,7 +30,7 @@ def upgrade() -> None:
         sa.Column("updated_at", sa.DateTime(), nullable=False),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index(op.f("ix_customer_profiles_tenant_id"), "customer_profiles", ["tenant_id"], unique=False)
+    create_index_concurrently(op.f("ix_customer_profiles_tenant_id"), "customer_profiles", ["tenant_id"], unique=False)
 
     op.create_table(
         "customer_channel_handles",
@@ -49,19 +51,19 @@ def upgrade() -> None:
             name="uq_customer_channel_handles_tenant_channel_external",
         ),
     )
-    op.create_index(
+    create_index_concurrently(
         op.f("ix_customer_channel_handles_tenant_id"),
         "customer_channel_handles",
         ["tenant_id"],
         unique=False,
     )
-    op.create_index(
+    create_index_concurrently(
         op.f("ix_customer_channel_handles_customer_profile_id"),
         "customer_channel_handles",
         ["customer_profile_id"],
         unique=False,
     )
-    op.create_index(
+    create_index_concurrently(
         op.f("ix_customer_channel_handles_channel_type"),
         "customer_channel_handles",
         ["channel_type"],
@@ -70,10 +72,10 @@ def upgrade() -> None:
 
 
 def downgrade() -> None:
-    op.drop_index(op.f("ix_customer_channel_handles_channel_type"), table_name="customer_channel_handles")
-    op.drop_index(op.f("ix_customer_channel_handles_customer_profile_id"), table_name="customer_channel_handles")
-    op.drop_index(op.f("ix_customer_channel_handles_tenant_id"), table_name="customer_channel_handles")
+    drop_index_concurrently(op.f("ix_customer_channel_handles_channel_type"), "customer_channel_handles")
+    drop_index_concurrently(op.f("ix_customer_channel_handles_customer_profile_id"), "customer_channel_handles")
+    drop_index_concurrently(op.f("ix_customer_channel_handles_tenant_id"), "customer_channel_handles")
     op.drop_table("customer_channel_handles")
 
-    op.drop_index(op.f("ix_customer_profiles_tenant_id"), table_name="customer_profiles")
+    drop_index_concurrently(op.f("ix_customer_profiles_tenant_id"), "customer_profiles")
     op.drop_table("customer_profiles")
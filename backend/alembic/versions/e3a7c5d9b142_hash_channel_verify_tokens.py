@@ -0,0 +1,75 @@
+"""hash channel verify tokens
+
+Revision ID: e3a7c5d9b142
+Revises: 5b8e1f3c7d20
+Create Date: 2026-10-15 17:30:00.000000
+"""
+
+import hashlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.migration_helpers import (
+    create_index_concurrently,
+    drop_index_concurrently,
+    is_postgresql,
+    set_lock_timeout,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e3a7c5d9b142"
+down_revision: Union[str, Sequence[str], None] = "5b8e1f3c7d20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _backfill_hashes() -> None:
+    if is_postgresql():
+        # Channel accounts are a handful of rows per tenant: one UPDATE is enough.
+        op.execute(
+            "UPDATE tenant_channel_accounts "
+            "SET verify_token_hash = sha256(convert_to(verify_token, 'UTF8')) "
+            "WHERE verify_token_hash IS NULL"
+        )
+        return
+
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text("SELECT id, verify_token FROM tenant_channel_accounts WHERE verify_token_hash IS NULL")
+    ).all()
+    for account_id, verify_token in rows:
+        bind.execute(
+            sa.text("UPDATE tenant_channel_accounts SET verify_token_hash = :h WHERE id = :id"),
+            {"h": hashlib.sha256(verify_token.encode("utf-8")).digest(), "id": account_id},
+        )
+
+
+def upgrade() -> None:
+    op.add_column("tenant_channel_accounts", sa.Column("verify_token_hash", sa.LargeBinary(32), nullable=True))
+    _backfill_hashes()
+    if is_postgresql():
+        set_lock_timeout()
+        op.alter_column("tenant_channel_accounts", "verify_token_hash", nullable=False)
+
+    # Uniqueness moves to the digest; the plaintext token is no longer indexed.
+    create_index_concurrently(
+        "ix_tenant_channel_accounts_verify_token_hash",
+        "tenant_channel_accounts",
+        ["verify_token_hash"],
+        unique=True,
+    )
+    drop_index_concurrently("ix_tenant_channel_accounts_verify_token", "tenant_channel_accounts")
+
+
+def downgrade() -> None:
+    create_index_concurrently(
+        "ix_tenant_channel_accounts_verify_token",
+        "tenant_channel_accounts",
+        ["verify_token"],
+        unique=True,
+    )
+    drop_index_concurrently("ix_tenant_channel_accounts_verify_token_hash", "tenant_channel_accounts")
+    op.drop_column("tenant_channel_accounts", "verify_token_hash")
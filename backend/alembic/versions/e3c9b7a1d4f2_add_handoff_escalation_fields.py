@@ -10,6 +10,8 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 
+from app.db.migration_helpers import is_postgresql, set_lock_timeout
+
 
 # revision identifiers, used by Alembic.
 revision: str = "e3c9b7a1d4f2"
@@ -19,6 +21,16 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
+    set_lock_timeout()
+    if is_postgresql():
+        # Constant DEFAULT + NOT NULL in the same ADD COLUMN is metadata-only on PG11+.
+        op.execute(
+            "ALTER TABLE handoff_requests "
+            "ADD COLUMN escalation_flag BOOLEAN DEFAULT false NOT NULL, "
+            "ADD COLUMN escalated_at TIMESTAMP WITHOUT TIME ZONE"
+        )
+        return
+
     op.add_column(
         "handoff_requests",
         sa.Column("escalation_flag", sa.Boolean(), nullable=False, server_default=sa.text("false")),
@@ -0,0 +1,43 @@
+"""store bot key hash as bytea
+
+Revision ID: e62761ab2f89
+Revises: f2b2f754a624
+Create Date: 2026-10-15 11:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.db.migration_helpers import is_postgresql, set_lock_timeout
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e62761ab2f89"
+down_revision: Union[str, Sequence[str], None] = "f2b2f754a624"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if not is_postgresql():
+        return
+
+    # Raw SHA-256 digests halve the unique index and compare bytewise instead of by collation.
+    # The type change rebuilds ix_tenant_bot_credentials_key_hash with the default bytea_ops.
+    set_lock_timeout()
+    op.execute(
+        "ALTER TABLE tenant_bot_credentials "
+        "ALTER COLUMN key_hash TYPE bytea USING decode(key_hash, 'hex')"
+    )
+
+
+def downgrade() -> None:
+    if not is_postgresql():
+        return
+
+    set_lock_timeout()
+    op.execute(
+        "ALTER TABLE tenant_bot_credentials "
+        "ALTER COLUMN key_hash TYPE varchar(64) USING encode(key_hash, 'hex')"
+    )
@@ -0,0 +1,64 @@
+"""add chat audit search indexes
+
+Revision ID: e804802adc73
+Revises: 6e5caac413fd
+Create Date: 2026-10-15 12:30:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.migration_helpers import create_index_concurrently, drop_index_concurrently, is_postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e804802adc73"
+down_revision: Union[str, Sequence[str], None] = "6e5caac413fd"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    create_index_concurrently(
+        "ix_chat_audit_tenant_refused_created",
+        "chat_audit_logs",
+        ["tenant_id", "created_at"],
+        postgresql_where=sa.text("refused"),
+    )
+    create_index_concurrently(
+        "ix_chat_audit_reason",
+        "chat_audit_logs",
+        ["tenant_id", "policy_reason"],
+        postgresql_where=sa.text("policy_reason IS NOT NULL"),
+    )
+
+    if not is_postgresql():
+        return
+
+    # Trigram GIN indexes serve the ILIKE '%q%' searches on question and filename.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    create_index_concurrently(
+        "ix_chat_audit_question_trgm",
+        "chat_audit_logs",
+        ["question"],
+        postgresql_using="gin",
+        postgresql_ops={"question": "gin_trgm_ops"},
+    )
+    create_index_concurrently(
+        "ix_documents_filename_trgm",
+        "documents",
+        ["filename"],
+        postgresql_using="gin",
+        postgresql_ops={"filename": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    if is_postgresql():
+        drop_index_concurrently("ix_documents_filename_trgm", "documents")
+        drop_index_concurrently("ix_chat_audit_question_trgm", "chat_audit_logs")
+
+    drop_index_concurrently("ix_chat_audit_reason", "chat_audit_logs")
+    drop_index_concurrently("ix_chat_audit_tenant_refused_created", "chat_audit_logs")
@@ -0,0 +1,33 @@
+"""add login throttles table
+
+Revision ID: e84aa01a9f65
+Revises: ee77bcb3bb49
+Create Date: 2026-10-15 15:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e84aa01a9f65"
+down_revision: Union[str, Sequence[str], None] = "ee77bcb3bb49"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "login_throttles",
+        sa.Column("key", sa.String(length=400), nullable=False),
+        sa.Column("failure_count", sa.Integer(), nullable=False),
+        sa.Column("window_started_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("locked_until", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("key"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("login_throttles")
@@ -8,6 +8,12 @@ Create Date: 2026-02-27
 from alembic import op
 import sqlalchemy as sa
 
+from app.db.migration_helpers import (
+    create_index_concurrently,
+    drop_index_concurrently,
+    is_postgresql,
+)
+
 
 # revision identifiers, used by Alembic.
 revision = "e9f4b21c7a6d"
@@ -17,60 +23,68 @@ depends_on = None
 
 
 def upgrade() -> None:
-    op.add_column(
-        "handoff_requests",
-        sa.Column("assigned_to_user_id", sa.String(length=64), nullable=True),
-    )
-    op.add_column(
-        "handoff_requests",
-        sa.Column("priority", sa.String(length=16), nullable=False, server_default="normal"),
-    )
-    op.add_column(
-        "handoff_requests",
-        sa.Column("first_response_due_at", sa.DateTime(), nullable=True),
-    )
-    op.add_column(
-        "handoff_requests",
-        sa.Column("first_responded_at", sa.DateTime(), nullable=True),
-    )
-    op.add_column(
-        "handoff_requests",
-        sa.Column("resolution_due_at", sa.DateTime(), nullable=True),
-    )
-    op.add_column(
-        "handoff_requests",
-        sa.Column("closed_at", sa.DateTime(), nullable=True),
-    )
+    if is_postgresql():
+        # One ALTER TABLE so the ACCESS EXCLUSIVE lock is taken once.
+        op.execute(
+            "ALTER TABLE handoff_requests "
+            "ADD COLUMN assigned_to_user_id VARCHAR(64), "
+            "ADD COLUMN priority VARCHAR(16) NOT NULL DEFAULT 'normal', "
+            "ADD COLUMN first_response_due_at TIMESTAMP WITHOUT TIME ZONE, "
+            "ADD COLUMN first_responded_at TIMESTAMP WITHOUT TIME ZONE, "
+            "ADD COLUMN resolution_due_at TIMESTAMP WITHOUT TIME ZONE, "
+            "ADD COLUMN closed_at TIMESTAMP WITHOUT TIME ZONE, "
+            "ALTER COLUMN status SET DEFAULT 'new'"
+        )
+    else:
+        with op.batch_alter_table("handoff_requests") as batch_op:
+            batch_op.add_column(sa.Column("assigned_to_user_id", sa.String(length=64), nullable=True))
+            batch_op.add_column(
+                sa.Column("priority", sa.String(length=16), nullable=False, server_default="normal")
+            )
+            batch_op.add_column(sa.Column("first_response_due_at", sa.DateTime(), nullable=True))
+            batch_op.add_column(sa.Column("first_responded_at", sa.DateTime(), nullable=True))
+            batch_op.add_column(sa.Column("resolution_due_at", sa.DateTime(), nullable=True))
+            batch_op.add_column(sa.Column("closed_at", sa.DateTime(), nullable=True))
+            batch_op.alter_column(
+                "status",
+                existing_type=sa.String(length=32),
+                server_default="new",
+                existing_nullable=False,
+            )
 
-    op.create_index(
+    create_index_concurrently(
         op.f("ix_handoff_requests_assigned_to_user_id"),
         "handoff_requests",
         ["assigned_to_user_id"],
         unique=False,
     )
 
-    op.alter_column(
-        "handoff_requests",
-        "status",
-        existing_type=sa.String(length=32),
-        server_default="new",
-        existing_nullable=False,
-    )
-
 
 def downgrade() -> None:
-    op.alter_column(
-        "handoff_requests",
-        "status",
-        existing_type=sa.String(length=32),
-        server_default="open",
-        existing_nullable=False,
-    )
+    drop_index_concurrently(op.f("ix_handoff_requests_assigned_to_user_id"), "handoff_requests")
 
-    op.drop_index(op.f("ix_handoff_requests_assigned_to_user_id"), table_name="handoff_requests")
-    op.drop_column("handoff_requests", "closed_at")
-    op.drop_column("handoff_requests", "resolution_due_at")
-    op.drop_column("handoff_requests", "first_responded_at")
-    op.drop_column("handoff_requests", "first_response_due_at")
-    op.drop_column("handoff_requests", "priority")
-    op.drop_column("handoff_requests", "assigned_to_user_id")
+    if is_postgresql():
+        op.execute(
+            "ALTER TABLE handoff_requests "
+            "ALTER COLUMN status SET DEFAULT 'open', "
+            "DROP COLUMN closed_at, "
+            "DROP COLUMN resolution_due_at, "
+            "DROP COLUMN first_responded_at, "
+            "DROP COLUMN first_response_due_at, "
+            "DROP COLUMN priority, "
+            "DROP COLUMN assigned_to_user_id"
+        )
+    else:
+        with op.batch_alter_table("handoff_requests") as batch_op:
+            batch_op.alter_column(
+                "status",
+                existing_type=sa.String(length=32),
+                server_default="open",
+                existing_nullable=False,
+            )
+            batch_op.drop_column("closed_at")
+            batch_op.drop_column("resolution_due_at")
+            batch_op.drop_column("first_responded_at")
+            batch_op.drop_column("first_response_due_at")
+            batch_op.drop_column("priority")
+            batch_op.drop_column("assigned_to_user_id")
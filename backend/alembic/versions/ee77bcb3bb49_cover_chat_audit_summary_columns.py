@@ -0,0 +1,51 @@
+"""cover chat audit summary columns
+
+Revision ID: ee77bcb3bb49
+Revises: a7a08947adf1
+Create Date: 2026-10-15 14:30:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.db.migration_helpers import create_index_concurrently, drop_index_concurrently, is_postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "ee77bcb3bb49"
+down_revision: Union[str, Sequence[str], None] = "a7a08947adf1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INCLUDE_COLUMNS = ["refused", "latency_ms", "user_id", "model"]
+
+
+def _rebuild_chat_audit_index(**kw) -> None:
+    # Build under a temporary name first so listings never lose their index.
+    create_index_concurrently(
+        "ix_chat_audit_tenant_created_at_tmp",
+        "chat_audit_logs",
+        ["tenant_id", "created_at", "id"],
+        **kw,
+    )
+    drop_index_concurrently("ix_chat_audit_tenant_created_at", "chat_audit_logs")
+    op.execute("ALTER INDEX ix_chat_audit_tenant_created_at_tmp RENAME TO ix_chat_audit_tenant_created_at")
+
+
+def upgrade() -> None:
+    if not is_postgresql():
+        return
+
+    # The audit summary (count, refused sum, avg latency over the window) becomes an
+    # index-only scan. The key stays (tenant_id, created_at, id): backward scans serve
+    # DESC ordering and the keyset cursor needs id.
+    _rebuild_chat_audit_index(postgresql_include=INCLUDE_COLUMNS)
+
+
+def downgrade() -> None:
+    if not is_postgresql():
+        return
+
+    _rebuild_chat_audit_index()
@@ -8,6 +8,8 @@ Create Date: 2026-02-24
 from alembic import op
 import sqlalchemy as sa
 
+from app.db.migration_helpers import create_index_concurrently, drop_index_concurrently
+
 
 # revision identifiers, used by Alembic.
 revision = "f0a1c9b6e2d4"
@@ -30,11 +32,11 @@ def upgrade() -> None:
         sa.Column("last_used_at", sa.DateTime(), nullable=True),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index(op.f("ix_tenant_bot_credentials_key_hash"), "tenant_bot_credentials", ["key_hash"], unique=True)
-    op.create_index(op.f("ix_tenant_bot_credentials_tenant_id"), "tenant_bot_credentials", ["tenant_id"], unique=False)
+    create_index_concurrently(op.f("ix_tenant_bot_credentials_key_hash"), "tenant_bot_credentials", ["key_hash"], unique=True)
+    create_index_concurrently(op.f("ix_tenant_bot_credentials_tenant_id"), "tenant_bot_credentials", ["tenant_id"], unique=False)
 
 
 def downgrade() -> None:
-    op.drop_index(op.f("ix_tenant_bot_credentials_tenant_id"), table_name="tenant_bot_credentials")
-    op.drop_index(op.f("ix_tenant_bot_credentials_key_hash"), table_name="tenant_bot_credentials")
+    drop_index_concurrently(op.f("ix_tenant_bot_credentials_tenant_id"), "tenant_bot_credentials")
+    drop_index_concurrently(op.f("ix_tenant_bot_credentials_key_hash"), "tenant_bot_credentials")
     op.drop_table("tenant_bot_credentials")
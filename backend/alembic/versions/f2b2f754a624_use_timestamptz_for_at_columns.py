@@ -0,0 +1,95 @@
+"""use timestamptz for at columns
+
+Revision ID: f2b2f754a624
+Revises: 9ca39a82d6b7
+Create Date: 2026-10-15 10:30:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.db.migration_helpers import (
+    create_index_concurrently,
+    drop_index_concurrently,
+    is_postgresql,
+    set_lock_timeout,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f2b2f754a624"
+down_revision: Union[str, Sequence[str], None] = "9ca39a82d6b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TIMESTAMP_COLUMNS = {
+    "handoff_requests": [
+        "first_response_due_at",
+        "first_responded_at",
+        "resolution_due_at",
+        "closed_at",
+        "escalated_at",
+        "created_at",
+        "updated_at",
+        "resolved_at",
+    ],
+    "handoff_internal_notes": ["created_at"],
+    "ops_audit_logs": ["created_at"],
+    "tenant_usage_events": ["created_at"],
+    "tenant_usage_limits": ["updated_at"],
+    "tenant_channel_accounts": [
+        "created_at",
+        "updated_at",
+        "last_used_at",
+        "last_webhook_at",
+        "last_outbound_at",
+        "last_error_at",
+    ],
+    "customer_profiles": ["created_at", "updated_at"],
+    "customer_channel_handles": ["created_at", "updated_at", "last_seen_at"],
+}
+
+
+def _alter_column_types(target_type: str) -> None:
+    # One ALTER per table so each table is rewritten once, not once per column.
+    set_lock_timeout()
+    for table_name, columns in TIMESTAMP_COLUMNS.items():
+        clauses = ", ".join(
+            f"ALTER COLUMN {column} TYPE {target_type} USING {column} AT TIME ZONE 'UTC'"
+            for column in columns
+        )
+        op.execute(f"ALTER TABLE {table_name} {clauses}")
+
+
+def upgrade() -> None:
+    if not is_postgresql():
+        return
+
+    _alter_column_types("timestamptz")
+
+    # Covering index so audit listings are served by an index-only scan.
+    create_index_concurrently(
+        "ix_ops_audit_tenant_created_at_v2",
+        "ops_audit_logs",
+        ["tenant_id", "created_at"],
+        postgresql_include=["action_type", "actor_user_id"],
+    )
+    drop_index_concurrently("ix_ops_audit_tenant_created_at", "ops_audit_logs")
+    op.execute("ALTER INDEX ix_ops_audit_tenant_created_at_v2 RENAME TO ix_ops_audit_tenant_created_at")
+
+
+def downgrade() -> None:
+    if not is_postgresql():
+        return
+
+    create_index_concurrently(
+        "ix_ops_audit_tenant_created_at_v1",
+        "ops_audit_logs",
+        ["tenant_id", "created_at"],
+    )
+    drop_index_concurrently("ix_ops_audit_tenant_created_at", "ops_audit_logs")
+    op.execute("ALTER INDEX ix_ops_audit_tenant_created_at_v1 RENAME TO ix_ops_audit_tenant_created_at")
+
+    _alter_column_types("timestamp")
@@ -1,39 +1,72 @@
-from fastapi import HTTPException
+from fastapi import Depends, HTTPException
 
+from app.auth.deps import get_current_user
 from app.auth.models import User
 
 
-ROLE_SCOPES: dict[str, set[str]] = {
-    "admin": {
-        "docs:read",
-        "docs:write",
-        "docs:delete",
-        "policy:read",
-        "policy:write",
-        "audit:read",
-        "audit:write",
-        "conversations:read",
-        "handoff:read",
-        "handoff:write",
-        "channels:read",
-        "channels:write",
-    },
-    "auditor": {"audit:read", "conversations:read", "handoff:read", "channels:read"},
-    "support": {
-        "docs:read",
-        "conversations:read",
-        "audit:read",
-        "audit:write",
-        "handoff:read",
-        "handoff:write",
-        "channels:read",
-    },
-    "user": set(),
+ROLE_SCOPES: dict[str, frozenset[str]] = {
+    "admin": frozenset(
+        {
+            "docs:read",
+            "docs:write",
+            "docs:delete",
+            "policy:read",
+            "policy:write",
+            "audit:read",
+            "audit:write",
+            "conversations:read",
+            "handoff:read",
+            "handoff:write",
+            "channels:read",
+            "channels:write",
+        }
+    ),
+    "auditor": frozenset({"audit:read", "conversations:read", "handoff:read", "channels:read"}),
+    "support": frozenset(
+        {
+            "docs:read",
+            "conversations:read",
+            "audit:read",
+            "audit:write",
+            "handoff:read",
+            "handoff:write",
+            "channels:read",
+        }
+    ),
+    "user": frozenset(),
+}
+
+# Each scope gets one bit; a role's scopes collapse into one int so the check is a single AND.
+_SCOPE_BIT: dict[str, int] = {
+    scope: 1 << i
+    for i, scope in enumerate(sorted({s for scopes in ROLE_SCOPES.values() for s in scopes}))
+}
+_ROLE_MASK: dict[str, int] = {
+    role: sum(_SCOPE_BIT[s] for s in scopes) for role, scopes in ROLE_SCOPES.items()
+}
+
+_MISSING_SCOPE_DETAIL: dict[str, str] = {
+    scope: f"Missing required scope: {scope}" for scope in _SCOPE_BIT
 }
 
 
 def require_scope(user: User, scope: str) -> None:
-    role = (user.role or "user").lower()
-    allowed = ROLE_SCOPES.get(role, set())
-    if scope not in allowed:
-        raise HTTPException(status_code=403, detail=f"Missing required scope: {scope}")
+    role = user.role or "user"
+    if not role.islower():
+        role = role.lower()
+    if not _ROLE_MASK.get(role, 0) & _SCOPE_BIT.get(scope, 0):
+        detail = _MISSING_SCOPE_DETAIL.get(scope) or f"Missing required scope: {scope}"
+        raise HTTPException(status_code=403, detail=detail)
+
+
+def scoped_user(scope: str):
+    """
+    Dependency factory: resolves the current user and enforces `scope`. Bind the result
+    once at module level so FastAPI's per-request dependency cache can reuse it.
+    """
+
+    def checker(user: User = Depends(get_current_user)) -> User:
+        require_scope(user, scope)
+        return user
+
+    return checker
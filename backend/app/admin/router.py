@@ -1,11 +1,12 @@
 import csv
 import io
 import secrets
+import time
 from datetime import datetime, timedelta, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from fastapi.responses import StreamingResponse
-from sqlalchemy import delete, desc, func, select
+from sqlalchemy import case, delete, desc, func, select, update
 from sqlalchemy.orm import Session
 
 from app.admin.rbac import require_scope
@@ -25,6 +26,7 @@ from app.admin.schemas import (
     OpsAuditLogCreateRequest,
     OpsAuditLogEntryOut,
     RetentionConfig,
+    RetentionPurgeJobOut,
     RetentionResponse,
     UsageLimitConfig,
     UsageLimitResponse,
@@ -34,16 +36,38 @@ from app.auth.deps import get_current_user
 from app.auth.models import User
 from app.auth.models import AuthSecurityEvent
 from app.audit.models import ChatAuditLog
-from app.audit.models import OpsAuditLog
+from app.audit.models import OpsAuditLog, RetentionPurgeJob
+from app.audit.retention import run_purge_job
 from app.chat.memory_models import Conversation, Message
+from app.db.ids import time_ordered_id
+from app.db.pagination import keyset_predicate, split_page
 from app.db.session import get_db
-from app.governance.extract_policy import extract_policy_from_text
+from app.governance.extract_policy import extract_policy_cached, load_document_text
 from app.governance.models import TenantPolicy
+from app.governance.policy_cache import get_tenant_policy, invalidate_tenant_policy
 from app.rag.models import Chunk, Document
 from app.system.usage_service import get_or_create_tenant_limit, usage_summary
 
 router = APIRouter()
 
+REFUSED_REASONS_TTL_SECONDS = 60
+
+_refused_reasons_cache: dict[tuple, tuple[float, list[dict]]] = {}
+
+
+def _cached_refused_reasons(key: tuple) -> list[dict] | None:
+    hit = _refused_reasons_cache.get(key)
+    if hit and hit[0] > time.monotonic():
+        return hit[1]
+    return None
+
+
+def _store_refused_reasons(key: tuple, reasons: list[dict]) -> None:
+    now = time.monotonic()
+    for stale in [k for k, (expires, _) in _refused_reasons_cache.items() if expires <= now]:
+        _refused_reasons_cache.pop(stale, None)
+    _refused_reasons_cache[key] = (now + REFUSED_REASONS_TTL_SECONDS, reasons)
+
 
 def _to_ops_audit_out(row: OpsAuditLog) -> dict:
     return {
@@ -76,34 +100,43 @@ def list_documents(
     q: str | None = Query(default=None, min_length=1, max_length=200),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0, le=100_000),
+    cursor: str | None = Query(default=None, max_length=512),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     require_scope(current_user, "docs:read")
 
-    stmt = select(Document).where(Document.tenant_id == current_user.tenant_id)
+    chunk_count = (
+        select(func.count(Chunk.id))
+        .where(Chunk.document_id == Document.id, Chunk.tenant_id == Document.tenant_id)
+        .correlate(Document)
+        .scalar_subquery()
+        .label("chunk_count")
+    )
+    # Plain column rows: the response is a projection, so skip ORM instance construction.
+    stmt = select(
+        Document.id,
+        Document.filename,
+        Document.visibility,
+        Document.tags,
+        Document.created_at,
+        chunk_count,
+    ).where(Document.tenant_id == current_user.tenant_id)
 
     if q:
         stmt = stmt.where(Document.filename.ilike(f"%{q}%"))
 
-    docs = db.execute(
-        stmt.order_by(Document.created_at.desc()).limit(limit).offset(offset)
-    ).scalars().all()
+    if cursor:
+        stmt = stmt.where(keyset_predicate(Document.created_at, Document.id, cursor))
+    else:
+        stmt = stmt.offset(offset)
 
-    doc_ids = [d.id for d in docs]
-
-    chunk_counts: dict[str, int] = {}
-    if doc_ids:
-        chunk_counts = dict(
-            db.execute(
-                select(Chunk.document_id, func.count(Chunk.id))
-                .where(
-                    Chunk.tenant_id == current_user.tenant_id,
-                    Chunk.document_id.in_(doc_ids),
-                )
-                .group_by(Chunk.document_id)
-            ).all()
-        )
+    rows, page_cursor = split_page(
+        db.execute(
+            stmt.order_by(Document.created_at.desc(), Document.id.desc()).limit(limit + 1)
+        ).all(),
+        limit,
+    )
 
     return {
         "tenant_id": current_user.tenant_id,
@@ -114,10 +147,11 @@ def list_documents(
                 "visibility": d.visibility,
                 "tags": d.tags or [],
                 "created_at": d.created_at,
-                "chunk_count": int(chunk_counts.get(d.id, 0)),
+                "chunk_count": int(d.chunk_count or 0),
             }
-            for d in docs
+            for d in rows
         ],
+        "next_cursor": page_cursor,
     }
 
 
@@ -130,33 +164,46 @@ def update_document(
 ):
     require_scope(current_user, "docs:write")
 
-    doc = db.execute(
-        select(Document).where(
-            Document.id == document_id,
-            Document.tenant_id == current_user.tenant_id,
-        )
-    ).scalar_one_or_none()
-    if not doc:
-        raise HTTPException(status_code=404, detail="Document not found for tenant")
-
     if payload.visibility is None and payload.tags is None:
         raise HTTPException(status_code=422, detail="Provide at least one field: visibility or tags")
 
+    values: dict = {}
     if payload.visibility is not None:
-        doc.visibility = payload.visibility
+        values["visibility"] = payload.visibility
     if payload.tags is not None:
-        doc.tags = payload.tags
-
-    db.add(doc)
-    db.commit()
-    db.refresh(doc)
+        values["tags"] = payload.tags
 
-    chunk_count = db.execute(
-        select(func.count(Chunk.id)).where(
-            Chunk.document_id == doc.id,
+    # Tenant ownership is enforced by the WHERE clause; no row back means not found.
+    chunk_count = (
+        select(func.count(Chunk.id))
+        .where(
+            Chunk.document_id == document_id,
             Chunk.tenant_id == current_user.tenant_id,
         )
-    ).scalar_one()
+        .scalar_subquery()
+    )
+    doc = db.execute(
+        update(Document)
+        .where(
+            Document.id == document_id,
+            Document.tenant_id == current_user.tenant_id,
+        )
+        .values(**values)
+        .returning(
+            Document.id,
+            Document.filename,
+            Document.visibility,
+            Document.tags,
+            Document.created_at,
+            chunk_count.label("chunk_count"),
+        )
+        .execution_options(synchronize_session=False)
+    ).one_or_none()
+    if not doc:
+        db.rollback()
+        raise HTTPException(status_code=404, detail="Document not found for tenant")
+
+    db.commit()
 
     return {
         "id": doc.id,
@@ -164,7 +211,7 @@ def update_document(
         "visibility": doc.visibility,
         "tags": doc.tags or [],
         "created_at": doc.created_at,
-        "chunk_count": int(chunk_count or 0),
+        "chunk_count": int(doc.chunk_count or 0),
     }
 
 
@@ -176,22 +223,25 @@ def delete_document(
 ):
     require_scope(current_user, "docs:delete")
 
-    doc = db.execute(
-        select(Document).where(
-            Document.id == document_id,
-            Document.tenant_id == current_user.tenant_id,
-        )
-    ).scalar_one_or_none()
-    if not doc:
-        raise HTTPException(status_code=404, detail="Document not found for tenant")
-
     db.execute(
         delete(Chunk).where(
             Chunk.document_id == document_id,
             Chunk.tenant_id == current_user.tenant_id,
         )
     )
-    db.delete(doc)
+    deleted_id = db.execute(
+        delete(Document)
+        .where(
+            Document.id == document_id,
+            Document.tenant_id == current_user.tenant_id,
+        )
+        .returning(Document.id)
+        .execution_options(synchronize_session=False)
+    ).scalar_one_or_none()
+    if not deleted_id:
+        db.rollback()
+        raise HTTPException(status_code=404, detail="Document not found for tenant")
+
     db.commit()
 
     return {"deleted": True, "document_id": document_id}
@@ -204,13 +254,11 @@ def get_policy(
 ):
     require_scope(current_user, "policy:read")
 
-    row = db.execute(
-        select(TenantPolicy).where(TenantPolicy.tenant_id == current_user.tenant_id)
-    ).scalar_one_or_none()
+    policy = get_tenant_policy(db, current_user.tenant_id)
 
     return {
         "tenant_id": current_user.tenant_id,
-        "policy": row.policy_json if row else {"refusal_message": "", "rules": []},
+        "policy": policy if policy is not None else {"refusal_message": "", "rules": []},
     }
 
 
@@ -231,6 +279,7 @@ def put_policy(
     else:
         db.add(TenantPolicy(tenant_id=current_user.tenant_id, policy_json=payload.policy))
     db.commit()
+    invalidate_tenant_policy(current_user.tenant_id)
 
     return {"tenant_id": current_user.tenant_id, "policy": payload.policy}
 
@@ -252,24 +301,11 @@ def generate_policy_from_document(
     if not doc:
         raise HTTPException(status_code=404, detail="Document not found for tenant")
 
-    chunks = (
-        db.execute(
-            select(Chunk)
-            .where(
-                Chunk.document_id == document_id,
-                Chunk.tenant_id == current_user.tenant_id,
-            )
-            .order_by(Chunk.chunk_index.asc())
-        )
-        .scalars()
-        .all()
-    )
-
-    full_text = "\n".join(c.text for c in chunks)
-    if not full_text.strip():
+    full_text = load_document_text(db, tenant_id=current_user.tenant_id, document_id=document_id)
+    if not full_text:
         raise HTTPException(status_code=400, detail="Document has no chunk text to extract policy from")
 
-    policy_json = extract_policy_from_text(full_text)
+    policy_json = extract_policy_cached(full_text)
 
     existing = db.execute(
         select(TenantPolicy).where(TenantPolicy.tenant_id == current_user.tenant_id)
@@ -280,6 +316,7 @@ def generate_policy_from_document(
     else:
         db.add(TenantPolicy(tenant_id=current_user.tenant_id, policy_json=policy_json))
     db.commit()
+    invalidate_tenant_policy(current_user.tenant_id)
 
     return {"tenant_id": current_user.tenant_id, "document_id": document_id, "policy": policy_json}
 
@@ -291,11 +328,7 @@ def get_retention(
 ):
     require_scope(current_user, "policy:read")
 
-    row = db.execute(
-        select(TenantPolicy).where(TenantPolicy.tenant_id == current_user.tenant_id)
-    ).scalar_one_or_none()
-
-    policy = row.policy_json if row and row.policy_json else {}
+    policy = get_tenant_policy(db, current_user.tenant_id) or {}
     retention = policy.get("retention") or {}
     return {
         "tenant_id": current_user.tenant_id,
@@ -331,58 +364,82 @@ def put_retention(
         db.add(TenantPolicy(tenant_id=current_user.tenant_id, policy_json=policy))
 
     db.commit()
+    invalidate_tenant_policy(current_user.tenant_id)
 
     return {"tenant_id": current_user.tenant_id, "retention": policy["retention"]}
 
 
-@router.post("/retention/purge")
+def _to_purge_job_out(job: RetentionPurgeJob) -> dict:
+    return {
+        "job_id": job.id,
+        "tenant_id": job.tenant_id,
+        "status": job.status,
+        "audit_deleted": int(job.audit_deleted or 0),
+        "messages_deleted": int(job.messages_deleted or 0),
+        "audit_cutoff": job.audit_cutoff,
+        "messages_cutoff": job.messages_cutoff,
+        "error": job.error,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+    }
+
+
+@router.post("/retention/purge", response_model=RetentionPurgeJobOut, status_code=202)
 def purge_retention(
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
+    """
+    Queue a retention purge. Deletes run in batches after the response is sent;
+    poll GET /retention/purge/{job_id} for progress.
+    """
     require_scope(current_user, "policy:write")
 
-    row = db.execute(
-        select(TenantPolicy).where(TenantPolicy.tenant_id == current_user.tenant_id)
-    ).scalar_one_or_none()
-    policy = row.policy_json if row and row.policy_json else {}
+    policy = get_tenant_policy(db, current_user.tenant_id) or {}
     retention = policy.get("retention") or {}
 
     audit_days = int(retention.get("audit_days", 90))
     messages_days = int(retention.get("messages_days", 30))
 
-    audit_cutoff = datetime.now(timezone.utc) - timedelta(days=audit_days)
-    msg_cutoff = datetime.now(timezone.utc) - timedelta(days=messages_days)
-
-    audit_deleted = db.execute(
-        delete(ChatAuditLog).where(
-            ChatAuditLog.tenant_id == current_user.tenant_id,
-            ChatAuditLog.created_at < audit_cutoff,
-        )
-    ).rowcount or 0
+    now = datetime.now(timezone.utc)
+    job = RetentionPurgeJob(
+        id=f"rpj_{secrets.token_hex(10)}",
+        tenant_id=current_user.tenant_id,
+        requested_by_user_id=current_user.id,
+        status="queued",
+        audit_cutoff=now - timedelta(days=audit_days),
+        messages_cutoff=now - timedelta(days=messages_days),
+        audit_deleted=0,
+        messages_deleted=0,
+        created_at=now,
+    )
+    out = _to_purge_job_out(job)
+    db.add(job)
+    db.commit()
 
-    conv_ids = db.execute(
-        select(Conversation.id).where(Conversation.tenant_id == current_user.tenant_id)
-    ).scalars().all()
+    background_tasks.add_task(run_purge_job, out["job_id"])
+    return out
 
-    msg_deleted = 0
-    if conv_ids:
-        msg_deleted = db.execute(
-            delete(Message).where(
-                Message.conversation_id.in_(conv_ids),
-                Message.created_at < msg_cutoff,
-            )
-        ).rowcount or 0
 
-    db.commit()
+@router.get("/retention/purge/{job_id}", response_model=RetentionPurgeJobOut)
+def get_purge_job(
+    job_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    require_scope(current_user, "policy:read")
 
-    return {
-        "tenant_id": current_user.tenant_id,
-        "audit_deleted": int(audit_deleted),
-        "messages_deleted": int(msg_deleted),
-        "audit_cutoff": audit_cutoff.isoformat(),
-        "messages_cutoff": msg_cutoff.isoformat(),
-    }
+    job = db.execute(
+        select(RetentionPurgeJob).where(
+            RetentionPurgeJob.id == job_id,
+            RetentionPurgeJob.tenant_id == current_user.tenant_id,
+        )
+    ).scalar_one_or_none()
+    if not job:
+        raise HTTPException(status_code=404, detail="Purge job not found for tenant")
+    return _to_purge_job_out(job)
 
 
 @router.get("/conversations", response_model=ConversationsListResponse)
@@ -390,30 +447,43 @@ def list_conversations(
     user_id: str | None = Query(default=None, min_length=1, max_length=128),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0, le=100_000),
+    cursor: str | None = Query(default=None, max_length=512),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     require_scope(current_user, "conversations:read")
 
-    stmt = select(Conversation).where(Conversation.tenant_id == current_user.tenant_id)
+    message_count = (
+        select(func.count(Message.id))
+        .where(Message.conversation_id == Conversation.id)
+        .correlate(Conversation)
+        .scalar_subquery()
+        .label("message_count")
+    )
+    stmt = select(
+        Conversation.id,
+        Conversation.user_id,
+        Conversation.created_at,
+        Conversation.last_activity_at,
+        message_count,
+    ).where(Conversation.tenant_id == current_user.tenant_id)
 
     if user_id:
         stmt = stmt.where(Conversation.user_id == user_id)
 
-    convs = db.execute(
-        stmt.order_by(Conversation.last_activity_at.desc()).limit(limit).offset(offset)
-    ).scalars().all()
-    conv_ids = [c.id for c in convs]
-
-    msg_counts: dict[str, int] = {}
-    if conv_ids:
-        msg_counts = dict(
-            db.execute(
-                select(Message.conversation_id, func.count(Message.id))
-                .where(Message.conversation_id.in_(conv_ids))
-                .group_by(Message.conversation_id)
-            ).all()
-        )
+    if cursor:
+        stmt = stmt.where(keyset_predicate(Conversation.last_activity_at, Conversation.id, cursor))
+    else:
+        stmt = stmt.offset(offset)
+
+    rows, page_cursor = split_page(
+        db.execute(
+            stmt.order_by(Conversation.last_activity_at.desc(), Conversation.id.desc())
+            .limit(limit + 1)
+        ).all(),
+        limit,
+        ts_attr="last_activity_at",
+    )
 
     return {
         "tenant_id": current_user.tenant_id,
@@ -423,10 +493,11 @@ def list_conversations(
                 "user_id": c.user_id,
                 "created_at": c.created_at,
                 "last_activity_at": c.last_activity_at,
-                "message_count": int(msg_counts.get(c.id, 0)),
+                "message_count": int(c.message_count or 0),
             }
-            for c in convs
+            for c in rows
         ],
+        "next_cursor": page_cursor,
     }
 
 
@@ -435,35 +506,39 @@ def list_conversation_messages(
     conversation_id: str,
     limit: int = Query(default=200, ge=1, le=500),
     offset: int = Query(default=0, ge=0, le=100_000),
+    cursor: str | None = Query(default=None, max_length=512),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     require_scope(current_user, "conversations:read")
 
-    conv = db.execute(
-        select(Conversation).where(
+    conv_id = db.execute(
+        select(Conversation.id).where(
             Conversation.id == conversation_id,
             Conversation.tenant_id == current_user.tenant_id,
         )
     ).scalar_one_or_none()
-    if not conv:
+    if not conv_id:
         raise HTTPException(status_code=404, detail="Conversation not found for tenant")
 
-    msgs = (
+    stmt = select(Message.id, Message.role, Message.content, Message.created_at).where(
+        Message.conversation_id == conversation_id
+    )
+    if cursor:
+        stmt = stmt.where(keyset_predicate(Message.created_at, Message.id, cursor, descending=False))
+    else:
+        stmt = stmt.offset(offset)
+
+    msgs, page_cursor = split_page(
         db.execute(
-            select(Message)
-            .where(Message.conversation_id == conversation_id)
-            .order_by(Message.created_at.asc())
-            .limit(limit)
-            .offset(offset)
-        )
-        .scalars()
-        .all()
+            stmt.order_by(Message.created_at.asc(), Message.id.asc()).limit(limit + 1)
+        ).all(),
+        limit,
     )
 
     return {
         "tenant_id": current_user.tenant_id,
-        "conversation_id": conv.id,
+        "conversation_id": conv_id,
         "messages": [
             {
                 "id": m.id,
@@ -473,6 +548,7 @@ def list_conversation_messages(
             }
             for m in msgs
         ],
+        "next_cursor": page_cursor,
     }
 
 
@@ -485,7 +561,7 @@ def create_ops_audit_log(
     require_scope(current_user, "audit:write")
 
     row = OpsAuditLog(
-        id=f"opl_{secrets.token_hex(10)}",
+        id=time_ordered_id("opl"),
         tenant_id=current_user.tenant_id,
         actor_user_id=current_user.id,
         action_type=payload.action_type.strip().lower(),
@@ -493,10 +569,12 @@ def create_ops_audit_log(
         metadata_json=payload.metadata_json or {},
         created_at=datetime.now(timezone.utc),
     )
+    # Every column is set client-side: serialize before commit expires the instance,
+    # so the write costs one INSERT and no reload SELECT.
+    out = _to_ops_audit_out(row)
     db.add(row)
     db.commit()
-    db.refresh(row)
-    return _to_ops_audit_out(row)
+    return out
 
 
 @router.get("/ops/audit", response_model=OpsAuditListResponse)
@@ -505,26 +583,44 @@ def list_ops_audit_logs(
     since_hours: int = Query(default=168, ge=1, le=24 * 90),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0, le=100_000),
+    cursor: str | None = Query(default=None, max_length=512),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     require_scope(current_user, "audit:read")
 
     since = datetime.now(timezone.utc) - timedelta(hours=since_hours)
-    stmt = select(OpsAuditLog).where(
+    stmt = select(
+        OpsAuditLog.id,
+        OpsAuditLog.tenant_id,
+        OpsAuditLog.actor_user_id,
+        OpsAuditLog.action_type,
+        OpsAuditLog.reason,
+        OpsAuditLog.metadata_json,
+        OpsAuditLog.created_at,
+    ).where(
         OpsAuditLog.tenant_id == current_user.tenant_id,
         OpsAuditLog.created_at >= since,
     )
     if action_type:
         stmt = stmt.where(OpsAuditLog.action_type == action_type.strip().lower())
 
-    rows = db.execute(
-        stmt.order_by(desc(OpsAuditLog.created_at)).limit(limit).offset(offset)
-    ).scalars().all()
+    if cursor:
+        stmt = stmt.where(keyset_predicate(OpsAuditLog.created_at, OpsAuditLog.id, cursor))
+    else:
+        stmt = stmt.offset(offset)
+
+    rows, page_cursor = split_page(
+        db.execute(
+            stmt.order_by(desc(OpsAuditLog.created_at), desc(OpsAuditLog.id)).limit(limit + 1)
+        ).all(),
+        limit,
+    )
     return {
         "tenant_id": current_user.tenant_id,
         "count": len(rows),
         "entries": [_to_ops_audit_out(r) for r in rows],
+        "next_cursor": page_cursor,
     }
 
 
@@ -560,64 +656,104 @@ def list_auth_security_events(
     }
 
 
+def _chat_audit_filter(*, tenant_id: str, since_hours: int, refused_only: bool, q: str | None) -> list:
+    since = datetime.now(timezone.utc) - timedelta(hours=since_hours)
+    base_filter = [
+        ChatAuditLog.tenant_id == tenant_id,
+        ChatAuditLog.created_at >= since,
+    ]
+    if refused_only:
+        base_filter.append(ChatAuditLog.refused == True)  # noqa: E712
+    if q:
+        # ILIKE '%q%' on Postgres, served by ix_chat_audit_question_trgm; q is at least
+        # 3 chars so it always yields a trigram. Wildcards in q are matched literally.
+        base_filter.append(ChatAuditLog.question.icontains(q, autoescape=True))
+    return base_filter
+
+
 @router.get("/audit", response_model=AuditListResponse)
 def list_audit_logs(
     since_hours: int = Query(default=24, ge=1, le=720),
     refused_only: bool = Query(default=False),
-    q: str | None = Query(default=None, min_length=1, max_length=200),
+    q: str | None = Query(default=None, min_length=3, max_length=200),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0, le=100_000),
+    cursor: str | None = Query(default=None, max_length=512),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     require_scope(current_user, "audit:read")
 
-    since = datetime.now(timezone.utc) - timedelta(hours=since_hours)
-
-    base_filter = [
-        ChatAuditLog.tenant_id == current_user.tenant_id,
-        ChatAuditLog.created_at >= since,
-    ]
-    if refused_only:
-        base_filter.append(ChatAuditLog.refused == True)  # noqa: E712
-    if q:
-        base_filter.append(ChatAuditLog.question.ilike(f"%{q}%"))
-
-    total = db.execute(
-        select(func.count()).select_from(ChatAuditLog).where(*base_filter)
-    ).scalar_one()
+    base_filter = _chat_audit_filter(
+        tenant_id=current_user.tenant_id,
+        since_hours=since_hours,
+        refused_only=refused_only,
+        q=q,
+    )
 
-    refused = db.execute(
-        select(func.count())
+    # One pass over the window for all summary figures.
+    total, refused, avg_latency = db.execute(
+        select(
+            func.count(),
+            func.sum(case((ChatAuditLog.refused == True, 1), else_=0)),  # noqa: E712
+            func.avg(ChatAuditLog.latency_ms),
+        )
         .select_from(ChatAuditLog)
-        .where(*base_filter, ChatAuditLog.refused == True)  # noqa: E712
-    ).scalar_one()
-
-    avg_latency = db.execute(
-        select(func.avg(ChatAuditLog.latency_ms)).where(*base_filter)
-    ).scalar_one()
+        .where(*base_filter)
+    ).one()
 
     # Top refused reasons across the full window (not just current page)
-    reason_rows = db.execute(
-        select(ChatAuditLog.policy_reason, func.count(ChatAuditLog.id))
-        .where(*base_filter, ChatAuditLog.policy_reason.isnot(None))
-        .group_by(ChatAuditLog.policy_reason)
-        .order_by(desc(func.count(ChatAuditLog.id)))
-        .limit(10)
-    ).all()
-
-    top_refused_reasons = [
-        {"reason": reason, "count": int(count)}
-        for reason, count in reason_rows
-    ]
+    reasons_key = (current_user.tenant_id, since_hours, refused_only, q)
+    top_refused_reasons = _cached_refused_reasons(reasons_key)
+    if top_refused_reasons is None:
+        reason_rows = db.execute(
+            select(ChatAuditLog.policy_reason, func.count(ChatAuditLog.id))
+            .where(
+                *base_filter,
+                ChatAuditLog.refused == True,  # noqa: E712
+                ChatAuditLog.policy_reason.isnot(None),
+            )
+            .group_by(ChatAuditLog.policy_reason)
+            .order_by(desc(func.count(ChatAuditLog.id)))
+            .limit(10)
+        ).all()
+
+        top_refused_reasons = [
+            {"reason": reason, "count": int(count)}
+            for reason, count in reason_rows
+        ]
+        _store_refused_reasons(reasons_key, top_refused_reasons)
+
+    stmt = select(
+        ChatAuditLog.id,
+        ChatAuditLog.tenant_id,
+        ChatAuditLog.user_id,
+        ChatAuditLog.question,
+        ChatAuditLog.answer,
+        ChatAuditLog.retrieved_chunks,
+        ChatAuditLog.citations,
+        ChatAuditLog.refused,
+        ChatAuditLog.model,
+        ChatAuditLog.latency_ms,
+        ChatAuditLog.prompt_tokens,
+        ChatAuditLog.completion_tokens,
+        ChatAuditLog.total_tokens,
+        ChatAuditLog.policy_reason,
+        ChatAuditLog.retrieval_doc_count,
+        ChatAuditLog.retrieval_chunk_count,
+        ChatAuditLog.created_at,
+    ).where(*base_filter)
+    if cursor:
+        stmt = stmt.where(keyset_predicate(ChatAuditLog.created_at, ChatAuditLog.id, cursor))
+    else:
+        stmt = stmt.offset(offset)
 
-    rows = db.execute(
-        select(ChatAuditLog)
-        .where(*base_filter)
-        .order_by(desc(ChatAuditLog.created_at))
-        .limit(limit)
-        .offset(offset)
-    ).scalars().all()
+    rows, page_cursor = split_page(
+        db.execute(
+            stmt.order_by(desc(ChatAuditLog.created_at), desc(ChatAuditLog.id)).limit(limit + 1)
+        ).all(),
+        limit,
+    )
 
     return {
         "tenant_id": current_user.tenant_id,
@@ -652,6 +788,7 @@ def list_audit_logs(
             }
             for r in rows
         ],
+        "next_cursor": page_cursor,
     }
 
 
@@ -659,79 +796,106 @@ def list_audit_logs(
 def export_audit_csv(
     since_hours: int = Query(default=24, ge=1, le=720),
     refused_only: bool = Query(default=False),
-    q: str | None = Query(default=None, min_length=1, max_length=200),
+    q: str | None = Query(default=None, min_length=3, max_length=200),
     limit: int = Query(default=5000, ge=1, le=50000),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     require_scope(current_user, "audit:read")
 
-    since = datetime.now(timezone.utc) - timedelta(hours=since_hours)
-
-    base_filter = [
-        ChatAuditLog.tenant_id == current_user.tenant_id,
-        ChatAuditLog.created_at >= since,
-    ]
-    if refused_only:
-        base_filter.append(ChatAuditLog.refused == True)  # noqa: E712
-    if q:
-        base_filter.append(ChatAuditLog.question.ilike(f"%{q}%"))
+    base_filter = _chat_audit_filter(
+        tenant_id=current_user.tenant_id,
+        since_hours=since_hours,
+        refused_only=refused_only,
+        q=q,
+    )
 
-    rows = db.execute(
-        select(ChatAuditLog)
+    # Only the exported columns; skips hydrating the retrieved_chunks/citations JSON.
+    stmt = (
+        select(
+            ChatAuditLog.id,
+            ChatAuditLog.tenant_id,
+            ChatAuditLog.user_id,
+            ChatAuditLog.created_at,
+            ChatAuditLog.refused,
+            ChatAuditLog.policy_reason,
+            ChatAuditLog.latency_ms,
+            ChatAuditLog.model,
+            ChatAuditLog.prompt_tokens,
+            ChatAuditLog.completion_tokens,
+            ChatAuditLog.total_tokens,
+            ChatAuditLog.retrieval_doc_count,
+            ChatAuditLog.retrieval_chunk_count,
+            ChatAuditLog.question,
+            ChatAuditLog.answer,
+        )
         .where(*base_filter)
         .order_by(desc(ChatAuditLog.created_at))
         .limit(limit)
-    ).scalars().all()
-
-    buf = io.StringIO()
-    writer = csv.writer(buf)
-
-    writer.writerow(
-        [
-            "id",
-            "tenant_id",
-            "user_id",
-            "created_at",
-            "refused",
-            "policy_reason",
-            "latency_ms",
-            "model",
-            "prompt_tokens",
-            "completion_tokens",
-            "total_tokens",
-            "retrieval_doc_count",
-            "retrieval_chunk_count",
-            "question",
-            "answer",
-        ]
+        .execution_options(yield_per=1000)
     )
 
-    for r in rows:
+    def row_iter():
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+
+        def flush() -> str:
+            chunk = buf.getvalue()
+            buf.seek(0)
+            buf.truncate(0)
+            return chunk
+
         writer.writerow(
             [
-                r.id,
-                r.tenant_id,
-                r.user_id,
-                r.created_at.isoformat() if r.created_at else "",
-                r.refused,
-                r.policy_reason or "",
-                r.latency_ms if r.latency_ms is not None else "",
-                r.model or "",
-                r.prompt_tokens if r.prompt_tokens is not None else "",
-                r.completion_tokens if r.completion_tokens is not None else "",
-                r.total_tokens if r.total_tokens is not None else "",
-                r.retrieval_doc_count if r.retrieval_doc_count is not None else "",
-                r.retrieval_chunk_count if r.retrieval_chunk_count is not None else "",
-                (r.question or "").replace("\n", " ").strip(),
-                (r.answer or "").replace("\n", " ").strip(),
+                "id",
+                "tenant_id",
+                "user_id",
+                "created_at",
+                "refused",
+                "policy_reason",
+                "latency_ms",
+                "model",
+                "prompt_tokens",
+                "completion_tokens",
+                "total_tokens",
+                "retrieval_doc_count",
+                "retrieval_chunk_count",
+                "question",
+                "answer",
             ]
         )
+        yield flush()
+
+        try:
+            for partition in db.execute(stmt).partitions():
+                for r in partition:
+                    writer.writerow(
+                        [
+                            r.id,
+                            r.tenant_id,
+                            r.user_id,
+                            r.created_at.isoformat() if r.created_at else "",
+                            r.refused,
+                            r.policy_reason or "",
+                            r.latency_ms if r.latency_ms is not None else "",
+                            r.model or "",
+                            r.prompt_tokens if r.prompt_tokens is not None else "",
+                            r.completion_tokens if r.completion_tokens is not None else "",
+                            r.total_tokens if r.total_tokens is not None else "",
+                            r.retrieval_doc_count if r.retrieval_doc_count is not None else "",
+                            r.retrieval_chunk_count if r.retrieval_chunk_count is not None else "",
+                            (r.question or "").replace("\n", " ").strip(),
+                            (r.answer or "").replace("\n", " ").strip(),
+                        ]
+                    )
+                yield flush()
+        finally:
+            # The response outlives the request handler, so release the connection here.
+            db.close()
 
-    buf.seek(0)
     filename = f"audit_{current_user.tenant_id}_{since_hours}h.csv"
     return StreamingResponse(
-        iter([buf.getvalue()]),
+        row_iter(),
         media_type="text/csv",
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
@@ -21,6 +21,7 @@ class DocumentAdminOut(BaseModel):
 class DocumentsListResponse(BaseModel):
     tenant_id: str
     documents: list[DocumentAdminOut]
+    next_cursor: str | None = None
 
 
 class DocumentDeleteResponse(BaseModel):
@@ -53,6 +54,20 @@ class RetentionResponse(BaseModel):
     retention: RetentionConfig
 
 
+class RetentionPurgeJobOut(BaseModel):
+    job_id: str
+    tenant_id: str
+    status: str
+    audit_deleted: int
+    messages_deleted: int
+    audit_cutoff: datetime
+    messages_cutoff: datetime
+    error: str | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+
 class ConversationAdminOut(BaseModel):
     id: str
     user_id: str
@@ -64,6 +79,7 @@ class ConversationAdminOut(BaseModel):
 class ConversationsListResponse(BaseModel):
     tenant_id: str
     conversations: list[ConversationAdminOut]
+    next_cursor: str | None = None
 
 
 class MessageAdminOut(BaseModel):
@@ -77,6 +93,7 @@ class ConversationMessagesResponse(BaseModel):
     tenant_id: str
     conversation_id: str
     messages: list[MessageAdminOut]
+    next_cursor: str | None = None
 
 
 class AuditReasonCount(BaseModel):
@@ -118,6 +135,7 @@ class AuditListResponse(BaseModel):
     filters: dict[str, bool]
     summary: AuditSummary
     entries: list[AuditLogEntryOut]
+    next_cursor: str | None = None
 
 
 class UsageLimitConfig(BaseModel):
@@ -169,6 +187,7 @@ class OpsAuditListResponse(BaseModel):
     tenant_id: str
     count: int
     entries: list[OpsAuditLogEntryOut]
+    next_cursor: str | None = None
 
 
 class AuthSecurityEventOut(BaseModel):
@@ -1,9 +1,10 @@
-from datetime import datetime
+from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, String, Text, Boolean, JSON, Index, Integer
+from sqlalchemy import CheckConstraint, DateTime, String, Text, Boolean, JSON, Index, Integer
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
+from app.db.types import JSONVariant
 
 
 class ChatAuditLog(Base):
@@ -33,10 +34,36 @@ class ChatAuditLog(Base):
     retrieval_doc_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
     retrieval_chunk_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
-
-
-Index("ix_chat_audit_tenant_created_at", ChatAuditLog.tenant_id, ChatAuditLog.created_at)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc)
+    )
+
+
+Index(
+    "ix_chat_audit_tenant_created_at",
+    ChatAuditLog.tenant_id,
+    ChatAuditLog.created_at,
+    ChatAuditLog.id,
+    postgresql_include=["refused", "latency_ms", "user_id", "model"],
+)
+Index(
+    "ix_chat_audit_tenant_refused_created",
+    ChatAuditLog.tenant_id,
+    ChatAuditLog.created_at,
+    postgresql_where=ChatAuditLog.refused,
+)
+Index(
+    "ix_chat_audit_reason",
+    ChatAuditLog.tenant_id,
+    ChatAuditLog.policy_reason,
+    postgresql_where=ChatAuditLog.policy_reason.isnot(None),
+)
+Index(
+    "ix_chat_audit_question_trgm",
+    ChatAuditLog.question,
+    postgresql_using="gin",
+    postgresql_ops={"question": "gin_trgm_ops"},
+)
 
 
 class OpsAuditLog(Base):
@@ -47,8 +74,42 @@ class OpsAuditLog(Base):
     actor_user_id: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
     action_type: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
     reason: Mapped[str] = mapped_column(String(500), nullable=False)
-    metadata_json: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
-
-
-Index("ix_ops_audit_tenant_created_at", OpsAuditLog.tenant_id, OpsAuditLog.created_at)
+    metadata_json: Mapped[dict] = mapped_column(JSONVariant, nullable=False, default=dict)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc)
+    )
+
+
+Index(
+    "ix_ops_audit_tenant_created_at",
+    OpsAuditLog.tenant_id,
+    OpsAuditLog.created_at,
+    postgresql_include=["action_type", "actor_user_id"],
+)
+
+
+class RetentionPurgeJob(Base):
+    __tablename__ = "retention_purge_jobs"
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('queued', 'running', 'succeeded', 'failed')",
+            name="ck_retention_purge_jobs_status",
+        ),
+    )
+
+    id: Mapped[str] = mapped_column(String(64), primary_key=True)  # e.g. rpj_abc123
+    tenant_id: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
+    requested_by_user_id: Mapped[str] = mapped_column(String(64), nullable=False)
+    status: Mapped[str] = mapped_column(String(16), nullable=False, default="queued")
+
+    audit_cutoff: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    messages_cutoff: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    audit_deleted: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    messages_deleted: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    error: Mapped[str | None] = mapped_column(String(500), nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc)
+    )
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -0,0 +1,88 @@
+import logging
+from datetime import datetime, timezone
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
+
+from app.audit.models import ChatAuditLog, RetentionPurgeJob
+from app.chat.memory_models import Conversation, Message
+from app.db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+PURGE_BATCH_SIZE = 10_000
+
+
+def _delete_in_batches(db: Session, job_id: str, model, id_filter, counter) -> None:
+    """
+    DELETE ... WHERE id IN (SELECT id ... LIMIT n), one commit per batch, so row locks are
+    held for a single batch and other writers interleave. Progress lands on the job row.
+    """
+    while True:
+        batch_ids = select(model.id).where(*id_filter).limit(PURGE_BATCH_SIZE)
+        deleted = db.execute(
+            delete(model)
+            .where(model.id.in_(batch_ids))
+            .execution_options(synchronize_session=False)
+        ).rowcount or 0
+        if deleted:
+            db.execute(
+                update(RetentionPurgeJob)
+                .where(RetentionPurgeJob.id == job_id)
+                .values({counter: counter + deleted})
+            )
+        db.commit()
+        if deleted < PURGE_BATCH_SIZE:
+            return
+
+
+def run_purge_job(job_id: str) -> None:
+    """
+    Background entry point: runs on its own session, after the enqueueing request returned.
+    """
+    db = SessionLocal()
+    try:
+        job = db.get(RetentionPurgeJob, job_id)
+        if job is None or job.status != "queued":
+            return
+        tenant_id = job.tenant_id
+        audit_cutoff = job.audit_cutoff
+        messages_cutoff = job.messages_cutoff
+        job.status = "running"
+        job.started_at = datetime.now(timezone.utc)
+        db.commit()
+
+        _delete_in_batches(
+            db,
+            job_id,
+            ChatAuditLog,
+            [ChatAuditLog.tenant_id == tenant_id, ChatAuditLog.created_at < audit_cutoff],
+            RetentionPurgeJob.audit_deleted,
+        )
+        # Subquery keeps the tenant's conversation ids inside the database (semi-join on PG).
+        tenant_conv_ids = select(Conversation.id).where(Conversation.tenant_id == tenant_id)
+        _delete_in_batches(
+            db,
+            job_id,
+            Message,
+            [Message.conversation_id.in_(tenant_conv_ids), Message.created_at < messages_cutoff],
+            RetentionPurgeJob.messages_deleted,
+        )
+
+        db.execute(
+            update(RetentionPurgeJob)
+            .where(RetentionPurgeJob.id == job_id)
+            .values(status="succeeded", finished_at=datetime.now(timezone.utc))
+        )
+        db.commit()
+    except Exception as exc:
+        db.rollback()
+        logger.exception("Retention purge job failed job_id=%s", job_id)
+        db.execute(
+            update(RetentionPurgeJob)
+            .where(RetentionPurgeJob.id == job_id)
+            .values(status="failed", error=str(exc)[:500], finished_at=datetime.now(timezone.utc))
+        )
+        db.commit()
+    finally:
+        db.close()
@@ -1,7 +1,11 @@
-import secrets
+from datetime import datetime, timezone
+
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.audit.models import ChatAuditLog
+from app.audit.writer import enqueue_chat_audit
+from app.db.ids import time_ordered_id
 
 
 def write_chat_audit_log(
@@ -22,23 +26,27 @@ def write_chat_audit_log(
     retrieval_doc_count: int | None = None,
     retrieval_chunk_count: int | None = None,
 ) -> None:
-    log = ChatAuditLog(
-        id=f"al_{secrets.token_hex(12)}",
-        tenant_id=tenant_id,
-        user_id=user_id,
-        question=question,
-        answer=answer,
-        retrieved_chunks=retrieved_chunks,
-        citations=citations,
-        refused=refused,
-        model=model,
-        prompt_tokens=prompt_tokens,
-        completion_tokens=completion_tokens,
-        total_tokens=total_tokens,
-        latency_ms=latency_ms,
-        policy_reason=policy_reason,
-        retrieval_doc_count=retrieval_doc_count,
-        retrieval_chunk_count=retrieval_chunk_count,
-    )
-    db.add(log)
+    row = {
+        "id": time_ordered_id("al"),
+        "tenant_id": tenant_id,
+        "user_id": user_id,
+        "question": question,
+        "answer": answer,
+        "retrieved_chunks": retrieved_chunks,
+        "citations": citations,
+        "refused": refused,
+        "model": model,
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": total_tokens,
+        "latency_ms": latency_ms,
+        "policy_reason": policy_reason,
+        "retrieval_doc_count": retrieval_doc_count,
+        "retrieval_chunk_count": retrieval_chunk_count,
+        "created_at": datetime.now(timezone.utc),
+    }
+    # Batched off the request path; fall back to an inline write if the writer can't take it.
+    if enqueue_chat_audit(row):
+        return
+    db.execute(insert(ChatAuditLog).values(**row))
     db.commit()
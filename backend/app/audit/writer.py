@@ -0,0 +1,108 @@
+import logging
+import queue
+import threading
+import time
+
+from sqlalchemy import insert
+
+from app.audit.models import ChatAuditLog
+from app.db.session import engine
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 100
+FLUSH_INTERVAL_SECONDS = 0.2
+QUEUE_MAX = 10_000
+FLUSH_ATTEMPTS = 3
+RETRY_BACKOFF_SECONDS = 0.5
+
+_queue: queue.Queue[dict] = queue.Queue(maxsize=QUEUE_MAX)
+_stop = threading.Event()
+_thread: threading.Thread | None = None
+
+
+def enqueue_chat_audit(row: dict) -> bool:
+    """
+    Hand a fully-populated chat_audit_logs row to the background writer.
+    Returns False when the writer is not running or is backed up; the caller then
+    writes synchronously so no audit row is dropped.
+    """
+    if _thread is None or not _thread.is_alive() or _stop.is_set():
+        return False
+    try:
+        _queue.put_nowait(row)
+    except queue.Full:
+        return False
+    return True
+
+
+def _insert(rows: list[dict]) -> None:
+    # One multi-row executemany per batch instead of a commit per chat turn.
+    with engine.begin() as conn:
+        conn.execute(insert(ChatAuditLog), rows)
+
+
+def _flush(rows: list[dict]) -> None:
+    # Ride out brief DB outages before giving up on the batch.
+    for attempt in range(FLUSH_ATTEMPTS):
+        try:
+            _insert(rows)
+            return
+        except Exception:
+            if attempt == FLUSH_ATTEMPTS - 1:
+                logger.exception("Chat audit writer failed to insert %s rows; retrying row by row", len(rows))
+            else:
+                time.sleep(RETRY_BACKOFF_SECONDS * 2**attempt)
+
+    # The batch keeps failing: isolate the bad rows so the rest still land.
+    for row in rows:
+        try:
+            _insert([row])
+        except Exception:
+            logger.exception("Chat audit writer dropped row id=%s", row.get("id"))
+
+
+def _drain_batch(first: dict) -> list[dict]:
+    batch = [first]
+    deadline = time.monotonic() + FLUSH_INTERVAL_SECONDS
+    while len(batch) < BATCH_SIZE:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            batch.append(_queue.get(timeout=remaining))
+        except queue.Empty:
+            break
+    return batch
+
+
+def _run() -> None:
+    while not (_stop.is_set() and _queue.empty()):
+        try:
+            first = _queue.get(timeout=FLUSH_INTERVAL_SECONDS)
+        except queue.Empty:
+            continue
+        _flush(_drain_batch(first))
+
+
+def start_audit_writer() -> None:
+    global _thread
+    if _thread is not None and _thread.is_alive():
+        return
+    _stop.clear()
+    _thread = threading.Thread(target=_run, name="chat-audit-writer", daemon=True)
+    _thread.start()
+
+
+def stop_audit_writer(timeout: float = 10.0) -> None:
+    """
+    Stop accepting rows and flush everything already queued.
+    """
+    global _thread
+    if _thread is None:
+        return
+    _stop.set()
+    _thread.join(timeout)
+    if _thread.is_alive():
+        logger.error("Chat audit writer did not drain within %ss; %s rows pending", timeout, _queue.qsize())
+    _thread = None
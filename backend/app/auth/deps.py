@@ -5,6 +5,8 @@ from sqlalchemy.orm import Session
 from app.db.session import get_db
 from app.auth.models import User
 from app.auth.security import decode_token
+from app.auth.token_cache import get_cached_claims, store_cached_claims, token_cache_key
+from app.auth.user_cache import get_user_snapshot
 
 bearer = HTTPBearer(auto_error=False)
 
@@ -18,30 +20,43 @@ def get_current_user(
     if not creds:
         raise HTTPException(status_code=401, detail="Missing token")
 
-    try:
-        payload = decode_token(creds.credentials)
-    except Exception:
-        raise HTTPException(status_code=401, detail="Invalid token")
-
-    token_type = payload.get("typ")
-    if token_type and token_type != "access":
-        raise HTTPException(status_code=401, detail="Invalid token type")
-
-    user_id = payload.get("sub")
-    tenant_id = payload.get("tenant_id")
-    if not user_id or not tenant_id:
-        raise HTTPException(status_code=401, detail="Invalid token payload")
-
-    user = db.get(User, user_id)
+    # Repeat requests with the same bearer token skip JWT verification.
+    cache_key = token_cache_key(creds.credentials)
+    claims = get_cached_claims(cache_key)
+    if claims is not None:
+        user_id, tenant_id = claims
+    else:
+        try:
+            payload = decode_token(creds.credentials)
+        except Exception:
+            raise HTTPException(status_code=401, detail="Invalid token")
+
+        token_type = payload.get("typ")
+        if token_type and token_type != "access":
+            raise HTTPException(status_code=401, detail="Invalid token type")
+
+        user_id = payload.get("sub")
+        tenant_id = payload.get("tenant_id")
+        if not user_id or not tenant_id:
+            raise HTTPException(status_code=401, detail="Invalid token payload")
+        store_cached_claims(cache_key, user_id, tenant_id, payload.get("exp"))
+
+    # The user row is still checked on every request (from the user cache), so
+    # invalidate_user() takes effect for cached tokens immediately.
+    user = get_user_snapshot(db, user_id)
     if not user or user.tenant_id != tenant_id:
         raise HTTPException(status_code=401, detail="User not found")
 
-    return user
+    return user.to_user()
 
 
 def require_role(min_role: str):
+    # Resolve the hierarchy once per route; the per-request check is a set lookup.
+    threshold = ROLE_ORDER.get(min_role, 999)
+    allowed = frozenset(role for role, order in ROLE_ORDER.items() if order >= threshold)
+
     def _dep(user: User = Depends(get_current_user)) -> User:
-        if ROLE_ORDER.get(user.role, 0) < ROLE_ORDER.get(min_role, 999):
+        if user.role not in allowed:
             raise HTTPException(status_code=403, detail="Insufficient role")
         return user
 
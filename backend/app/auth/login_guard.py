@@ -1,49 +1,83 @@
-from collections import defaultdict, deque
+import random
 from datetime import datetime, timedelta, timezone
 
+from sqlalchemy import case, delete, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.auth.models import LoginThrottle
+
 MAX_FAILURES = 3
 WINDOW_SECONDS = 15 * 60
 LOCK_SECONDS = 15 * 60
+# Fraction of failures that also sweep expired keys, so junk keys can't accumulate.
+PRUNE_PROBABILITY = 0.01
 
-_failures = defaultdict(deque)
-_locked_until: dict[str, datetime] = {}
+# State lives in login_throttles so the lockout holds across workers and restarts.
 
 
-def _prune(key: str, now: datetime) -> None:
-    q = _failures[key]
-    cutoff = now - timedelta(seconds=WINDOW_SECONDS)
-    while q and q[0] < cutoff:
-        q.popleft()
+def _as_utc(value: datetime | None) -> datetime | None:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
 
 
-def is_locked(key: str) -> datetime | None:
-    now = datetime.now(timezone.utc)
-    locked_until = _locked_until.get(key)
-    if not locked_until:
-        return None
-    if locked_until <= now:
-        _locked_until.pop(key, None)
+def is_locked(db: Session, key: str) -> datetime | None:
+    locked_until = _as_utc(
+        db.execute(select(LoginThrottle.locked_until).where(LoginThrottle.key == key)).scalar_one_or_none()
+    )
+    if not locked_until or locked_until <= datetime.now(timezone.utc):
         return None
     return locked_until
 
 
-def register_failure(key: str) -> datetime | None:
+def register_failure(db: Session, key: str) -> datetime | None:
+    """
+    Count a failure with one atomic upsert and commit it. Returns the lock expiry when
+    this failure tripped the lock.
+    """
     now = datetime.now(timezone.utc)
-    _prune(key, now)
-
-    q = _failures[key]
-    q.append(now)
+    cutoff = now - timedelta(seconds=WINDOW_SECONDS)
+    lock_until = now + timedelta(seconds=LOCK_SECONDS)
 
-    if len(q) >= MAX_FAILURES:
-        locked_until = now + timedelta(seconds=LOCK_SECONDS)
-        _locked_until[key] = locked_until
-        q.clear()
-        return locked_until
+    insert = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+    stmt = insert(LoginThrottle).values(
+        key=key,
+        failure_count=1,
+        window_started_at=now,
+        locked_until=None,
+    )
+    window_expired = LoginThrottle.window_started_at < cutoff
+    new_count = case((window_expired, 1), else_=LoginThrottle.failure_count + 1)
+    trips = new_count >= MAX_FAILURES
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[LoginThrottle.key],
+        set_={
+            # Tripping the lock restarts the count, as the window did before.
+            "failure_count": case((trips, 0), else_=new_count),
+            "window_started_at": case((window_expired, now), else_=LoginThrottle.window_started_at),
+            "locked_until": case((trips, lock_until), else_=LoginThrottle.locked_until),
+        },
+    ).returning(LoginThrottle.failure_count)
+    failure_count = db.execute(stmt).scalar_one()
 
-    return None
+    if random.random() < PRUNE_PROBABILITY:
+        db.execute(
+            delete(LoginThrottle).where(
+                LoginThrottle.window_started_at < cutoff,
+                or_(LoginThrottle.locked_until.is_(None), LoginThrottle.locked_until < now),
+            )
+        )
+    db.commit()
 
+    return lock_until if failure_count == 0 else None
 
-def clear_failures(key: str) -> None:
-    _failures.pop(key, None)
-    _locked_until.pop(key, None)
 
+def clear_failures(db: Session, key: str) -> None:
+    """
+    Drop the key's state; written with the caller's next commit.
+    """
+    db.execute(delete(LoginThrottle).where(LoginThrottle.key == key))
@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import JSON, DateTime, Index, String, Text
+from sqlalchemy import JSON, DateTime, Index, Integer, LargeBinary, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -8,10 +8,17 @@ from app.db.base import Base
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # Emails are lowercased on every write path, so a plain column index enforces
+        # case-insensitive uniqueness per tenant and serves the login lookup.
+        Index("uq_users_tenant_email", "tenant_id", "email", unique=True),
+        # Login without a tenant hint and password reset look users up by email alone.
+        Index("ix_users_email", "email"),
+    )
 
     id: Mapped[str] = mapped_column(String(64), primary_key=True)          # e.g. u_admin1
     tenant_id: Mapped[str] = mapped_column(String(64), nullable=False)     # e.g. t_acme2
-    email: Mapped[str] = mapped_column(String(255), nullable=False)        # unique per tenant (enforce later)
+    email: Mapped[str] = mapped_column(String(255), nullable=False)        # lowercased; unique per tenant
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     role: Mapped[str] = mapped_column(String(32), nullable=False, default="admin")
 
@@ -22,7 +29,7 @@ class RefreshToken(Base):
     id: Mapped[str] = mapped_column(String(64), primary_key=True)
     user_id: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
     tenant_id: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
-    token_hash: Mapped[str] = mapped_column(String(128), nullable=False, unique=True, index=True)
+    token_hash: Mapped[bytes] = mapped_column(LargeBinary(32), nullable=False, unique=True, index=True)  # keyed BLAKE2b (legacy rows: sha256)
     expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     revoked_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
@@ -30,6 +37,16 @@ class RefreshToken(Base):
     )
 
 
+# Active-token lookups per user (rotation limit); revoked rows drop out of the index.
+Index(
+    "ix_refresh_tokens_user_active",
+    RefreshToken.user_id,
+    RefreshToken.tenant_id,
+    RefreshToken.created_at,
+    postgresql_where=RefreshToken.revoked_at.is_(None),
+)
+
+
 class PasswordResetToken(Base):
     __tablename__ = "password_reset_tokens"
 
@@ -95,3 +112,16 @@ class UserProfilePreference(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, nullable=False, default=lambda: datetime.now(timezone.utc)
     )
+
+
+class LoginThrottle(Base):
+    """
+    Failed-login counter per "tenant:email:ip" key, shared by every worker process.
+    """
+
+    __tablename__ = "login_throttles"
+
+    key: Mapped[str] = mapped_column(String(400), primary_key=True)
+    failure_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    window_started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    locked_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -5,8 +5,10 @@ from app.auth.models import User
 
 
 def require_roles(*allowed_roles: str):
+    allowed = frozenset(allowed_roles)
+
     def checker(user: User = Depends(get_current_user)) -> User:
-        if user.role not in allowed_roles:
+        if user.role not in allowed:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Insufficient permissions",
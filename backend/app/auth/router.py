@@ -1,13 +1,18 @@
 import logging
 import secrets
 import base64
+import time
 from collections import defaultdict, deque
 from datetime import datetime, timedelta, timezone
 
 from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app.db.ids import time_ordered_id
 from app.db.session import get_db
 from app.tenants.models import Tenant
 from app.auth.login_guard import clear_failures, is_locked, register_failure
@@ -34,10 +39,18 @@ from app.auth.security import (
     create_refresh_token,
     decode_token,
     hash_password,
+    hash_refresh_token,
     hash_token,
-    verify_password,
+    refresh_token_lookup_hashes,
+    verify_and_update_password,
 )
 from app.auth.deps import get_current_user
+from app.auth.token_cache import (
+    discard_refresh_claims,
+    get_cached_refresh_claims,
+    store_cached_refresh_claims,
+)
+from app.auth.user_cache import get_user_snapshot, invalidate_user
 from app.notifications.email_service import send_transactional_email, send_welcome_email
 
 router = APIRouter()
@@ -47,8 +60,9 @@ FORGOT_WINDOW_SECONDS = 15 * 60
 FORGOT_MAX_PER_WINDOW = 3
 RESET_FAIL_WINDOW_SECONDS = 15 * 60
 RESET_FAIL_MAX = 5
-_forgot_attempts: dict[str, deque[datetime]] = defaultdict(deque)
-_reset_fail_attempts: dict[str, deque[datetime]] = defaultdict(deque)
+# Attempt timestamps are time.monotonic() floats: cheap to compare and immune to clock steps.
+_forgot_attempts: dict[str, deque[float]] = defaultdict(deque)
+_reset_fail_attempts: dict[str, deque[float]] = defaultdict(deque)
 
 
 def _send_password_reset_email(
@@ -87,28 +101,20 @@ def _password_reset_public_message() -> str:
     return "If this account exists, a reset link and code have been sent to the account email."
 
 
-def _as_utc(value: datetime | None) -> datetime | None:
-    if value is None:
-        return None
-    if value.tzinfo is None:
-        return value.replace(tzinfo=timezone.utc)
-    return value.astimezone(timezone.utc)
-
-
-def _prune_attempts(store: dict[str, deque[datetime]], key: str, now: datetime, window_seconds: int) -> None:
+def _prune_attempts(store: dict[str, deque[float]], key: str, now: float, window_seconds: int) -> None:
     q = store[key]
-    cutoff = now - timedelta(seconds=window_seconds)
+    cutoff = now - window_seconds
     while q and q[0] < cutoff:
         q.popleft()
 
 
-def _is_rate_limited(store: dict[str, deque[datetime]], key: str, now: datetime, window_seconds: int, limit: int) -> bool:
-    _prune_attempts(store, key, now, window_seconds)
+def _is_rate_limited(store: dict[str, deque[float]], key: str, window_seconds: int, limit: int) -> bool:
+    _prune_attempts(store, key, time.monotonic(), window_seconds)
     return len(store[key]) >= limit
 
 
-def _register_attempt(store: dict[str, deque[datetime]], key: str, now: datetime) -> None:
-    store[key].append(now)
+def _register_attempt(store: dict[str, deque[float]], key: str) -> None:
+    store[key].append(time.monotonic())
 
 
 def _log_auth_security_event(
@@ -136,22 +142,59 @@ def _log_auth_security_event(
     )
 
 
+def _insert_refresh_token(
+    db: Session, *, user_id: str, tenant_id: str, token: str, expires_at: datetime
+) -> None:
+    # Core INSERT: nothing reads the row back, so skip ORM object construction and
+    # unit-of-work tracking. It is sent immediately, ahead of the limit check below.
+    db.execute(
+        insert(RefreshToken).values(
+            id=time_ordered_id("rt"),
+            user_id=user_id,
+            tenant_id=tenant_id,
+            token_hash=hash_refresh_token(token),
+            expires_at=expires_at,
+            revoked_at=None,
+        )
+    )
+
+
+def _revoke_active_refresh_tokens(
+    db: Session, *, user_id: str, tenant_id: str, now: datetime
+) -> None:
+    db.execute(
+        update(RefreshToken)
+        .where(
+            RefreshToken.user_id == user_id,
+            RefreshToken.tenant_id == tenant_id,
+            RefreshToken.revoked_at.is_(None),
+        )
+        .values(revoked_at=now)
+        .execution_options(synchronize_session=False)
+    )
+
+
 def _enforce_refresh_token_limit(db: Session, *, user_id: str, tenant_id: str) -> None:
+    # Revoke everything past the newest N active tokens in one UPDATE, served by
+    # ix_refresh_tokens_user_active.
     now = datetime.now(timezone.utc)
-    active_tokens = (
-        db.query(RefreshToken)
-        .filter(
+    stale_ids = (
+        select(RefreshToken.id)
+        .where(
             RefreshToken.user_id == user_id,
             RefreshToken.tenant_id == tenant_id,
             RefreshToken.revoked_at.is_(None),
             RefreshToken.expires_at > now,
         )
         .order_by(RefreshToken.created_at.desc())
-        .all()
+        .offset(MAX_ACTIVE_REFRESH_TOKENS)
+    )
+    db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.id.in_(stale_ids))
+        .values(revoked_at=now)
+        .execution_options(synchronize_session=False)
     )
-    for stale in active_tokens[MAX_ACTIVE_REFRESH_TOKENS:]:
-        stale.revoked_at = now
-        db.add(stale)
 
 
 @router.post("/register", response_model=MeResponse)
@@ -160,17 +203,6 @@ def register(payload: RegisterRequest, db: Session = Depends(get_db)):
     if not tenant:
         raise HTTPException(status_code=404, detail="Tenant not found")
 
-    existing = (
-        db.query(User)
-        .filter(
-            User.tenant_id == payload.tenant_id,
-            User.email == str(payload.email).lower(),
-        )
-        .first()
-    )
-    if existing:
-        raise HTTPException(status_code=409, detail="User already exists")
-
     try:
         pw_hash = hash_password(payload.password)
     except ValueError as e:
@@ -179,65 +211,70 @@ def register(payload: RegisterRequest, db: Session = Depends(get_db)):
     user = User(
         id=payload.id,
         tenant_id=payload.tenant_id,
-        email=str(payload.email).lower(),
+        email=payload.email,
         password_hash=pw_hash,
         role=payload.role,
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    # Every column is client-supplied, so the response is built from the pending
+    # object; reading it after commit would reload the expired row.
+    me = MeResponse(
+        id=user.id,
+        tenant_id=user.tenant_id,
+        email=user.email,
+        role=user.role,
+    )
+    tenant_name = tenant.name or user.tenant_id
+    try:
+        db.commit()
+    except IntegrityError:
+        # uq_users_tenant_email (or the primary key) already taken.
+        db.rollback()
+        raise HTTPException(status_code=409, detail="User already exists")
+    invalidate_user(me.id)
     login_url = f"{str(settings.FRONTEND_PUBLIC_BASE_URL).rstrip('/')}/dashboard.html" if settings.FRONTEND_PUBLIC_BASE_URL else None
     reset_url = f"{str(settings.FRONTEND_PUBLIC_BASE_URL).rstrip('/')}/auth.html" if settings.FRONTEND_PUBLIC_BASE_URL else None
     try:
         sent = send_welcome_email(
-            to_email=user.email,
-            tenant_name=tenant.name or user.tenant_id,
+            to_email=me.email,
+            tenant_name=tenant_name,
             login_url=login_url,
             reset_url=reset_url,
         )
         if not sent:
-            logger.warning("Welcome email not sent for user=%s tenant=%s (provider returned false)", user.id, user.tenant_id)
+            logger.warning("Welcome email not sent for user=%s tenant=%s (provider returned false)", me.id, me.tenant_id)
     except Exception:
-        logger.exception("Failed to dispatch welcome email for user=%s tenant=%s", user.id, user.tenant_id)
+        logger.exception("Failed to dispatch welcome email for user=%s tenant=%s", me.id, me.tenant_id)
 
-    return MeResponse(
-        id=user.id,
-        tenant_id=user.tenant_id,
-        email=user.email,
-        role=user.role,
-    )
+    return me
 
 
 @router.post("/login", response_model=TokenResponse)
 def login(payload: LoginRequest, request: Request, db: Session = Depends(get_db)):
     client_ip = request.client.host if request.client else "unknown"
     tenant_hint = (payload.tenant_id or "").strip() or None
-    email = str(payload.email).lower()
+    email = payload.email
     login_key = f"{tenant_hint or '*'}:{email}:{client_ip}"
-    locked_until = is_locked(login_key)
+    locked_until = is_locked(db, login_key)
     if locked_until:
         raise HTTPException(
             status_code=429,
             detail=f"Too many failed attempts. Retry after {locked_until.isoformat()}",
         )
 
+    # Plain rows, not ORM instances: login only reads these fields, so nothing needs to
+    # enter the identity map.
+    login_columns = select(User.id, User.tenant_id, User.email, User.role, User.password_hash)
     user = None
     if tenant_hint:
-        user = (
-            db.query(User)
-            .filter(
+        user = db.execute(
+            login_columns.where(
                 User.tenant_id == tenant_hint,
                 User.email == email,
             )
-            .first()
-        )
+        ).first()
     else:
-        candidates = (
-            db.query(User)
-            .filter(User.email == email)
-            .limit(2)
-            .all()
-        )
+        candidates = db.execute(login_columns.where(User.email == email).limit(2)).all()
         if len(candidates) > 1:
             raise HTTPException(
                 status_code=409,
@@ -246,15 +283,18 @@ def login(payload: LoginRequest, request: Request, db: Session = Depends(get_db)
         if len(candidates) == 1:
             user = candidates[0]
 
+    # Locked keys were rejected above and unknown users never reach bcrypt, so the
+    # expensive hash only runs for real accounts under the failure limit.
     password_ok = False
+    new_hash = None
     if user:
         try:
-            password_ok = verify_password(payload.password, user.password_hash)
+            password_ok, new_hash = verify_and_update_password(payload.password, user.password_hash)
         except ValueError:
             password_ok = False
 
     if not user or not password_ok:
-        new_lock = register_failure(login_key)
+        new_lock = register_failure(db, login_key)
         if new_lock:
             raise HTTPException(
                 status_code=429,
@@ -262,7 +302,9 @@ def login(payload: LoginRequest, request: Request, db: Session = Depends(get_db)
             )
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
-    clear_failures(login_key)
+    clear_failures(db, login_key)
+    if new_hash:
+        db.execute(update(User).where(User.id == user.id).values(password_hash=new_hash))
 
     access_token = create_access_token(
         {"sub": user.id, "tenant_id": user.tenant_id, "role": user.role, "email": user.email}
@@ -270,107 +312,140 @@ def login(payload: LoginRequest, request: Request, db: Session = Depends(get_db)
     refresh_token, refresh_expires_at = create_refresh_token(
         {"sub": user.id, "tenant_id": user.tenant_id}
     )
-    refresh = RefreshToken(
-        id=f"rt_{secrets.token_hex(10)}",
+    _insert_refresh_token(
+        db,
         user_id=user.id,
         tenant_id=user.tenant_id,
-        token_hash=hash_token(refresh_token),
+        token=refresh_token,
         expires_at=refresh_expires_at,
-        revoked_at=None,
     )
-    db.add(refresh)
     _enforce_refresh_token_limit(db, user_id=user.id, tenant_id=user.tenant_id)
     db.commit()
 
     return TokenResponse(access_token=access_token, refresh_token=refresh_token)
 
 
-@router.post("/refresh", response_model=TokenResponse)
-def refresh(payload: RefreshRequest, db: Session = Depends(get_db)):
-    try:
-        claims = decode_token(payload.refresh_token)
-    except JWTError:
-        raise HTTPException(status_code=401, detail="Invalid refresh token")
-
-    if claims.get("typ") != "refresh":
-        raise HTTPException(status_code=401, detail="Invalid token type")
+def _refresh_rejection_reason(
+    db: Session, token_hashes: tuple[bytes, ...], *, user_id: str, tenant_id: str
+) -> str:
+    # Failure path only: tell the client why the rotation UPDATE matched nothing.
+    row = db.execute(
+        select(RefreshToken.revoked_at).where(
+            RefreshToken.token_hash.in_(token_hashes),
+            RefreshToken.user_id == user_id,
+            RefreshToken.tenant_id == tenant_id,
+        )
+    ).first()
+    if row is None:
+        return "Refresh token not recognized"
+    if row.revoked_at is not None:
+        return "Refresh token revoked"
+    return "Refresh token expired"
 
-    user_id = claims.get("sub")
-    tenant_id = claims.get("tenant_id")
-    if not user_id or not tenant_id:
-        raise HTTPException(status_code=401, detail="Invalid refresh token payload")
 
-    token_hash_value = hash_token(payload.refresh_token)
-    row = (
-        db.query(RefreshToken)
-        .filter(
-            RefreshToken.token_hash == token_hash_value,
+@router.post("/refresh", response_model=TokenResponse)
+def refresh(payload: RefreshRequest, db: Session = Depends(get_db)):
+    token_hashes = refresh_token_lookup_hashes(payload.refresh_token)
+    token_hash_value = token_hashes[0]
+    # Retries with the same token skip JWT verification; the row below is still
+    # checked for revocation.
+    cached = get_cached_refresh_claims(token_hash_value)
+    if cached is not None:
+        user_id, tenant_id = cached
+    else:
+        try:
+            claims = decode_token(payload.refresh_token)
+        except JWTError:
+            raise HTTPException(status_code=401, detail="Invalid refresh token")
+
+        if claims.get("typ") != "refresh":
+            raise HTTPException(status_code=401, detail="Invalid token type")
+
+        user_id = claims.get("sub")
+        tenant_id = claims.get("tenant_id")
+        if not user_id or not tenant_id:
+            raise HTTPException(status_code=401, detail="Invalid refresh token payload")
+        store_cached_refresh_claims(token_hash_value, user_id, tenant_id, claims.get("exp"))
+
+    # Rotate: revoke the presented token only if it is still active. One conditional
+    # UPDATE replaces the SELECT + flush, and concurrent refreshes with the same token
+    # can no longer both succeed.
+    now = datetime.now(timezone.utc)
+    rotated = db.execute(
+        update(RefreshToken)
+        .where(
+            RefreshToken.token_hash.in_(token_hashes),
             RefreshToken.user_id == user_id,
             RefreshToken.tenant_id == tenant_id,
+            RefreshToken.revoked_at.is_(None),
+            RefreshToken.expires_at > now,
+        )
+        .values(revoked_at=now)
+        .returning(RefreshToken.id)
+        .execution_options(synchronize_session=False)
+    ).first()
+    if rotated is None:
+        raise HTTPException(
+            status_code=401,
+            detail=_refresh_rejection_reason(db, token_hashes, user_id=user_id, tenant_id=tenant_id),
         )
-        .first()
-    )
-    if not row:
-        raise HTTPException(status_code=401, detail="Refresh token not recognized")
-    if row.revoked_at is not None:
-        raise HTTPException(status_code=401, detail="Refresh token revoked")
-    expires_at = _as_utc(row.expires_at)
-    if expires_at and expires_at <= datetime.now(timezone.utc):
-        raise HTTPException(status_code=401, detail="Refresh token expired")
 
-    user = db.get(User, user_id)
+    user = get_user_snapshot(db, user_id)
     if not user or user.tenant_id != tenant_id:
         raise HTTPException(status_code=401, detail="User not found")
 
-    # Rotate refresh token on every refresh.
-    row.revoked_at = datetime.now(timezone.utc)
-    db.add(row)
-
     access_token = create_access_token(
         {"sub": user.id, "tenant_id": user.tenant_id, "role": user.role, "email": user.email}
     )
     new_refresh_token, refresh_expires_at = create_refresh_token(
         {"sub": user.id, "tenant_id": user.tenant_id}
     )
-    db.add(
-        RefreshToken(
-            id=f"rt_{secrets.token_hex(10)}",
-            user_id=user.id,
-            tenant_id=user.tenant_id,
-            token_hash=hash_token(new_refresh_token),
-            expires_at=refresh_expires_at,
-            revoked_at=None,
-        )
+    _insert_refresh_token(
+        db,
+        user_id=user.id,
+        tenant_id=user.tenant_id,
+        token=new_refresh_token,
+        expires_at=refresh_expires_at,
     )
     _enforce_refresh_token_limit(db, user_id=user.id, tenant_id=user.tenant_id)
     db.commit()
+    discard_refresh_claims(token_hash_value)
+    invalidate_user(user_id)
 
     return TokenResponse(access_token=access_token, refresh_token=new_refresh_token)
 
 
 @router.post("/logout")
 def logout(payload: LogoutRequest, db: Session = Depends(get_db)):
-    try:
-        claims = decode_token(payload.refresh_token)
-    except JWTError:
-        return {"ok": True}
-
-    user_id = claims.get("sub")
-    tenant_id = claims.get("tenant_id")
-    token_hash_value = hash_token(payload.refresh_token)
-    row = (
-        db.query(RefreshToken)
-        .filter(
-            RefreshToken.token_hash == token_hash_value,
+    token_hashes = refresh_token_lookup_hashes(payload.refresh_token)
+    token_hash_value = token_hashes[0]
+    cached = get_cached_refresh_claims(token_hash_value)
+    if cached is not None:
+        user_id, tenant_id = cached
+    else:
+        try:
+            claims = decode_token(payload.refresh_token)
+        except JWTError:
+            return {"ok": True}
+
+        user_id = claims.get("sub")
+        tenant_id = claims.get("tenant_id")
+    revoked = db.execute(
+        update(RefreshToken)
+        .where(
+            RefreshToken.token_hash.in_(token_hashes),
             RefreshToken.user_id == user_id,
             RefreshToken.tenant_id == tenant_id,
+            RefreshToken.revoked_at.is_(None),
         )
-        .first()
+        .values(revoked_at=datetime.now(timezone.utc))
+        .execution_options(synchronize_session=False)
     )
-    if row and row.revoked_at is None:
-        row.revoked_at = datetime.now(timezone.utc)
-        db.add(row)
+    if revoked.rowcount:
         db.commit()
+    discard_refresh_claims(token_hash_value)
+    if user_id:
+        invalidate_user(user_id)
 
     return {"ok": True}
 
@@ -392,18 +467,9 @@ def delete_my_account(
 ):
     now = datetime.now(timezone.utc)
     # Revoke all refresh tokens for this user.
-    active = (
-        db.query(RefreshToken)
-        .filter(
-            RefreshToken.user_id == current_user.id,
-            RefreshToken.tenant_id == current_user.tenant_id,
-            RefreshToken.revoked_at.is_(None),
-        )
-        .all()
+    _revoke_active_refresh_tokens(
+        db, user_id=current_user.id, tenant_id=current_user.tenant_id, now=now
     )
-    for token in active:
-        token.revoked_at = now
-        db.add(token)
 
     # Remove user preference rows.
     (
@@ -438,6 +504,7 @@ def delete_my_account(
         db.delete(row)
 
     db.commit()
+    invalidate_user(current_user.id)
     return DeleteAccountResponse(ok=True, message="Account deleted successfully.")
 
 
@@ -517,6 +584,32 @@ def put_preferences(
     )
 
 
+def _save_profile_image(db: Session, *, user_id: str, tenant_id: str, data_url: str) -> None:
+    now = datetime.now(timezone.utc)
+    row = (
+        db.query(UserProfilePreference)
+        .filter(
+            UserProfilePreference.user_id == user_id,
+            UserProfilePreference.tenant_id == tenant_id,
+        )
+        .first()
+    )
+    if not row:
+        row = UserProfilePreference(
+            user_id=user_id,
+            tenant_id=tenant_id,
+            profile_image_data=data_url,
+            created_at=now,
+            updated_at=now,
+        )
+        db.add(row)
+    else:
+        row.profile_image_data = data_url
+        row.updated_at = now
+        db.add(row)
+    db.commit()
+
+
 @router.post("/preferences/profile-image", response_model=ProfileImageUploadResponse)
 async def upload_profile_image(
     file: UploadFile = File(...),
@@ -537,29 +630,14 @@ async def upload_profile_image(
     encoded = base64.b64encode(raw).decode("ascii")
     data_url = f"data:{content_type};base64,{encoded}"
 
-    now = datetime.now(timezone.utc)
-    row = (
-        db.query(UserProfilePreference)
-        .filter(
-            UserProfilePreference.user_id == current_user.id,
-            UserProfilePreference.tenant_id == current_user.tenant_id,
-        )
-        .first()
+    # Blocking DB round trips run on the threadpool, not the event loop.
+    await run_in_threadpool(
+        _save_profile_image,
+        db,
+        user_id=current_user.id,
+        tenant_id=current_user.tenant_id,
+        data_url=data_url,
     )
-    if not row:
-        row = UserProfilePreference(
-            user_id=current_user.id,
-            tenant_id=current_user.tenant_id,
-            profile_image_data=data_url,
-            created_at=now,
-            updated_at=now,
-        )
-        db.add(row)
-    else:
-        row.profile_image_data = data_url
-        row.updated_at = now
-        db.add(row)
-    db.commit()
     return ProfileImageUploadResponse(
         ok=True,
         user_id=current_user.id,
@@ -570,12 +648,12 @@ async def upload_profile_image(
 
 @router.post("/password/forgot", response_model=ForgotPasswordResponse)
 def forgot_password(payload: ForgotPasswordRequest, request: Request, db: Session = Depends(get_db)):
-    email = str(payload.email).lower()
+    email = payload.email
     tenant_hint = (payload.tenant_id or "").strip() or "*"
     client_ip = request.client.host if request.client else "unknown"
     now = datetime.now(timezone.utc)
     limit_key = f"{tenant_hint}:{email}:{client_ip}"
-    if _is_rate_limited(_forgot_attempts, limit_key, now, FORGOT_WINDOW_SECONDS, FORGOT_MAX_PER_WINDOW):
+    if _is_rate_limited(_forgot_attempts, limit_key, FORGOT_WINDOW_SECONDS, FORGOT_MAX_PER_WINDOW):
         _log_auth_security_event(
             db,
             tenant_id=payload.tenant_id.strip() if payload.tenant_id else None,
@@ -588,7 +666,7 @@ def forgot_password(payload: ForgotPasswordRequest, request: Request, db: Sessio
         )
         db.commit()
         return ForgotPasswordResponse(message=_password_reset_public_message())
-    _register_attempt(_forgot_attempts, limit_key, now)
+    _register_attempt(_forgot_attempts, limit_key)
 
     q = db.query(User).filter(User.email == email)
     if payload.tenant_id:
@@ -665,7 +743,7 @@ def reset_password(payload: ResetPasswordRequest, request: Request, db: Session
     token_value = str(payload.reset_token or "").strip()
     limit_identity = hash_token(token_value) if token_value else f"{tenant_hint}:{email_hint or 'unknown'}"
     limit_key = f"{limit_identity}:{client_ip}"
-    if _is_rate_limited(_reset_fail_attempts, limit_key, now, RESET_FAIL_WINDOW_SECONDS, RESET_FAIL_MAX):
+    if _is_rate_limited(_reset_fail_attempts, limit_key, RESET_FAIL_WINDOW_SECONDS, RESET_FAIL_MAX):
         _log_auth_security_event(
             db,
             tenant_id=None,
@@ -708,7 +786,7 @@ def reset_password(payload: ResetPasswordRequest, request: Request, db: Session
                 row = candidate
                 break
     if not row:
-        _register_attempt(_reset_fail_attempts, limit_key, now)
+        _register_attempt(_reset_fail_attempts, limit_key)
         _log_auth_security_event(
             db,
             tenant_id=None,
@@ -723,7 +801,7 @@ def reset_password(payload: ResetPasswordRequest, request: Request, db: Session
             raise HTTPException(status_code=400, detail="Invalid or expired reset token")
         raise HTTPException(status_code=400, detail="Invalid reset code")
     if token_value and row.code_hash != hash_token(payload.code.strip()):
-        _register_attempt(_reset_fail_attempts, limit_key, now)
+        _register_attempt(_reset_fail_attempts, limit_key)
         _log_auth_security_event(
             db,
             tenant_id=row.tenant_id,
@@ -746,23 +824,10 @@ def reset_password(payload: ResetPasswordRequest, request: Request, db: Session
         raise HTTPException(status_code=422, detail=str(e))
 
     row.used_at = now
-    db.add(user)
-    db.add(row)
-
-    active = (
-        db.query(RefreshToken)
-        .filter(
-            RefreshToken.user_id == user.id,
-            RefreshToken.tenant_id == user.tenant_id,
-            RefreshToken.revoked_at.is_(None),
-        )
-        .all()
-    )
-    for token in active:
-        token.revoked_at = now
-        db.add(token)
+    _revoke_active_refresh_tokens(db, user_id=user.id, tenant_id=user.tenant_id, now=now)
 
     db.commit()
+    invalidate_user(user.id)
     _reset_fail_attempts.pop(limit_key, None)
     _log_auth_security_event(
         db,
@@ -14,6 +14,11 @@ class RegisterRequest(BaseModel):
         description="owner | admin | editor | viewer"
     )
 
+    @field_validator("email")
+    @classmethod
+    def _lower_email(cls, value: str) -> str:
+        return value.lower()
+
     @field_validator("password")
     @classmethod
     def _validate_password(cls, value: str) -> str:
@@ -26,6 +31,11 @@ class LoginRequest(BaseModel):
     # prevent bcrypt crash on long input
     password: str = Field(min_length=1, max_length=72)
 
+    @field_validator("email")
+    @classmethod
+    def _lower_email(cls, value: str) -> str:
+        return value.lower()
+
     @field_validator("password")
     @classmethod
     def _validate_password(cls, value: str) -> str:
@@ -79,6 +89,11 @@ class ForgotPasswordRequest(BaseModel):
     tenant_id: str | None = Field(default=None, min_length=3, max_length=64)
     email: EmailStr
 
+    @field_validator("email")
+    @classmethod
+    def _lower_email(cls, value: str) -> str:
+        return value.lower()
+
 
 class ForgotPasswordResponse(BaseModel):
     ok: bool = True
@@ -1,5 +1,5 @@
 import secrets
-from hashlib import sha256
+from hashlib import blake2b, sha256
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict
 
@@ -8,7 +8,12 @@ from passlib.context import CryptContext
 
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Cost is pinned so it only changes deliberately; hashes below it are upgraded on next login.
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+)
 
 ENV = settings.ENV
 JWT_SECRET = settings.JWT_SECRET
@@ -37,6 +42,14 @@ def verify_password(password: str, password_hash: str) -> bool:
     return pwd_context.verify(password, password_hash)
 
 
+def verify_and_update_password(password: str, password_hash: str) -> tuple[bool, str | None]:
+    """
+    Verify, and return a replacement hash when the stored one uses an outdated cost.
+    """
+    _ensure_bcrypt_limit(password)
+    return pwd_context.verify_and_update(password, password_hash)
+
+
 def create_access_token(payload: Dict[str, Any]) -> str:
     to_encode = dict(payload)
     to_encode["typ"] = "access"
@@ -54,21 +67,48 @@ def create_refresh_token(payload: Dict[str, Any]) -> tuple[str, datetime]:
     return token, expires_at
 
 
+# Every token we issue carries exp and sub; reject any that don't before touching the DB.
+_DECODE_OPTIONS = {"require_exp": True, "require_sub": True}
+
+
 def decode_token(token: str) -> Dict[str, Any]:
-    return jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALG])
+    return jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALG], options=_DECODE_OPTIONS)
 
 
 def hash_token(token: str) -> str:
     return sha256(token.encode("utf-8")).hexdigest()
 
 
+# Keyed so a leaked refresh_tokens table can't be matched against tokens without JWT_SECRET.
+_REFRESH_HASH_KEY = sha256(JWT_SECRET.encode("utf-8")).digest()
+
+
+def hash_refresh_token(token: str) -> bytes:
+    # Raw 32-byte keyed BLAKE2b digest: half the width of a hex string in the index.
+    return blake2b(
+        token.encode("utf-8"), digest_size=32, key=_REFRESH_HASH_KEY, person=b"refresh-token"
+    ).digest()
+
+
+def refresh_token_lookup_hashes(token: str) -> tuple[bytes, bytes]:
+    """
+    Values a stored refresh token may have: the keyed hash, then the unkeyed sha256
+    digest written before keyed hashing. Drop the second once those rows have expired
+    (JWT_REFRESH_EXP_DAYS after rollout).
+    """
+    return hash_refresh_token(token), sha256(token.encode("utf-8")).digest()
+
+
 __all__ = [
     "JWTError",
     "create_access_token",
     "create_refresh_token",
     "decode_token",
     "hash_password",
+    "hash_refresh_token",
     "hash_token",
+    "refresh_token_lookup_hashes",
+    "verify_and_update_password",
     "verify_password",
 ]
 
@@ -0,0 +1,92 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from app.core.config import settings
+
+_MAX_ENTRIES = 10_000
+
+# Refresh tokens are single-use, so only retries within a few seconds (client loops,
+# refresh-then-logout) can hit; the DB row is still checked for revocation every time.
+REFRESH_CLAIMS_TTL_SECONDS = 5.0
+
+
+class _ClaimsCache:
+    """
+    sha256(token) -> (user_id, tenant_id) for tokens whose signature and claims were
+    verified recently. One instance per token type so a cached refresh token can never
+    satisfy an access-token check.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        # key -> (expires_at_monotonic, user_id, tenant_id)
+        self._entries: OrderedDict[bytes, tuple[float, str, str]] = OrderedDict()
+
+    def get(self, key: bytes) -> tuple[str, str] | None:
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit is None:
+                return None
+            if hit[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return hit[1], hit[2]
+
+    def store(self, key: bytes, user_id: str, tenant_id: str, ttl: float, token_exp: float | None) -> None:
+        # Never cache past the token's own exp.
+        if token_exp is not None:
+            ttl = min(ttl, token_exp - time.time())
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, user_id, tenant_id)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: bytes) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+_access = _ClaimsCache(_MAX_ENTRIES)
+_refresh = _ClaimsCache(_MAX_ENTRIES)
+
+
+def token_cache_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+def get_cached_claims(key: bytes) -> tuple[str, str] | None:
+    """
+    Return (user_id, tenant_id) for an access token verified within the last TTL.
+    """
+    if settings.AUTH_CACHE_TTL_SECONDS <= 0:
+        return None
+    return _access.get(key)
+
+
+def store_cached_claims(key: bytes, user_id: str, tenant_id: str, token_exp: float | None) -> None:
+    """
+    Remember a verified token for AUTH_CACHE_TTL_SECONDS, never past the token's own exp.
+    """
+    ttl = settings.AUTH_CACHE_TTL_SECONDS
+    if ttl <= 0:
+        return
+    _access.store(key, user_id, tenant_id, ttl, token_exp)
+
+
+def get_cached_refresh_claims(key: bytes) -> tuple[str, str] | None:
+    return _refresh.get(key)
+
+
+def store_cached_refresh_claims(key: bytes, user_id: str, tenant_id: str, token_exp: float | None) -> None:
+    _refresh.store(key, user_id, tenant_id, REFRESH_CLAIMS_TTL_SECONDS, token_exp)
+
+
+def discard_refresh_claims(key: bytes) -> None:
+    _refresh.discard(key)
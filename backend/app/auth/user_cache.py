@@ -0,0 +1,64 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.auth.models import User
+
+_MAX_ENTRIES = 5000
+
+_lock = threading.Lock()
+_versions: dict[str, int] = {}
+_entries: OrderedDict[str, tuple[int, "UserSnapshot"]] = OrderedDict()
+
+
+@dataclass(frozen=True, slots=True)
+class UserSnapshot:
+    id: str
+    tenant_id: str
+    email: str
+    role: str
+
+    def to_user(self) -> User:
+        # Fresh, session-less instance per request: concurrent requests never share ORM state.
+        return User(id=self.id, tenant_id=self.tenant_id, email=self.email, role=self.role)
+
+
+def get_user_snapshot(db: Session, user_id: str) -> UserSnapshot | None:
+    """
+    Cached auth view of a user row. Missing users are not cached.
+    """
+    with _lock:
+        version = _versions.get(user_id, 0)
+        hit = _entries.get(user_id)
+        if hit is not None and hit[0] == version:
+            _entries.move_to_end(user_id)
+            return hit[1]
+
+    row = db.execute(
+        select(User.id, User.tenant_id, User.email, User.role).where(User.id == user_id)
+    ).one_or_none()
+    if row is None:
+        return None
+    snapshot = UserSnapshot(id=row.id, tenant_id=row.tenant_id, email=row.email, role=row.role)
+
+    with _lock:
+        # Skip the store if an invalidation landed while we were reading.
+        if _versions.get(user_id, 0) == version:
+            _entries[user_id] = (version, snapshot)
+            _entries.move_to_end(user_id)
+            while len(_entries) > _MAX_ENTRIES:
+                _entries.popitem(last=False)
+
+    return snapshot
+
+
+def invalidate_user(user_id: str) -> None:
+    """
+    Call after committing a change to (or deletion of) a user row.
+    """
+    with _lock:
+        _versions[user_id] = _versions.get(user_id, 0) + 1
+        _entries.pop(user_id, None)
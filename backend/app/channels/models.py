@@ -1,13 +1,38 @@
-from datetime import datetime
-
-from sqlalchemy import Boolean, DateTime, ForeignKey, JSON, String, Text, UniqueConstraint
+from datetime import datetime, timezone
+
+from sqlalchemy import (
+    Boolean,
+    CheckConstraint,
+    DateTime,
+    ForeignKey,
+    Index,
+    LargeBinary,
+    String,
+    Text,
+    UniqueConstraint,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
+from app.db.types import JSONVariant
 
 
 class TenantChannelAccount(Base):
     __tablename__ = "tenant_channel_accounts"
+    __table_args__ = (
+        CheckConstraint(
+            "channel_type IN ('whatsapp', 'messenger', 'instagram', 'facebook')",
+            name="ck_tenant_channel_accounts_channel_type",
+        ),
+        # Webhook signature check reads the distinct secrets of active accounts; this makes
+        # it an index-only scan that skips inactive and secret-less rows.
+        Index(
+            "ix_tenant_channel_accounts_active_app_secret",
+            "app_secret",
+            postgresql_where=text("is_active AND app_secret IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String(64), primary_key=True)
     tenant_id: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
@@ -16,7 +41,9 @@ class TenantChannelAccount(Base):
     channel_type: Mapped[str] = mapped_column(String(32), nullable=False, index=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
 
-    verify_token: Mapped[str] = mapped_column(String(255), nullable=False, unique=True, index=True)
+    verify_token: Mapped[str] = mapped_column(String(255), nullable=False)
+    # sha256(verify_token); webhook verification looks accounts up by this digest.
+    verify_token_hash: Mapped[bytes] = mapped_column(LargeBinary(32), nullable=False, unique=True, index=True)
     access_token: Mapped[str] = mapped_column(Text, nullable=False)
     app_secret: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
@@ -25,16 +52,20 @@ class TenantChannelAccount(Base):
     page_id: Mapped[str | None] = mapped_column(String(128), nullable=True, index=True)
     instagram_account_id: Mapped[str | None] = mapped_column(String(128), nullable=True, index=True)
 
-    metadata_json: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+    metadata_json: Mapped[dict] = mapped_column(JSONVariant, nullable=False, default=dict)
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
-    last_used_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
-    last_webhook_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
-    last_outbound_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc)
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc)
+    )
+    last_used_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_webhook_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_outbound_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
-    last_error_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    last_error_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
 
 class CustomerProfile(Base):
@@ -44,8 +75,20 @@ class CustomerProfile(Base):
     tenant_id: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
     display_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc)
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc)
+    )
+
+
+Index(
+    "ix_customer_profiles_tenant_updated_id",
+    CustomerProfile.tenant_id,
+    CustomerProfile.updated_at,
+    CustomerProfile.id,
+)
 
 
 class CustomerChannelHandle(Base):
@@ -57,6 +100,11 @@ class CustomerChannelHandle(Base):
             "external_user_id",
             name="uq_customer_channel_handles_tenant_channel_external",
         ),
+        CheckConstraint(
+            "channel_type IN ('whatsapp', 'messenger', 'instagram', 'facebook')",
+            name="ck_customer_channel_handles_channel_type",
+        ),
+        Index("ix_customer_channel_handles_tenant_profile", "tenant_id", "customer_profile_id"),
     )
 
     id: Mapped[str] = mapped_column(String(64), primary_key=True)
@@ -71,6 +119,10 @@ class CustomerChannelHandle(Base):
     channel_type: Mapped[str] = mapped_column(String(32), nullable=False, index=True)
     external_user_id: Mapped[str] = mapped_column(String(255), nullable=False)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
-    last_seen_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc)
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc)
+    )
+    last_seen_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
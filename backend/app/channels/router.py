@@ -1,13 +1,17 @@
-import json
+import hashlib
+import itertools
+import time
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
-from fastapi.responses import PlainTextResponse
-from sqlalchemy import func, select, update
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse, Response
+from pydantic_core import from_json, to_json
+from sqlalchemy import Boolean, bindparam, delete, func, select, tuple_, type_coerce, update
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
 
-from app.admin.rbac import require_scope
-from app.auth.deps import get_current_user
+from app.admin.rbac import scoped_user
 from app.auth.models import User
 from app.channels.models import CustomerChannelHandle, CustomerProfile, TenantChannelAccount
 from app.channels.schemas import (
@@ -19,25 +23,61 @@ from app.channels.schemas import (
     CustomerProfilesResponse,
     CustomerProfileMergeRequest,
     CustomerProfileMergeResponse,
-    CustomerProfileOut,
-    CustomerChannelHandleOut,
     MetaWebhookResponse,
 )
 from app.channels.service import (
     generate_verify_token,
+    hash_verify_token,
     normalize_channel_type,
-    process_meta_webhook_payload,
+    run_meta_webhook_job,
     verify_meta_signature,
 )
+from app.channels.verify_token_cache import invalidate_verify_tokens, is_active_verify_token
 from app.chat.memory_models import Conversation
+from app.db.filters import in_ids
+from app.db.ids import time_ordered_id
+from app.db.pagination import keyset_predicate, split_page
 from app.db.session import get_db
 from app.handoff.models import HandoffRequest
 
 admin_router = APIRouter()
 webhook_router = APIRouter()
 
+_channels_read = scoped_user("channels:read")
+_channels_write = scoped_user("channels:write")
+
+# Fixed-shape statements are built once; per-call values go in as bind parameters, so
+# each call skips statement construction and reuses the memoized cache key.
+_ACCOUNT_HEALTH_BY_ID = select(
+    TenantChannelAccount.id,
+    TenantChannelAccount.tenant_id,
+    TenantChannelAccount.channel_type,
+    TenantChannelAccount.is_active,
+    TenantChannelAccount.last_webhook_at,
+    TenantChannelAccount.last_outbound_at,
+    TenantChannelAccount.last_error,
+    TenantChannelAccount.last_error_at,
+).where(
+    TenantChannelAccount.id == bindparam("account_id"),
+    TenantChannelAccount.tenant_id == bindparam("current_tenant_id"),
+)
+_ROTATE_VERIFY_TOKEN = (
+    update(TenantChannelAccount)
+    .where(
+        TenantChannelAccount.id == bindparam("account_id"),
+        TenantChannelAccount.tenant_id == bindparam("current_tenant_id"),
+    )
+    .values(
+        verify_token=bindparam("new_verify_token"),
+        verify_token_hash=bindparam("new_verify_token_hash"),
+        updated_at=bindparam("now"),
+    )
+    .returning(TenantChannelAccount.id, TenantChannelAccount.verify_token)
+    .execution_options(synchronize_session=False)
+)
 
-def _health_status(row: TenantChannelAccount) -> str:
+
+def _health_status(row) -> str:
     if not row.is_active:
         return "inactive"
     if row.last_error:
@@ -53,93 +93,124 @@ def _require_admin_or_owner(user: User) -> None:
         raise HTTPException(status_code=403, detail="Admin role required for this action")
 
 
-def _to_out(row: TenantChannelAccount) -> ChannelAccountOut:
-    return ChannelAccountOut(
-        id=row.id,
-        tenant_id=row.tenant_id,
-        channel_type=row.channel_type,
-        name=row.name,
-        verify_token=row.verify_token,
-        has_app_secret=bool(row.app_secret),
-        has_access_token=bool(row.access_token),
-        phone_number_id=row.phone_number_id,
-        page_id=row.page_id,
-        instagram_account_id=row.instagram_account_id,
-        metadata_json=row.metadata_json or {},
-        is_active=row.is_active,
-        created_at=row.created_at,
-        updated_at=row.updated_at,
-        last_used_at=row.last_used_at,
-        last_webhook_at=row.last_webhook_at,
-        last_outbound_at=row.last_outbound_at,
-        last_error=row.last_error,
-        last_error_at=row.last_error_at,
-    )
+def _account_dict(row: TenantChannelAccount) -> dict:
+    return {
+        "id": row.id,
+        "tenant_id": row.tenant_id,
+        "channel_type": row.channel_type,
+        "name": row.name,
+        "verify_token": row.verify_token,
+        "has_app_secret": bool(row.app_secret),
+        "has_access_token": bool(row.access_token),
+        "phone_number_id": row.phone_number_id,
+        "page_id": row.page_id,
+        "instagram_account_id": row.instagram_account_id,
+        "metadata_json": row.metadata_json or {},
+        "is_active": row.is_active,
+        "created_at": row.created_at,
+        "updated_at": row.updated_at,
+        "last_used_at": row.last_used_at,
+        "last_webhook_at": row.last_webhook_at,
+        "last_outbound_at": row.last_outbound_at,
+        "last_error": row.last_error,
+        "last_error_at": row.last_error_at,
+    }
 
 
-def _to_profile_out(
-    profile: CustomerProfile,
-    *,
-    handles: list[CustomerChannelHandle],
-    conversation_count: int,
-    handoff_count: int,
-) -> CustomerProfileOut:
-    return CustomerProfileOut(
-        id=profile.id,
-        tenant_id=profile.tenant_id,
-        display_name=profile.display_name,
-        created_at=profile.created_at,
-        updated_at=profile.updated_at,
-        conversation_count=int(conversation_count or 0),
-        handoff_count=int(handoff_count or 0),
-        handles=[
-            CustomerChannelHandleOut(
-                id=h.id,
-                channel_type=h.channel_type,
-                external_user_id=h.external_user_id,
-                last_seen_at=h.last_seen_at,
-                created_at=h.created_at,
-                updated_at=h.updated_at,
-            )
-            for h in handles
-        ],
-    )
+# Same keys as _account_dict, computed in SQL so the secrets themselves are never fetched.
+_ACCOUNT_OUT_COLUMNS = (
+    TenantChannelAccount.id,
+    TenantChannelAccount.tenant_id,
+    TenantChannelAccount.channel_type,
+    TenantChannelAccount.name,
+    TenantChannelAccount.verify_token,
+    type_coerce(func.coalesce(TenantChannelAccount.app_secret, "") != "", Boolean).label("has_app_secret"),
+    type_coerce(TenantChannelAccount.access_token != "", Boolean).label("has_access_token"),
+    TenantChannelAccount.phone_number_id,
+    TenantChannelAccount.page_id,
+    TenantChannelAccount.instagram_account_id,
+    TenantChannelAccount.metadata_json,
+    TenantChannelAccount.is_active,
+    TenantChannelAccount.created_at,
+    TenantChannelAccount.updated_at,
+    TenantChannelAccount.last_used_at,
+    TenantChannelAccount.last_webhook_at,
+    TenantChannelAccount.last_outbound_at,
+    TenantChannelAccount.last_error,
+    TenantChannelAccount.last_error_at,
+)
+
+
+def _json_response(data, headers: dict[str, str] | None = None) -> Response:
+    # Read and write endpoints return plain dicts built from typed ORM/Core rows, serialized
+    # by pydantic-core (datetimes included).
+    # Returning a Response skips FastAPI's re-validation against response_model, which
+    # stays declared for the OpenAPI schema.
+    return Response(content=to_json(data), media_type="application/json", headers=headers)
+
+
+def _weak_etag(*parts) -> str:
+    return f'W/"{hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=8).hexdigest()}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    # Weak comparison (RFC 9110): the W/ prefix is ignored on both sides.
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = {t.strip().removeprefix("W/") for t in header.split(",")}
+    return "*" in tags or etag.removeprefix("W/") in tags
 
 
 @admin_router.get("/accounts", response_model=list[ChannelAccountOut])
 def list_accounts(
+    request: Request,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(_channels_read),
 ):
-    require_scope(current_user, "channels:read")
+    # Every account write bumps updated_at, so (id, updated_at) pairs fingerprint the
+    # listing. Pairs rather than max()/count(): a write committed after a newer one
+    # still changes the tag. Polling clients then get a 304 without the full select.
+    fingerprint = sorted(
+        db.execute(
+            select(TenantChannelAccount.id, TenantChannelAccount.updated_at).where(
+                TenantChannelAccount.tenant_id == current_user.tenant_id
+            )
+        ).tuples()
+    )
+    # no-cache: always revalidate, so a list fetched right after an edit is never stale.
+    headers = {"ETag": _weak_etag(current_user.tenant_id, fingerprint), "Cache-Control": "private, no-cache"}
+    if _etag_matches(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
 
     rows = db.execute(
-        select(TenantChannelAccount)
+        select(*_ACCOUNT_OUT_COLUMNS)
         .where(TenantChannelAccount.tenant_id == current_user.tenant_id)
         .order_by(TenantChannelAccount.created_at.desc())
-    ).scalars().all()
-    return [_to_out(r) for r in rows]
+    ).mappings()
+    return _json_response([dict(r) for r in rows], headers)
 
 
 @admin_router.post("/accounts", response_model=ChannelAccountOut)
 def create_account(
     payload: ChannelAccountCreateRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(_channels_write),
 ):
-    require_scope(current_user, "channels:write")
-
     try:
         channel_type = normalize_channel_type(payload.channel_type)
     except ValueError as exc:
         raise HTTPException(status_code=422, detail=str(exc)) from exc
 
+    now = datetime.now(timezone.utc)
+    verify_token = payload.verify_token or generate_verify_token()
     row = TenantChannelAccount(
-        id=f"ch_{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S%f')}",
+        id=time_ordered_id("ch"),
         tenant_id=current_user.tenant_id,
         channel_type=channel_type,
         name=payload.name,
-        verify_token=(payload.verify_token or generate_verify_token()),
+        verify_token=verify_token,
+        verify_token_hash=hash_verify_token(verify_token),
         access_token=payload.access_token,
         app_secret=payload.app_secret,
         phone_number_id=payload.phone_number_id,
@@ -147,13 +218,15 @@ def create_account(
         instagram_account_id=payload.instagram_account_id,
         metadata_json=payload.metadata_json,
         is_active=True,
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc),
+        created_at=now,
+        updated_at=now,
     )
+    # Built from the values just set: no refresh round trip re-reading the secrets.
+    out = _account_dict(row)
     db.add(row)
     db.commit()
-    db.refresh(row)
-    return _to_out(row)
+    invalidate_verify_tokens()
+    return _json_response(out)
 
 
 @admin_router.patch("/accounts/{account_id}", response_model=ChannelAccountOut)
@@ -161,256 +234,301 @@ def patch_account(
     account_id: str,
     payload: ChannelAccountPatchRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(_channels_write),
 ):
-    require_scope(current_user, "channels:write")
-
+    # Fields left unset or null keep their current value.
+    changed = {k: v for k, v in payload.model_dump(exclude_unset=True).items() if v is not None}
+    # One UPDATE ... RETURNING instead of SELECT, UPDATE and a refresh.
     row = db.execute(
-        select(TenantChannelAccount).where(
+        update(TenantChannelAccount)
+        .where(
             TenantChannelAccount.id == account_id,
             TenantChannelAccount.tenant_id == current_user.tenant_id,
         )
-    ).scalar_one_or_none()
+        .values(**changed, updated_at=datetime.now(timezone.utc))
+        .returning(*_ACCOUNT_OUT_COLUMNS)
+        .execution_options(synchronize_session=False)
+    ).first()
     if not row:
         raise HTTPException(status_code=404, detail="Channel account not found")
 
-    if payload.name is not None:
-        row.name = payload.name
-    if payload.access_token is not None:
-        row.access_token = payload.access_token
-    if payload.app_secret is not None:
-        row.app_secret = payload.app_secret
-    if payload.phone_number_id is not None:
-        row.phone_number_id = payload.phone_number_id
-    if payload.page_id is not None:
-        row.page_id = payload.page_id
-    if payload.instagram_account_id is not None:
-        row.instagram_account_id = payload.instagram_account_id
-    if payload.metadata_json is not None:
-        row.metadata_json = payload.metadata_json
-    if payload.is_active is not None:
-        row.is_active = payload.is_active
-
-    row.updated_at = datetime.now(timezone.utc)
-    db.add(row)
     db.commit()
-    db.refresh(row)
-    return _to_out(row)
+    invalidate_verify_tokens()
+    return _json_response(dict(row._mapping))
 
 
 @admin_router.post("/accounts/{account_id}/rotate-verify-token", response_model=ChannelAccountRotateTokenResponse)
 def rotate_verify_token(
     account_id: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(_channels_write),
 ):
-    require_scope(current_user, "channels:write")
-
+    verify_token = generate_verify_token()
     row = db.execute(
-        select(TenantChannelAccount).where(
-            TenantChannelAccount.id == account_id,
-            TenantChannelAccount.tenant_id == current_user.tenant_id,
-        )
-    ).scalar_one_or_none()
+        _ROTATE_VERIFY_TOKEN,
+        {
+            "account_id": account_id,
+            "current_tenant_id": current_user.tenant_id,
+            "new_verify_token": verify_token,
+            "new_verify_token_hash": hash_verify_token(verify_token),
+            "now": datetime.now(timezone.utc),
+        },
+    ).first()
     if not row:
         raise HTTPException(status_code=404, detail="Channel account not found")
 
-    row.verify_token = generate_verify_token()
-    row.updated_at = datetime.now(timezone.utc)
-    db.add(row)
     db.commit()
-    db.refresh(row)
-    return ChannelAccountRotateTokenResponse(id=row.id, verify_token=row.verify_token)
+    invalidate_verify_tokens()
+    return _json_response({"id": row.id, "verify_token": row.verify_token})
 
 
 @admin_router.get("/accounts/{account_id}/health", response_model=ChannelAccountHealthOut)
 def get_account_health(
     account_id: str,
+    request: Request,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(_channels_read),
 ):
-    require_scope(current_user, "channels:read")
-
     row = db.execute(
-        select(TenantChannelAccount).where(
-            TenantChannelAccount.id == account_id,
-            TenantChannelAccount.tenant_id == current_user.tenant_id,
-        )
-    ).scalar_one_or_none()
+        _ACCOUNT_HEALTH_BY_ID, {"account_id": account_id, "current_tenant_id": current_user.tenant_id}
+    ).first()
     if not row:
         raise HTTPException(status_code=404, detail="Channel account not found")
 
-    return ChannelAccountHealthOut(
-        id=row.id,
-        tenant_id=row.tenant_id,
-        channel_type=row.channel_type,
-        is_active=row.is_active,
-        status=_health_status(row),
-        last_webhook_at=row.last_webhook_at,
-        last_outbound_at=row.last_outbound_at,
-        last_error=row.last_error,
-        last_error_at=row.last_error_at,
+    # The row is the whole response, so it is its own validator.
+    headers = {"ETag": _weak_etag(tuple(row)), "Cache-Control": "private, max-age=5, stale-if-error=60"}
+    if _etag_matches(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    return _json_response(
+        {
+            "id": row.id,
+            "tenant_id": row.tenant_id,
+            "channel_type": row.channel_type,
+            "is_active": row.is_active,
+            "status": _health_status(row),
+            "last_webhook_at": row.last_webhook_at,
+            "last_outbound_at": row.last_outbound_at,
+            "last_error": row.last_error,
+            "last_error_at": row.last_error_at,
+        },
+        headers,
     )
 
 
 @admin_router.get("/profiles", response_model=CustomerProfilesResponse)
 def list_customer_profiles(
     limit: int = Query(default=100, ge=1, le=500),
+    cursor: str | None = Query(default=None, max_length=512),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(_channels_read),
 ):
-    require_scope(current_user, "channels:read")
-
-    profiles = db.execute(
-        select(CustomerProfile)
-        .where(CustomerProfile.tenant_id == current_user.tenant_id)
-        .order_by(CustomerProfile.updated_at.desc())
-        .limit(limit)
-    ).scalars().all()
-
-    profile_ids = [p.id for p in profiles]
-    if not profile_ids:
-        return {"tenant_id": current_user.tenant_id, "profiles": []}
-
-    handles_rows = db.execute(
-        select(CustomerChannelHandle).where(
-            CustomerChannelHandle.tenant_id == current_user.tenant_id,
-            CustomerChannelHandle.customer_profile_id.in_(profile_ids),
-        )
-    ).scalars().all()
-    handles_by_profile: dict[str, list[CustomerChannelHandle]] = {}
-    for h in handles_rows:
-        handles_by_profile.setdefault(h.customer_profile_id, []).append(h)
-
-    conv_counts_rows = db.execute(
-        select(Conversation.user_id, func.count(Conversation.id))
+    # Counts ride along as correlated subqueries: PostgreSQL evaluates them only for the
+    # rows that survive ORDER BY/LIMIT, each via the user_id index.
+    conversation_count = (
+        select(func.count(Conversation.id))
         .where(
             Conversation.tenant_id == current_user.tenant_id,
-            Conversation.user_id.in_(profile_ids),
+            Conversation.user_id == CustomerProfile.id,
         )
-        .group_by(Conversation.user_id)
-    ).all()
-    conv_counts = {uid: int(cnt) for uid, cnt in conv_counts_rows}
-
-    handoff_counts_rows = db.execute(
-        select(HandoffRequest.user_id, func.count(HandoffRequest.id))
+        .scalar_subquery()
+    )
+    handoff_count = (
+        select(func.count(HandoffRequest.id))
         .where(
             HandoffRequest.tenant_id == current_user.tenant_id,
-            HandoffRequest.user_id.in_(profile_ids),
+            HandoffRequest.user_id == CustomerProfile.id,
         )
-        .group_by(HandoffRequest.user_id)
-    ).all()
-    handoff_counts = {uid: int(cnt) for uid, cnt in handoff_counts_rows}
+        .scalar_subquery()
+    )
+    stmt = select(
+        CustomerProfile.id,
+        CustomerProfile.tenant_id,
+        CustomerProfile.display_name,
+        CustomerProfile.created_at,
+        CustomerProfile.updated_at,
+        conversation_count.label("conversation_count"),
+        handoff_count.label("handoff_count"),
+    ).where(CustomerProfile.tenant_id == current_user.tenant_id)
+    if cursor:
+        stmt = stmt.where(keyset_predicate(CustomerProfile.updated_at, CustomerProfile.id, cursor))
+
+    rows, page_cursor = split_page(
+        db.execute(
+            stmt.order_by(CustomerProfile.updated_at.desc(), CustomerProfile.id.desc()).limit(limit + 1)
+        ).all(),
+        limit,
+        ts_attr="updated_at",
+    )
+    if not rows:
+        return _json_response({"tenant_id": current_user.tenant_id, "profiles": [], "next_cursor": None})
+    # Plain column rows straight into response dicts: no ORM identity map, no models.
+    profiles = [dict(r._mapping) for r in rows]
+
+    handles_by_profile: dict[str, list[dict]] = {}
+    for profile in profiles:
+        profile["handles"] = handles_by_profile.setdefault(profile["id"], [])
+
+    # One batched query for every listed profile's handles, already in display order.
+    handle_rows = db.execute(
+        select(
+            CustomerChannelHandle.customer_profile_id,
+            CustomerChannelHandle.id,
+            CustomerChannelHandle.channel_type,
+            CustomerChannelHandle.external_user_id,
+            CustomerChannelHandle.last_seen_at,
+            CustomerChannelHandle.created_at,
+            CustomerChannelHandle.updated_at,
+        )
+        .where(
+            CustomerChannelHandle.tenant_id == current_user.tenant_id,
+            in_ids(db, CustomerChannelHandle.customer_profile_id, list(handles_by_profile)),
+        )
+        .order_by(CustomerChannelHandle.channel_type, CustomerChannelHandle.external_user_id)
+    ).mappings()
+    for row in handle_rows:
+        handle = dict(row)
+        handles_by_profile[handle.pop("customer_profile_id")].append(handle)
+
+    return _json_response(
+        {"tenant_id": current_user.tenant_id, "profiles": profiles, "next_cursor": page_cursor}
+    )
 
-    return {
-        "tenant_id": current_user.tenant_id,
-        "profiles": [
-            _to_profile_out(
-                p,
-                handles=sorted(
-                    handles_by_profile.get(p.id, []),
-                    key=lambda x: ((x.channel_type or ""), (x.external_user_id or "")),
-                ),
-                conversation_count=conv_counts.get(p.id, 0),
-                handoff_count=handoff_counts.get(p.id, 0),
-            )
-            for p in profiles
-        ],
-    }
 
+_MERGE_ATTEMPTS = 3
+# serialization_failure, deadlock_detected
+_RETRYABLE_SQLSTATES = {"40001", "40P01"}
 
-@admin_router.post("/profiles/merge", response_model=CustomerProfileMergeResponse)
-def merge_customer_profiles(
-    payload: CustomerProfileMergeRequest,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
-    require_scope(current_user, "channels:write")
-    _require_admin_or_owner(current_user)
 
-    source = db.execute(
-        select(CustomerProfile).where(
-            CustomerProfile.id == payload.source_profile_id,
-            CustomerProfile.tenant_id == current_user.tenant_id,
-        )
-    ).scalar_one_or_none()
-    if not source:
+def _merge_profiles(db: Session, *, tenant_id: str, source_id: str, target_id: str) -> dict[str, int]:
+    # Lock both profiles up front, always in id order, so concurrent merges of the same
+    # pair (in either direction) queue instead of interleaving or deadlocking. The lock
+    # also holds back webhook inserts of new handles that reference either profile.
+    locked = set(
+        db.execute(
+            select(CustomerProfile.id)
+            .where(
+                CustomerProfile.tenant_id == tenant_id,
+                CustomerProfile.id.in_([source_id, target_id]),
+            )
+            .order_by(CustomerProfile.id)
+            .with_for_update()
+        ).scalars()
+    )
+    if source_id not in locked:
         raise HTTPException(status_code=404, detail="Source profile not found")
-
-    target = db.execute(
-        select(CustomerProfile).where(
-            CustomerProfile.id == payload.target_profile_id,
-            CustomerProfile.tenant_id == current_user.tenant_id,
-        )
-    ).scalar_one_or_none()
-    if not target:
+    if target_id not in locked:
         raise HTTPException(status_code=404, detail="Target profile not found")
-
-    if source.id == target.id:
+    if source_id == target_id:
         raise HTTPException(status_code=422, detail="source_profile_id and target_profile_id must differ")
 
-    moved_handles = 0
-    deduped_handles = 0
     now = datetime.now(timezone.utc)
 
     source_handles = db.execute(
-        select(CustomerChannelHandle).where(
-            CustomerChannelHandle.tenant_id == current_user.tenant_id,
-            CustomerChannelHandle.customer_profile_id == source.id,
+        select(
+            CustomerChannelHandle.id,
+            CustomerChannelHandle.channel_type,
+            CustomerChannelHandle.external_user_id,
+        ).where(
+            CustomerChannelHandle.tenant_id == tenant_id,
+            CustomerChannelHandle.customer_profile_id == source_id,
         )
-    ).scalars().all()
+    ).all()
+    # One query for every (channel_type, external_user_id) the target already owns.
+    duplicate_keys: set[tuple[str, str]] = set()
+    if source_handles:
+        duplicate_keys = set(
+            db.execute(
+                select(CustomerChannelHandle.channel_type, CustomerChannelHandle.external_user_id).where(
+                    CustomerChannelHandle.tenant_id == tenant_id,
+                    CustomerChannelHandle.customer_profile_id == target_id,
+                    tuple_(CustomerChannelHandle.channel_type, CustomerChannelHandle.external_user_id).in_(
+                        [(h.channel_type, h.external_user_id) for h in source_handles]
+                    ),
+                )
+            ).tuples()
+        )
+    move_ids: list[str] = []
+    delete_ids: list[str] = []
     for handle in source_handles:
-        duplicate = db.execute(
-            select(CustomerChannelHandle).where(
-                CustomerChannelHandle.tenant_id == current_user.tenant_id,
-                CustomerChannelHandle.customer_profile_id == target.id,
-                CustomerChannelHandle.channel_type == handle.channel_type,
-                CustomerChannelHandle.external_user_id == handle.external_user_id,
-            )
-        ).scalar_one_or_none()
-        if duplicate:
-            db.delete(handle)
-            deduped_handles += 1
-            continue
-        handle.customer_profile_id = target.id
-        handle.updated_at = now
-        db.add(handle)
-        moved_handles += 1
+        if (handle.channel_type, handle.external_user_id) in duplicate_keys:
+            delete_ids.append(handle.id)
+        else:
+            move_ids.append(handle.id)
+
+    if delete_ids:
+        db.execute(delete(CustomerChannelHandle).where(CustomerChannelHandle.id.in_(delete_ids)))
+    if move_ids:
+        db.execute(
+            update(CustomerChannelHandle)
+            .where(CustomerChannelHandle.id.in_(move_ids))
+            .values(customer_profile_id=target_id, updated_at=now)
+        )
 
     moved_conversations = db.execute(
         update(Conversation)
         .where(
-            Conversation.tenant_id == current_user.tenant_id,
-            Conversation.user_id == source.id,
+            Conversation.tenant_id == tenant_id,
+            Conversation.user_id == source_id,
         )
-        .values(user_id=target.id)
+        .values(user_id=target_id)
     ).rowcount or 0
 
     moved_handoffs = db.execute(
         update(HandoffRequest)
         .where(
-            HandoffRequest.tenant_id == current_user.tenant_id,
-            HandoffRequest.user_id == source.id,
+            HandoffRequest.tenant_id == tenant_id,
+            HandoffRequest.user_id == source_id,
         )
-        .values(user_id=target.id)
+        .values(user_id=target_id)
     ).rowcount or 0
 
-    target.updated_at = now
-    db.add(target)
-    db.delete(source)
-    db.commit()
+    db.execute(update(CustomerProfile).where(CustomerProfile.id == target_id).values(updated_at=now))
+    db.execute(delete(CustomerProfile).where(CustomerProfile.id == source_id))
 
     return {
-        "tenant_id": current_user.tenant_id,
-        "source_profile_id": payload.source_profile_id,
-        "target_profile_id": payload.target_profile_id,
-        "moved_handles": int(moved_handles),
-        "deduped_handles": int(deduped_handles),
+        "moved_handles": len(move_ids),
+        "deduped_handles": len(delete_ids),
         "moved_conversations": int(moved_conversations),
         "moved_handoffs": int(moved_handoffs),
     }
 
 
+@admin_router.post("/profiles/merge", response_model=CustomerProfileMergeResponse)
+def merge_customer_profiles(
+    payload: CustomerProfileMergeRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(_channels_write),
+):
+    _require_admin_or_owner(current_user)
+
+    for attempt in range(_MERGE_ATTEMPTS):
+        try:
+            counts = _merge_profiles(
+                db,
+                tenant_id=current_user.tenant_id,
+                source_id=payload.source_profile_id,
+                target_id=payload.target_profile_id,
+            )
+            db.commit()
+            break
+        except OperationalError as exc:
+            db.rollback()
+            retryable = getattr(exc.orig, "sqlstate", None) in _RETRYABLE_SQLSTATES
+            if not retryable or attempt == _MERGE_ATTEMPTS - 1:
+                raise
+            time.sleep(0.05 * 2**attempt)
+
+    return _json_response(
+        {
+            "tenant_id": current_user.tenant_id,
+            "source_profile_id": payload.source_profile_id,
+            "target_profile_id": payload.target_profile_id,
+            **counts,
+        }
+    )
+
+
 @webhook_router.get("/meta/webhook")
 def verify_meta_webhook(
     mode: str | None = Query(default=None, alias="hub.mode"),
@@ -421,44 +539,52 @@ def verify_meta_webhook(
     if mode != "subscribe" or not verify_token:
         raise HTTPException(status_code=400, detail="Invalid verification request")
 
-    row = db.execute(
-        select(TenantChannelAccount).where(
-            TenantChannelAccount.verify_token == verify_token,
-            TenantChannelAccount.is_active.is_(True),
-        )
-    ).scalar_one_or_none()
-
-    if not row:
+    if not is_active_verify_token(db, verify_token):
         raise HTTPException(status_code=403, detail="Verification token mismatch")
 
     return PlainTextResponse(challenge or "")
 
 
+def _verify_meta_webhook(db: Session, raw: bytes, signature: str | None) -> dict:
+    if signature:
+        # Accounts under one Meta app share its secret: HMAC each distinct secret once.
+        # Secrets are streamed in batches and verification stops at the first match.
+        with db.execute(
+            select(TenantChannelAccount.app_secret)
+            .where(
+                TenantChannelAccount.is_active.is_(True),
+                TenantChannelAccount.app_secret.is_not(None),
+                TenantChannelAccount.app_secret != "",
+            )
+            .distinct()
+            .execution_options(yield_per=200)
+        ).scalars() as app_secrets:
+            first = next(app_secrets, None)
+            if first is not None and not verify_meta_signature(
+                raw, signature, itertools.chain((first,), app_secrets)
+            ):
+                raise HTTPException(status_code=403, detail="Invalid webhook signature")
+
+    # Parsed straight from bytes, and only once the signature has been accepted.
+    try:
+        payload = from_json(raw)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="Invalid JSON payload") from exc
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+    return payload
+
+
 @webhook_router.post("/meta/webhook", response_model=MetaWebhookResponse)
 async def handle_meta_webhook(
     request: Request,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     x_hub_signature_256: str | None = Header(default=None),
 ):
     raw = await request.body()
-
-    if x_hub_signature_256:
-        app_secrets = [
-            r
-            for r in db.execute(
-                select(TenantChannelAccount.app_secret).where(TenantChannelAccount.is_active.is_(True))
-            ).scalars().all()
-            if r
-        ]
-        if app_secrets and not verify_meta_signature(raw, x_hub_signature_256, app_secrets):
-            raise HTTPException(status_code=403, detail="Invalid webhook signature")
-
-    try:
-        payload = json.loads(raw.decode("utf-8"))
-    except Exception as exc:
-        raise HTTPException(status_code=400, detail="Invalid JSON payload") from exc
-
-    processed, ignored = process_meta_webhook_payload(db, payload)
-    return MetaWebhookResponse(received=True, processed_messages=processed, ignored_events=ignored)
-
-
+    # Only signature and JSON checks run before the response: Meta's retry timer then
+    # measures our acknowledgement, not the OpenAI/Meta round trips per message.
+    payload = await run_in_threadpool(_verify_meta_webhook, db, raw, x_hub_signature_256)
+    background_tasks.add_task(run_meta_webhook_job, payload)
+    return MetaWebhookResponse(received=True, queued=True, processed_messages=0, ignored_events=0)
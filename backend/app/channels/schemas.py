@@ -62,6 +62,8 @@ class ChannelAccountRotateTokenResponse(BaseModel):
 
 class MetaWebhookResponse(BaseModel):
     received: bool
+    # Messages are processed after the response is sent; counts are then always 0.
+    queued: bool = False
     processed_messages: int
     ignored_events: int
 
@@ -101,6 +103,7 @@ class CustomerProfileOut(BaseModel):
 class CustomerProfilesResponse(BaseModel):
     tenant_id: str
     profiles: list[CustomerProfileOut]
+    next_cursor: str | None = None
 
 
 class CustomerProfileMergeRequest(BaseModel):
@@ -0,0 +1,28 @@
+import threading
+import time
+from collections import OrderedDict
+
+_MAX_ENTRIES = 10_000
+TTL_SECONDS = 600.0
+
+_lock = threading.Lock()
+# Meta message id -> expires_at_monotonic
+_entries: OrderedDict[str, float] = OrderedDict()
+
+
+def claim_message(message_id: str) -> bool:
+    """
+    True the first time this process sees a Meta message id within TTL_SECONDS.
+    Meta redelivers webhooks it thinks failed; a redelivered message must not be
+    answered twice. Per-process only: duplicates landing on another worker still pass.
+    """
+    now = time.monotonic()
+    with _lock:
+        expires_at = _entries.get(message_id)
+        if expires_at is not None and expires_at > now:
+            return False
+        _entries[message_id] = now + TTL_SECONDS
+        _entries.move_to_end(message_id)
+        while len(_entries) > _MAX_ENTRIES:
+            _entries.popitem(last=False)
+    return True
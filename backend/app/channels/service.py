@@ -1,21 +1,25 @@
 import hashlib
 import hmac
-import json
 import logging
 import re
 import secrets
+import threading
+from collections.abc import Iterable
 from datetime import datetime, timezone
+from functools import lru_cache
 from types import SimpleNamespace
-from urllib import request
 
+import httpx
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.channels.models import CustomerChannelHandle, CustomerProfile, TenantChannelAccount
+from app.channels.seen_messages import claim_message
 from app.chat.router import ask as ask_internal
 from app.chat.schemas import AskRequest
 from app.handoff.service import create_handoff_request
 from app.core.config import settings
+from app.db.session import SessionLocal
 
 logger = logging.getLogger(__name__)
 
@@ -24,12 +28,20 @@ _SOCIAL_HANDOFF_INTENT_RE = re.compile(
     r"\b(human|agent|customer service|support person|real person|someone)\b",
     re.IGNORECASE,
 )
+# Internal citation/debug tags like [doc:chunk] are hidden from social channels.
+_CITATION_TAG_RE = re.compile(r"\s*\[[^\]]+:[^\]]+\]\s*")
+_MULTI_WS_RE = re.compile(r"\s{2,}")
 
 
 def generate_verify_token() -> str:
     return secrets.token_urlsafe(24)
 
 
+def hash_verify_token(verify_token: str) -> bytes:
+    # Webhook verification looks accounts up by this digest, so the plaintext is not indexed.
+    return hashlib.sha256(verify_token.encode("utf-8")).digest()
+
+
 def normalize_channel_type(channel_type: str) -> str:
     value = (channel_type or "").strip().lower()
     if value not in SUPPORTED_CHANNELS:
@@ -123,32 +135,49 @@ def resolve_customer_user_id(
     return profile.id
 
 
+_graph_client: httpx.Client | None = None
+_graph_client_lock = threading.Lock()
+
+
+def _get_graph_client() -> httpx.Client:
+    # One pooled client per process: successive Graph calls (answer parts, messages in a
+    # batch) reuse kept-alive TLS connections instead of paying a handshake each.
+    global _graph_client
+    if _graph_client is None:
+        with _graph_client_lock:
+            if _graph_client is None:
+                _graph_client = httpx.Client(
+                    timeout=8.0,
+                    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                )
+    return _graph_client
+
+
+def close_graph_client() -> None:
+    global _graph_client
+    with _graph_client_lock:
+        client, _graph_client = _graph_client, None
+    if client is not None:
+        client.close()
+
+
 def _graph_post(path: str, access_token: str, payload: dict) -> None:
     url = f"https://graph.facebook.com/{settings.META_GRAPH_API_VERSION}/{path}"
-    body = json.dumps(payload).encode("utf-8")
-    req = request.Request(
-        url,
-        data=body,
-        headers={
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        },
-        method="POST",
-    )
     try:
-        with request.urlopen(req, timeout=8):
-            return
+        resp = _get_graph_client().post(
+            url,
+            json=payload,
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+        resp.raise_for_status()
     except Exception:
         logger.exception("Failed to send channel response via Meta Graph API")
         raise
 
 
 def _clean_social_answer(answer: str) -> str:
-    text = " ".join((answer or "").split()).strip()
-    # Hide internal citation/debug tags from social channels.
-    text = re.sub(r"\s*\[[^\]]+:[^\]]+\]\s*", " ", text)
-    text = re.sub(r"\s{2,}", " ", text).strip()
-    return text
+    text = " ".join((answer or "").split())
+    return _MULTI_WS_RE.sub(" ", _CITATION_TAG_RE.sub(" ", text)).strip()
 
 
 def _split_message(text: str, limit: int) -> list[str]:
@@ -158,18 +187,22 @@ def _split_message(text: str, limit: int) -> list[str]:
     if len(s) <= limit:
         return [s]
 
+    # Walk indices over s so each chunk is sliced once instead of re-copying the tail.
     out: list[str] = []
-    buf = s
-    while len(buf) > limit:
-        cut = buf.rfind(" ", 0, limit)
-        if cut < int(limit * 0.6):
-            cut = limit
-        part = buf[:cut].strip()
+    n = len(s)
+    start = 0
+    while n - start > limit:
+        cut = s.rfind(" ", start, start + limit)
+        if cut < start + int(limit * 0.6):
+            cut = start + limit
+        part = s[start:cut].rstrip()
         if part:
             out.append(part)
-        buf = buf[cut:].strip()
-    if buf:
-        out.append(buf)
+        start = cut
+        while start < n and s[start].isspace():
+            start += 1
+    if start < n:
+        out.append(s[start:])
     return out
 
 
@@ -236,46 +269,70 @@ def _clear_channel_error(account: TenantChannelAccount) -> None:
     account.last_error_at = None
 
 
-def _resolve_account_for_page_event(
+def _page_event_accounts(
     db: Session,
     *,
     channel_type: str,
-    recipient_id: str,
-) -> TenantChannelAccount | None:
-    account = db.execute(
-        select(TenantChannelAccount).where(
-            TenantChannelAccount.channel_type == channel_type,
-            TenantChannelAccount.page_id == recipient_id,
-            TenantChannelAccount.is_active.is_(True),
+    recipient_ids: set[str],
+) -> dict[str, TenantChannelAccount]:
+    """
+    recipient_id -> account for one webhook delivery, in a single query. Resolution order
+    per id: page_id on channel_type, then (messenger) a legacy "facebook" page_id, then
+    (instagram) instagram_account_id.
+    """
+    if not recipient_ids:
+        return {}
+
+    if channel_type == "messenger":
+        match = TenantChannelAccount.channel_type.in_(("messenger", "facebook")) & TenantChannelAccount.page_id.in_(
+            recipient_ids
+        )
+    else:
+        match = (TenantChannelAccount.channel_type == channel_type) & (
+            TenantChannelAccount.page_id.in_(recipient_ids)
+            | TenantChannelAccount.instagram_account_id.in_(recipient_ids)
         )
-    ).scalar_one_or_none()
 
-    if account:
-        return account
+    by_key: dict[tuple[str, str], TenantChannelAccount] = {}
+    for account in db.execute(
+        select(TenantChannelAccount).where(match, TenantChannelAccount.is_active.is_(True))
+    ).scalars():
+        if account.page_id:
+            by_key.setdefault((account.channel_type, account.page_id), account)
+        if account.instagram_account_id:
+            by_key.setdefault(("instagram_account_id", account.instagram_account_id), account)
 
-    if channel_type == "messenger":
-        return db.execute(
-            select(TenantChannelAccount).where(
-                TenantChannelAccount.channel_type == "facebook",
-                TenantChannelAccount.page_id == recipient_id,
-                TenantChannelAccount.is_active.is_(True),
-            )
-        ).scalar_one_or_none()
+    fallback = "facebook" if channel_type == "messenger" else "instagram_account_id"
+    resolved = {}
+    for recipient_id in recipient_ids:
+        account = by_key.get((channel_type, recipient_id)) or by_key.get((fallback, recipient_id))
+        if account:
+            resolved[recipient_id] = account
+    return resolved
 
-    return None
 
+@lru_cache(maxsize=256)
+def _keyed_hmac(secret: str) -> "hmac.HMAC":
+    # Holds the key's inner/outer pad state; callers must .copy() before update().
+    return hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)
 
-def verify_meta_signature(payload_bytes: bytes, header_value: str, secrets_list: list[str]) -> bool:
+
+def verify_meta_signature(payload_bytes: bytes, header_value: str, secrets_list: Iterable[str]) -> bool:
+    # Consumes secrets lazily and stops at the first match, so callers can stream them.
     if not header_value or not header_value.startswith("sha256="):
         return False
 
-    sent_sig = header_value.split("=", 1)[1].strip()
+    try:
+        sent_sig = bytes.fromhex(header_value.split("=", 1)[1].strip())
+    except ValueError:
+        return False
     if not sent_sig:
         return False
 
     for secret in secrets_list:
-        digest = hmac.new(secret.encode("utf-8"), payload_bytes, hashlib.sha256).hexdigest()
-        if hmac.compare_digest(digest, sent_sig):
+        mac = _keyed_hmac(secret).copy()
+        mac.update(payload_bytes)
+        if hmac.compare_digest(mac.digest(), sent_sig):
             return True
     return False
 
@@ -365,94 +422,104 @@ def process_meta_webhook_payload(db: Session, payload: dict) -> tuple[int, int]:
     obj = (payload.get("object") or "").strip().lower()
 
     if obj == "whatsapp_business_account":
-        for entry in payload.get("entry", []):
-            for change in entry.get("changes", []):
-                value = change.get("value") or {}
-                phone_number_id = ((value.get("metadata") or {}).get("phone_number_id") or "").strip()
-                if not phone_number_id:
-                    ignored += 1
-                    continue
-
-                account = db.execute(
-                    select(TenantChannelAccount).where(
-                        TenantChannelAccount.channel_type == "whatsapp",
-                        TenantChannelAccount.phone_number_id == phone_number_id,
-                        TenantChannelAccount.is_active.is_(True),
-                    )
-                ).scalar_one_or_none()
-                if not account:
-                    ignored += 1
-                    continue
-                account.last_webhook_at = datetime.now(timezone.utc)
-                account.updated_at = datetime.now(timezone.utc)
-                db.add(account)
-
-                for msg in value.get("messages", []):
-                    if msg.get("type") != "text":
-                        ignored += 1
-                        continue
-
-                    text = ((msg.get("text") or {}).get("body") or "").strip()
-                    sender = (msg.get("from") or "").strip()
-                    if not text or not sender:
-                        ignored += 1
-                        continue
-
-                    _ask_and_reply(
-                        db,
-                        account=account,
-                        external_user_id=sender,
-                        question=text,
-                        channel_type="whatsapp",
-                    )
-                    processed += 1
+        changes = [change for entry in payload.get("entry", []) for change in entry.get("changes", [])]
+        # One lookup for every phone number in the delivery instead of one per change.
+        phone_number_ids = {
+            (((change.get("value") or {}).get("metadata") or {}).get("phone_number_id") or "").strip()
+            for change in changes
+        } - {""}
+        accounts_by_phone: dict[str, TenantChannelAccount] = {}
+        if phone_number_ids:
+            for account in db.execute(
+                select(TenantChannelAccount).where(
+                    TenantChannelAccount.channel_type == "whatsapp",
+                    TenantChannelAccount.phone_number_id.in_(phone_number_ids),
+                    TenantChannelAccount.is_active.is_(True),
+                )
+            ).scalars():
+                accounts_by_phone.setdefault(account.phone_number_id, account)
+
+        for change in changes:
+            value = change.get("value") or {}
+            phone_number_id = ((value.get("metadata") or {}).get("phone_number_id") or "").strip()
+            if not phone_number_id:
+                ignored += 1
+                continue
+
+            account = accounts_by_phone.get(phone_number_id)
+            if not account:
+                ignored += 1
+                continue
+            account.last_webhook_at = datetime.now(timezone.utc)
+            account.updated_at = datetime.now(timezone.utc)
+            db.add(account)
 
-    elif obj in {"page", "instagram"}:
-        for entry in payload.get("entry", []):
-            for evt in entry.get("messaging", []):
-                if (evt.get("message") or {}).get("is_echo"):
+            for msg in value.get("messages", []):
+                if msg.get("type") != "text":
                     ignored += 1
                     continue
 
-                text = ((evt.get("message") or {}).get("text") or "").strip()
-                sender_id = ((evt.get("sender") or {}).get("id") or "").strip()
-                recipient_id = ((evt.get("recipient") or {}).get("id") or "").strip()
-                if not text or not sender_id or not recipient_id:
+                text = ((msg.get("text") or {}).get("body") or "").strip()
+                sender = (msg.get("from") or "").strip()
+                if not text or not sender:
                     ignored += 1
                     continue
-
-                channel_type = "instagram" if obj == "instagram" else "messenger"
-                account = _resolve_account_for_page_event(
-                    db,
-                    channel_type=channel_type,
-                    recipient_id=recipient_id,
-                )
-
-                if not account and channel_type == "instagram":
-                    account = db.execute(
-                        select(TenantChannelAccount).where(
-                            TenantChannelAccount.channel_type == "instagram",
-                            TenantChannelAccount.instagram_account_id == recipient_id,
-                            TenantChannelAccount.is_active.is_(True),
-                        )
-                    ).scalar_one_or_none()
-
-                if not account:
+                message_id = (msg.get("id") or "").strip()
+                if message_id and not claim_message(message_id):
                     ignored += 1
                     continue
-                account.last_webhook_at = datetime.now(timezone.utc)
-                account.updated_at = datetime.now(timezone.utc)
-                db.add(account)
 
                 _ask_and_reply(
                     db,
                     account=account,
-                    external_user_id=sender_id,
+                    external_user_id=sender,
                     question=text,
-                    channel_type=channel_type,
+                    channel_type="whatsapp",
                 )
                 processed += 1
 
+    elif obj in {"page", "instagram"}:
+        channel_type = "instagram" if obj == "instagram" else "messenger"
+        events = [evt for entry in payload.get("entry", []) for evt in entry.get("messaging", [])]
+        accounts_by_recipient = _page_event_accounts(
+            db,
+            channel_type=channel_type,
+            recipient_ids={((evt.get("recipient") or {}).get("id") or "").strip() for evt in events} - {""},
+        )
+
+        for evt in events:
+            if (evt.get("message") or {}).get("is_echo"):
+                ignored += 1
+                continue
+
+            text = ((evt.get("message") or {}).get("text") or "").strip()
+            sender_id = ((evt.get("sender") or {}).get("id") or "").strip()
+            recipient_id = ((evt.get("recipient") or {}).get("id") or "").strip()
+            if not text or not sender_id or not recipient_id:
+                ignored += 1
+                continue
+            message_id = ((evt.get("message") or {}).get("mid") or "").strip()
+            if message_id and not claim_message(message_id):
+                ignored += 1
+                continue
+
+            account = accounts_by_recipient.get(recipient_id)
+            if not account:
+                ignored += 1
+                continue
+            account.last_webhook_at = datetime.now(timezone.utc)
+            account.updated_at = datetime.now(timezone.utc)
+            db.add(account)
+
+            _ask_and_reply(
+                db,
+                account=account,
+                external_user_id=sender_id,
+                question=text,
+                channel_type=channel_type,
+            )
+            processed += 1
+
     else:
         ignored += 1
 
@@ -460,3 +527,19 @@ def process_meta_webhook_payload(db: Session, payload: dict) -> tuple[int, int]:
     return processed, ignored
 
 
+def run_meta_webhook_job(payload: dict) -> None:
+    """
+    Background entry point: processes a verified webhook payload on its own session,
+    after the webhook request has already been acknowledged.
+    """
+    db = SessionLocal()
+    try:
+        processed, ignored = process_meta_webhook_payload(db, payload)
+        logger.debug("Meta webhook processed=%s ignored=%s", processed, ignored)
+    except Exception:
+        db.rollback()
+        logger.exception("Meta webhook processing failed object=%s", payload.get("object"))
+    finally:
+        db.close()
+
+
@@ -0,0 +1,64 @@
+import threading
+import time
+from collections import OrderedDict
+
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import Session
+
+from app.channels.models import TenantChannelAccount
+from app.channels.service import hash_verify_token
+
+_MAX_ENTRIES = 4096
+HIT_TTL_SECONDS = 30.0
+MISS_TTL_SECONDS = 5.0
+
+_ACTIVE_BY_VERIFY_TOKEN_HASH = select(TenantChannelAccount.id).where(
+    TenantChannelAccount.verify_token_hash == bindparam("verify_token_hash"),
+    TenantChannelAccount.is_active.is_(True),
+)
+
+_lock = threading.Lock()
+_generation = 0
+# sha256(verify_token) -> (expires_at_monotonic, matches_active_account)
+_entries: OrderedDict[bytes, tuple[float, bool]] = OrderedDict()
+
+
+def is_active_verify_token(db: Session, verify_token: str) -> bool:
+    """
+    True if an active channel account uses this verify token. Results (including misses,
+    for shorter) are cached so repeated Meta verification probes skip the DB.
+    """
+    key = hash_verify_token(verify_token)
+    with _lock:
+        generation = _generation
+        hit = _entries.get(key)
+        if hit is not None:
+            if hit[0] > time.monotonic():
+                _entries.move_to_end(key)
+                return hit[1]
+            del _entries[key]
+
+    found = db.execute(_ACTIVE_BY_VERIFY_TOKEN_HASH, {"verify_token_hash": key}).first() is not None
+
+    with _lock:
+        # Skip the store if an account changed while we were reading.
+        if _generation == generation:
+            ttl = HIT_TTL_SECONDS if found else MISS_TTL_SECONDS
+            _entries[key] = (time.monotonic() + ttl, found)
+            _entries.move_to_end(key)
+            while len(_entries) > _MAX_ENTRIES:
+                _entries.popitem(last=False)
+
+    return found
+
+
+def invalidate_verify_tokens() -> None:
+    """
+    Call after committing any channel account create/update. Account writes are rare
+    admin actions, so the whole cache is dropped rather than tracking old/new tokens.
+    Other workers converge within HIT_TTL_SECONDS.
+    """
+    global _generation
+    with _lock:
+        _generation += 1
+        _entries.clear()
@@ -11,24 +11,15 @@ REFUSAL_SENTENCE = (
 _CIT_RE = re.compile(r"\[([^\[\]:\s]+):([^\[\]\s]+)\]")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CitationKey:
     document_id: str
     chunk_id: str
 
 
 def extract_citation_keys(answer: str) -> list[CitationKey]:
-    keys: list[CitationKey] = []
-    for doc_id, chunk_id in _CIT_RE.findall(answer or ""):
-        keys.append(CitationKey(document_id=doc_id, chunk_id=chunk_id))
-    # de-dup while preserving order
-    seen = set()
-    out: list[CitationKey] = []
-    for k in keys:
-        if k not in seen:
-            out.append(k)
-            seen.add(k)
-    return out
+    # dict.fromkeys de-dups while preserving order
+    return list(dict.fromkeys(CitationKey(document_id=d, chunk_id=c) for d, c in _CIT_RE.findall(answer or "")))
 
 
 def is_refusal(answer: str) -> bool:
@@ -48,8 +39,9 @@ def validate_citations(answer: str, retrieved_chunks: Iterable) -> tuple[bool, l
     if not keys:
         return False, []
 
-    valid = {CitationKey(document_id=c.document_id, chunk_id=c.id) for c in retrieved_chunks}
+    # Plain tuples: hashed in C, no CitationKey built per retrieved chunk.
+    valid = {(c.document_id, c.id) for c in retrieved_chunks}
     for k in keys:
-        if k not in valid:
+        if (k.document_id, k.chunk_id) not in valid:
             return False, keys
     return True, keys
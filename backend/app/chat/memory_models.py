@@ -38,4 +38,17 @@ class Message(Base):
 
 
 Index("ix_messages_conv_created", Message.conversation_id, Message.created_at)
-Index("ix_conversations_tenant_user", Conversation.tenant_id, Conversation.user_id)
+# Latest conversation for (tenant, user) is read straight off the index, no sort.
+Index(
+    "ix_conversations_tenant_user_active",
+    Conversation.tenant_id,
+    Conversation.user_id,
+    Conversation.last_activity_at.desc(),
+)
+Index("ix_conversations_tenant_activity", Conversation.tenant_id, Conversation.last_activity_at, Conversation.id)
+Index(
+    "ix_conversations_paused",
+    Conversation.tenant_id,
+    Conversation.ai_paused_at.desc(),
+    postgresql_where=Conversation.ai_paused,
+)
@@ -0,0 +1,18 @@
+from collections.abc import Sequence
+
+from sqlalchemy import String, any_, literal
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session
+
+# Above this many ids, PostgreSQL gets one array parameter instead of an N-parameter IN list.
+ARRAY_IN_THRESHOLD = 32
+
+
+def in_ids(db: Session, column, ids: Sequence[str]):
+    """
+    `column IN (...)` for short lists; `column = ANY($1::varchar[])` for long ones on PostgreSQL,
+    which keeps the statement text (and its plan) identical regardless of list length.
+    """
+    if len(ids) > ARRAY_IN_THRESHOLD and db.get_bind().dialect.name == "postgresql":
+        return column == any_(literal(list(ids), ARRAY(String)))
+    return column.in_(ids)
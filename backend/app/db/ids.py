@@ -0,0 +1,18 @@
+import os
+import random
+import secrets
+import time
+
+# Row ids are opaque, not secret: a userspace PRNG seeded once from the OS avoids an
+# os.urandom() call per insert. Reseeded after fork so workers never share a sequence.
+_rng = random.Random(secrets.randbits(128))
+os.register_at_fork(after_in_child=lambda: _rng.seed(secrets.randbits(128)))
+
+
+def time_ordered_id(prefix: str) -> str:
+    """
+    `<prefix>_` + 48-bit unix-ms timestamp + 48 random bits (uuid7 layout, 24 hex chars).
+    Ids sort by creation time, so high-volume inserts append to the right edge of the
+    primary-key btree instead of splitting random leaf pages.
+    """
+    return f"{prefix}_{time.time_ns() // 1_000_000:012x}{_rng.getrandbits(48):012x}"
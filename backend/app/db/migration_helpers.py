@@ -0,0 +1,107 @@
+import logging
+import time
+
+from alembic import op
+
+
+def is_postgresql() -> bool:
+    return op.get_context().dialect.name == "postgresql"
+
+
+def set_lock_timeout(timeout: str = "2s") -> None:
+    # Fail fast instead of queueing behind long-running readers; scoped to the transaction.
+    if is_postgresql():
+        op.execute(f"SET LOCAL lock_timeout = '{timeout}'")
+
+
+def create_index_concurrently(
+    index_name: str,
+    table_name: str,
+    columns: list,
+    *,
+    unique: bool = False,
+    **kw,
+) -> None:
+    """
+    Build an index without blocking writes on PostgreSQL.
+    CONCURRENTLY cannot run inside a transaction, so the statement is issued in an
+    autocommit block. Other dialects (SQLite in tests) get a plain CREATE INDEX.
+    """
+    if is_postgresql():
+        with op.get_context().autocommit_block():
+            op.create_index(
+                index_name,
+                table_name,
+                columns,
+                unique=unique,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+                **kw,
+            )
+    else:
+        op.create_index(index_name, table_name, columns, unique=unique, **kw)
+
+
+def drop_index_concurrently(index_name: str, table_name: str) -> None:
+    if is_postgresql():
+        with op.get_context().autocommit_block():
+            op.drop_index(
+                index_name,
+                table_name=table_name,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+    else:
+        op.drop_index(index_name, table_name=table_name)
+
+
+def backfill_in_batches(
+    table_name: str,
+    set_clause: str,
+    where_clause: str,
+    *,
+    batch_size: int = 5000,
+    pause_seconds: float = 0.05,
+    progress_every: int = 10,
+) -> None:
+    """
+    Run UPDATE ... SET in id-bounded batches, committing each batch so row locks and
+    WAL per transaction stay small. Offline (--sql) runs emit a single UPDATE.
+    Engine logging is silenced for the loop; progress is printed every few batches.
+    """
+    if op.get_context().as_sql:
+        op.execute(f"UPDATE {table_name} SET {set_clause} WHERE {where_clause}")
+        return
+
+    # Raw driver SQL: the statement is identical every batch, so skip compilation and
+    # parameter-style translation entirely.
+    stmt = (
+        f"UPDATE {table_name} SET {set_clause} "
+        f"WHERE id IN (SELECT id FROM {table_name} WHERE {where_clause} LIMIT {int(batch_size)})"
+    )
+    bind = op.get_bind().execution_options(compiled_cache=None)
+    total = bind.exec_driver_sql(f"SELECT count(*) FROM {table_name} WHERE {where_clause}").scalar()
+    if not total:
+        return
+
+    engine_logger = logging.getLogger("sqlalchemy.engine")
+    previous_level = engine_logger.level
+    engine_logger.setLevel(logging.ERROR)
+    done = 0
+    batches = 0
+    try:
+        with op.get_context().autocommit_block():
+            while True:
+                result = bind.exec_driver_sql(stmt)
+                if not result.rowcount:
+                    break
+                done += result.rowcount
+                batches += 1
+                if progress_every and batches % progress_every == 0:
+                    print(f"{table_name}: backfilled {done}/{total}")
+                if pause_seconds:
+                    time.sleep(pause_seconds)
+    finally:
+        engine_logger.setLevel(previous_level)
+
+    print(f"{table_name}: backfilled {done}/{total}")
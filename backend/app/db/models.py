@@ -1,7 +1,7 @@
 from app.tenants.models import Tenant  # noqa: F401
-from app.auth.models import AuthSecurityEvent, PasswordResetToken, RefreshToken, User  # noqa: F401
+from app.auth.models import AuthSecurityEvent, LoginThrottle, PasswordResetToken, RefreshToken, User  # noqa: F401
 from app.rag.models import Document, Chunk  # noqa: F401
-from app.audit.models import ChatAuditLog, OpsAuditLog  # noqa: F401
+from app.audit.models import ChatAuditLog, OpsAuditLog, RetentionPurgeJob  # noqa: F401
 from app.governance.models import TenantPolicy  # noqa: F401
 from app.chat.memory_models import Conversation, Message  # noqa: F401
 from app.embed.models import TenantBotCredential  # noqa: F401
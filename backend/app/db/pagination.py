@@ -0,0 +1,44 @@
+import base64
+import binascii
+from datetime import datetime
+
+from fastapi import HTTPException
+from sqlalchemy import tuple_
+
+
+def encode_cursor(ts: datetime, row_id: str) -> str:
+    raw = f"{ts.isoformat()}|{row_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        ts_raw, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(ts_raw), row_id
+    except (binascii.Error, UnicodeError, ValueError):
+        raise HTTPException(status_code=422, detail="Invalid cursor")
+
+
+def keyset_predicate(ts_column, id_column, cursor: str, *, descending: bool = True):
+    """
+    Seek predicate for (ts, id) ordered listings: the index range-scans from the cursor
+    instead of reading and discarding OFFSET rows.
+    """
+    ts, row_id = decode_cursor(cursor)
+    key = tuple_(ts_column, id_column)
+    if descending:
+        return key < tuple_(ts, row_id)
+    return key > tuple_(ts, row_id)
+
+
+def split_page(rows: list, limit: int, ts_attr: str = "created_at") -> tuple[list, str | None]:
+    """
+    Callers fetch limit + 1 rows; the extra row only proves another page exists, so the
+    last page gets no cursor even when it is exactly `limit` rows long.
+    """
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, ts_attr), last.id)
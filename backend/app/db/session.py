@@ -1,4 +1,8 @@
-from sqlalchemy import create_engine
+import logging
+import time
+
+from pydantic_core import from_json, to_json
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
@@ -9,7 +13,19 @@ connect_args = {}
 if DATABASE_URL.startswith("sqlite"):
     connect_args = {"check_same_thread": False}
 
-engine_kwargs = {"connect_args": connect_args, "pool_pre_ping": True}
+
+def _json_serializer(value) -> str:
+    return to_json(value).decode("utf-8")
+
+
+# JSON/JSONB columns (audit chunks, citations, metadata) go through pydantic-core's
+# Rust codec instead of the stdlib json module.
+engine_kwargs = {
+    "connect_args": connect_args,
+    "pool_pre_ping": True,
+    "json_serializer": _json_serializer,
+    "json_deserializer": from_json,
+}
 if not DATABASE_URL.startswith("sqlite"):
     engine_kwargs.update(
         {
@@ -22,6 +38,39 @@ if not DATABASE_URL.startswith("sqlite"):
 
 engine = create_engine(DATABASE_URL, **engine_kwargs)
 
+logger = logging.getLogger(__name__)
+
+SLOW_CHECKIN_SECONDS = 1.0
+
+
+def setup_pool_event_handlers(target) -> None:
+    """
+    Log pool pressure (overflow checkouts, long-held connections, invalidations) so
+    DB_POOL_SIZE / DB_MAX_OVERFLOW can be sized from real traffic.
+    """
+
+    @event.listens_for(target, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checked_out_at"] = time.perf_counter()
+        if target.pool.checkedout() > settings.DB_POOL_SIZE:
+            logger.warning("DB pool running in overflow: %s", target.pool.status())
+
+    @event.listens_for(target, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        started = connection_record.info.pop("checked_out_at", None)
+        if started is not None:
+            held = time.perf_counter() - started
+            if held > SLOW_CHECKIN_SECONDS:
+                logger.info("DB connection held for %.2fs", held)
+
+    @event.listens_for(target, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        logger.warning("DB connection invalidated: %s", exception)
+
+
+if not DATABASE_URL.startswith("sqlite"):
+    setup_pool_event_handlers(engine)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -0,0 +1,5 @@
+from sqlalchemy import JSON
+from sqlalchemy.dialects.postgresql import JSONB
+
+# Binary JSONB on PostgreSQL (GIN-indexable, no re-parse on read); plain JSON elsewhere.
+JSONVariant = JSON().with_variant(JSONB(), "postgresql")
@@ -1,9 +1,10 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, JSON, String
+from sqlalchemy import Boolean, DateTime, Index, LargeBinary, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
+from app.db.types import JSONVariant
 
 
 class TenantBotCredential(Base):
@@ -13,9 +14,17 @@ class TenantBotCredential(Base):
     tenant_id: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     avatar_url: Mapped[str | None] = mapped_column(String(1024), nullable=True)
-    key_hash: Mapped[str] = mapped_column(String(64), nullable=False, unique=True, index=True)
-    allowed_origins: Mapped[list[str]] = mapped_column(JSON, nullable=False, default=list)
+    key_hash: Mapped[bytes] = mapped_column(LargeBinary(32), nullable=False, unique=True, index=True)
+    allowed_origins: Mapped[list[str]] = mapped_column(JSONVariant, nullable=False, default=list)
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
     rotated_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     last_used_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+
+Index(
+    "ix_tenant_bot_credentials_allowed_origins_gin",
+    TenantBotCredential.allowed_origins,
+    postgresql_using="gin",
+    postgresql_ops={"allowed_origins": "jsonb_path_ops"},
+)
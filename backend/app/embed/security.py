@@ -15,8 +15,8 @@ class WidgetTokenValidationError(ValueError):
     pass
 
 
-def hash_bot_key(raw_key: str) -> str:
-    return sha256(raw_key.encode("utf-8")).hexdigest()
+def hash_bot_key(raw_key: str) -> bytes:
+    return sha256(raw_key.encode("utf-8")).digest()
 
 
 def generate_bot_key() -> str:
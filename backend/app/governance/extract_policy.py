@@ -1,4 +1,21 @@
+import copy
+import hashlib
+import io
 import re
+import threading
+from collections import OrderedDict
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.rag.models import Chunk
+
+# Bump whenever extraction rules change so cached results keyed on the old logic are never reused.
+EXTRACTOR_VERSION = "mvp-1"
+_CACHE_MAX_ENTRIES = 256
+
+_cache_lock = threading.Lock()
+_extract_cache: OrderedDict[bytes, dict] = OrderedDict()
 
 
 def extract_policy_from_text(text: str) -> dict:
@@ -54,4 +71,71 @@ def extract_policy_from_text(text: str) -> dict:
     return {
         "refusal_message": "I can't help with that request based on your organization's policy.",
         "rules": rules,
-    }
\ No newline at end of file
+    }
+
+
+def _extract_cache_key(text: str) -> bytes:
+    h = hashlib.sha256(EXTRACTOR_VERSION.encode("utf-8"))
+    data = text.encode("utf-8")
+    h.update(len(data).to_bytes(8, "big"))
+    h.update(data)
+    return h.digest()
+
+
+def _is_valid_policy(policy: object) -> bool:
+    return (
+        isinstance(policy, dict)
+        and isinstance(policy.get("refusal_message"), str)
+        and isinstance(policy.get("rules"), list)
+    )
+
+
+def extract_policy_cached(text: str) -> dict:
+    """
+    extract_policy_from_text memoized on a content hash of (EXTRACTOR_VERSION, text).
+    Entries that fail shape validation are evicted and recomputed. Returns a copy.
+    """
+    key = _extract_cache_key(text or "")
+    with _cache_lock:
+        hit = _extract_cache.get(key)
+        if hit is not None:
+            if _is_valid_policy(hit):
+                _extract_cache.move_to_end(key)
+                return copy.deepcopy(hit)
+            del _extract_cache[key]
+
+    policy = extract_policy_from_text(text)
+
+    with _cache_lock:
+        _extract_cache[key] = copy.deepcopy(policy)
+        while len(_extract_cache) > _CACHE_MAX_ENTRIES:
+            _extract_cache.popitem(last=False)
+
+    return policy
+
+
+def load_document_text(db: Session, *, tenant_id: str, document_id: str) -> str:
+    """
+    Rebuild a document's text from its chunks, streaming only the text column.
+    Returns "" when no chunk has non-whitespace content.
+    """
+    result = db.execute(
+        select(Chunk.text)
+        .where(
+            Chunk.document_id == document_id,
+            Chunk.tenant_id == tenant_id,
+        )
+        .order_by(Chunk.chunk_index.asc())
+        .execution_options(yield_per=500)
+    ).scalars()
+
+    buf = io.StringIO()
+    has_content = False
+    for i, text in enumerate(result):
+        if i:
+            buf.write("\n")
+        buf.write(text)
+        if not has_content and text and not text.isspace():
+            has_content = True
+
+    return buf.getvalue() if has_content else ""
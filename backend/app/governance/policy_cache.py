@@ -0,0 +1,51 @@
+import copy
+import threading
+from collections import OrderedDict
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.governance.models import TenantPolicy
+
+_MAX_ENTRIES = 1024
+
+_lock = threading.Lock()
+_versions: dict[str, int] = {}
+_entries: OrderedDict[str, tuple[int, dict | None]] = OrderedDict()
+
+
+def get_tenant_policy(db: Session, tenant_id: str) -> dict | None:
+    """
+    Return the tenant's policy_json (None if no policy row exists).
+    Entries are tagged with the tenant's write version, so a bump makes stale entries unreachable.
+    Callers get a copy and may mutate it freely.
+    """
+    with _lock:
+        version = _versions.get(tenant_id, 0)
+        hit = _entries.get(tenant_id)
+        if hit is not None and hit[0] == version:
+            _entries.move_to_end(tenant_id)
+            return copy.deepcopy(hit[1])
+
+    policy = db.execute(
+        select(TenantPolicy.policy_json).where(TenantPolicy.tenant_id == tenant_id)
+    ).scalar_one_or_none()
+
+    with _lock:
+        # Skip the store if a write landed while we were reading.
+        if _versions.get(tenant_id, 0) == version:
+            _entries[tenant_id] = (version, copy.deepcopy(policy))
+            _entries.move_to_end(tenant_id)
+            while len(_entries) > _MAX_ENTRIES:
+                _entries.popitem(last=False)
+
+    return policy
+
+
+def invalidate_tenant_policy(tenant_id: str) -> None:
+    """
+    Call after committing a TenantPolicy write.
+    """
+    with _lock:
+        _versions[tenant_id] = _versions.get(tenant_id, 0) + 1
+        _entries.pop(tenant_id, None)
@@ -2,10 +2,9 @@ import re
 from dataclasses import dataclass
 from typing import Literal
 
-from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.governance.models import TenantPolicy
+from app.governance.policy_cache import get_tenant_policy
 
 Action = Literal["allow", "refuse", "escalate"]
 
@@ -31,8 +30,7 @@ def evaluate_question_policy(db: Session, *, tenant_id: str, question: str) -> P
     q = question or ""
     ql = _safe_lower(q)
 
-    row = db.execute(select(TenantPolicy).where(TenantPolicy.tenant_id == tenant_id)).scalar_one_or_none()
-    policy = row.policy_json if row and row.policy_json else {}
+    policy = get_tenant_policy(db, tenant_id) or {}
 
     refusal_message = policy.get("refusal_message") or DEFAULT_REFUSAL
     rules = policy.get("rules") or []
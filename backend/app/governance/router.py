@@ -6,9 +6,10 @@ from app.db.session import get_db
 from app.auth.deps import get_current_user
 from app.auth.models import User
 
-from app.rag.models import Document, Chunk
+from app.rag.models import Document
 from app.governance.models import TenantPolicy
-from app.governance.extract_policy import extract_policy_from_text
+from app.governance.policy_cache import invalidate_tenant_policy
+from app.governance.extract_policy import extract_policy_cached, load_document_text
 
 router = APIRouter()
 
@@ -34,17 +35,11 @@ def generate_policy_from_document(
         raise HTTPException(status_code=404, detail="Document not found for tenant")
 
     # Rebuild full text from chunks
-    chunks = db.execute(
-        select(Chunk)
-        .where(Chunk.document_id == document_id)
-        .order_by(Chunk.chunk_index.asc())
-    ).scalars().all()
-
-    full_text = "\n".join(c.text for c in chunks)
-    if not full_text.strip():
+    full_text = load_document_text(db, tenant_id=current_user.tenant_id, document_id=document_id)
+    if not full_text:
         raise HTTPException(status_code=400, detail="Document has no chunk text to extract policy from")
 
-    policy_json = extract_policy_from_text(full_text)
+    policy_json = extract_policy_cached(full_text)
 
     # Upsert tenant policy
     existing = db.execute(
@@ -57,5 +52,6 @@ def generate_policy_from_document(
         db.add(TenantPolicy(tenant_id=current_user.tenant_id, policy_json=policy_json))
 
     db.commit()
+    invalidate_tenant_policy(current_user.tenant_id)
 
     return {"tenant_id": current_user.tenant_id, "document_id": document_id, "policy": policy_json}
\ No newline at end of file
@@ -1,6 +1,6 @@
-from datetime import datetime
+from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, ForeignKey, String, Text
+from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -8,6 +8,16 @@ from app.db.base import Base
 
 class HandoffRequest(Base):
     __tablename__ = "handoff_requests"
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('new', 'open', 'pending_customer', 'resolved', 'closed')",
+            name="ck_handoff_requests_status",
+        ),
+        CheckConstraint(
+            "priority IN ('low', 'normal', 'high', 'urgent')",
+            name="ck_handoff_requests_priority",
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String(64), primary_key=True)
     tenant_id: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
@@ -24,16 +34,35 @@ class HandoffRequest(Base):
     destination: Mapped[str | None] = mapped_column(String(255), nullable=True)
     resolution_note: Mapped[str | None] = mapped_column(Text, nullable=True)
     internal_notes: Mapped[str | None] = mapped_column(Text, nullable=True)
-    first_response_due_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
-    first_responded_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
-    resolution_due_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
-    closed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    first_response_due_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    first_responded_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    resolution_due_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    closed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     escalation_flag: Mapped[bool] = mapped_column(nullable=False, default=False)
-    escalated_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    escalated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc)
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc)
+    )
+    resolved_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
-    resolved_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+Index(
+    "ix_handoff_tenant_status_created",
+    HandoffRequest.tenant_id,
+    HandoffRequest.status,
+    HandoffRequest.created_at.desc(),
+)
+Index("ix_handoff_requests_tenant_user", HandoffRequest.tenant_id, HandoffRequest.user_id)
+Index(
+    "ix_handoff_open_by_tenant",
+    HandoffRequest.tenant_id,
+    HandoffRequest.created_at.desc(),
+    postgresql_where=HandoffRequest.status.not_in(["closed", "resolved"]),
+)
 
 
 class HandoffInternalNote(Base):
@@ -49,4 +78,6 @@ class HandoffInternalNote(Base):
     tenant_id: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
     author_user_id: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
     content: Mapped[str] = mapped_column(Text, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc)
+    )
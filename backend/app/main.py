@@ -1,6 +1,7 @@
 import logging
 from pathlib import Path
 
+import anyio.to_thread
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse
@@ -8,6 +9,7 @@ from fastapi.staticfiles import StaticFiles
 from sqlalchemy import text
 from sqlalchemy.engine.url import make_url
 
+from app.audit.writer import start_audit_writer, stop_audit_writer
 from app.auth.router import router as auth_router
 from app.tenants.router import router as tenants_router
 from app.rag.router import router as rag_router
@@ -22,6 +24,7 @@ from app.handoff.router import admin_router as handoff_admin_router
 from app.handoff.router import router as handoff_router
 from app.channels.router import admin_router as channels_admin_router
 from app.channels.router import webhook_router as channels_webhook_router
+from app.channels.service import close_graph_client
 from app.tenant.router import router as tenant_router
 from app.core.config import settings
 from app.db.init_db import init_db
@@ -49,6 +52,10 @@ app.add_middleware(SecurityHeadersMiddleware)
 
 @app.on_event("startup")
 def on_startup() -> None:
+    # Handlers are sync and block on DB and OpenAI calls; size the threadpool so requests
+    # queue on the DB pool (DB_POOL_TIMEOUT) rather than on a thread.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+
     db_url = make_url(settings.DATABASE_URL)
     logger.info(
         "Config sanity: env=%s db_host=%s cors_origins=%s access_exp_min=%s refresh_exp_days=%s",
@@ -103,6 +110,14 @@ def on_startup() -> None:
         else:
             logger.info("Transactional email: provider=smtp disabled (SMTP vars not configured)")
     init_db()
+    start_audit_writer()
+
+
+@app.on_event("shutdown")
+def on_shutdown() -> None:
+    # Flush chat audit rows still queued before the process exits.
+    stop_audit_writer()
+    close_graph_client()
 
 
 # --- Routers ---
@@ -1,10 +1,11 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, JSON
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 from pgvector.sqlalchemy import Vector
 
 from app.db.base import Base
+from app.db.types import JSONVariant
 
 
 class Document(Base):
@@ -26,7 +27,7 @@ class Document(Base):
 
     # Arbitrary access tags (e.g. ["hr_only"], ["finance_only"])
     tags: Mapped[list] = mapped_column(
-        JSON, nullable=False, default=list
+        JSONVariant, nullable=False, default=list
     )
 
     created_at: Mapped[datetime] = mapped_column(
@@ -34,6 +35,21 @@ class Document(Base):
     )
 
 
+Index("ix_documents_tenant_created", Document.tenant_id, Document.created_at, Document.id)
+Index(
+    "ix_documents_filename_trgm",
+    Document.filename,
+    postgresql_using="gin",
+    postgresql_ops={"filename": "gin_trgm_ops"},
+)
+Index(
+    "ix_documents_tags_gin",
+    Document.tags,
+    postgresql_using="gin",
+    postgresql_ops={"tags": "jsonb_path_ops"},
+)
+
+
 class Chunk(Base):
     __tablename__ = "chunks"
 
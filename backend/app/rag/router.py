@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.auth.deps import get_current_user
@@ -24,23 +25,41 @@ async def upload_rag_file(
     raw = await file.read()
     if len(raw) > 10_000_000:
         raise HTTPException(status_code=413, detail="File too large (max 10MB).")
+    # Text extraction, embedding calls and the DB writes block; keep them off the event loop.
+    return await run_in_threadpool(
+        _ingest_upload,
+        db,
+        tenant_id=current_user.tenant_id,
+        filename=file.filename,
+        upload_content_type=file.content_type,
+        raw=raw,
+    )
+
+
+def _ingest_upload(
+    db: Session,
+    *,
+    tenant_id: str,
+    filename: str,
+    upload_content_type: str | None,
+    raw: bytes,
+):
     try:
         content_type, text = extract_text_from_upload(
-            filename=file.filename,
-            content_type=file.content_type,
+            filename=filename,
+            content_type=upload_content_type,
             raw=raw,
         )
     except ValueError as exc:
         raise HTTPException(status_code=415, detail=str(exc)) from exc
 
-    doc = ingest_text_document(
+    return ingest_text_document(
         db=db,
-        tenant_id=current_user.tenant_id,
-        filename=file.filename,
+        tenant_id=tenant_id,
+        filename=filename,
         content_type=content_type,
         text=text,
     )
-    return doc
 
 
 @router.post("/query", response_model=QueryResponse)
@@ -16,7 +16,7 @@ def _prune(q: deque, now: float) -> None:
 
 
 def check_rate_limit(*, tenant_id: str, user_id: str) -> tuple[bool, str | None]:
-    now = time.time()
+    now = time.monotonic()
 
     tq = _tenant_hits[tenant_id]
     _prune(tq, now)
@@ -1,6 +1,6 @@
-from datetime import datetime
+from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, Integer, String
+from sqlalchemy import DateTime, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -12,7 +12,9 @@ class TenantUsageLimit(Base):
     tenant_id: Mapped[str] = mapped_column(String(64), primary_key=True)
     daily_request_limit: Mapped[int] = mapped_column(Integer, nullable=False, default=1000)
     monthly_token_limit: Mapped[int] = mapped_column(Integer, nullable=False, default=1_000_000)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc)
+    )
 
 
 class TenantUsageEvent(Base):
@@ -25,4 +27,12 @@ class TenantUsageEvent(Base):
     refused: Mapped[bool] = mapped_column(nullable=False, default=False)
     total_tokens: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     latency_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        index=True,
+    )
+
+
+Index("ix_usage_events_tenant_created", TenantUsageEvent.tenant_id, TenantUsageEvent.created_at.desc())
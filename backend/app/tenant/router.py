@@ -1,8 +1,8 @@
-import secrets
 import logging
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy import desc, func, select
 from sqlalchemy.orm import Session
 
@@ -13,11 +13,13 @@ from app.auth.security import (
     create_access_token,
     create_refresh_token,
     hash_password,
-    hash_token,
+    hash_refresh_token,
 )
+from app.db.ids import time_ordered_id
 from app.db.session import get_db
 from app.embed.models import TenantBotCredential
 from app.embed.router import _normalize_origins
+from app.embed.schemas import BotCredentialOut
 from app.embed.security import generate_bot_key, hash_bot_key
 from app.channels.models import TenantChannelAccount
 from app.core.config import settings
@@ -216,10 +218,10 @@ def tenant_onboard(
     )
     db.add(
         RefreshToken(
-            id=f"rt_{secrets.token_hex(10)}",
+            id=time_ordered_id("rt"),
             user_id=admin.id,
             tenant_id=admin.tenant_id,
-            token_hash=hash_token(refresh_token),
+            token_hash=hash_refresh_token(refresh_token),
             expires_at=refresh_expires_at,
             revoked_at=None,
         )
@@ -260,7 +262,7 @@ def tenant_onboard(
     )
 
 
-@router.get("/bots")
+@router.get("/bots", response_model=list[BotCredentialOut])
 def tenant_bots(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -395,7 +397,7 @@ def tenant_create_bot(
     }
 
 
-@router.patch("/bots/{bot_id}")
+@router.patch("/bots/{bot_id}", response_model=BotCredentialOut)
 def tenant_patch_bot(
     bot_id: str,
     payload: dict,
@@ -472,10 +474,29 @@ async def tenant_upload_knowledge(
     raw = await file.read()
     if len(raw) > 10_000_000:
         raise HTTPException(status_code=413, detail="File too large (max 10MB).")
+    # Text extraction, embedding calls and the DB writes block; keep them off the event loop.
+    return await run_in_threadpool(
+        _ingest_knowledge_upload,
+        db,
+        tenant_id=current_user.tenant_id,
+        filename=file.filename,
+        upload_content_type=file.content_type,
+        raw=raw,
+    )
+
+
+def _ingest_knowledge_upload(
+    db: Session,
+    *,
+    tenant_id: str,
+    filename: str,
+    upload_content_type: str | None,
+    raw: bytes,
+) -> TenantKnowledgeUploadResponse:
     try:
         content_type, text = extract_text_from_upload(
-            filename=file.filename,
-            content_type=file.content_type,
+            filename=filename,
+            content_type=upload_content_type,
             raw=raw,
         )
     except ValueError as exc:
@@ -483,15 +504,15 @@ async def tenant_upload_knowledge(
 
     doc = ingest_text_document(
         db=db,
-        tenant_id=current_user.tenant_id,
-        filename=file.filename,
+        tenant_id=tenant_id,
+        filename=filename,
         content_type=content_type,
         text=text,
     )
     chunk_count = (
         db.query(func.count(Chunk.id))
         .filter(
-            Chunk.tenant_id == current_user.tenant_id,
+            Chunk.tenant_id == tenant_id,
             Chunk.document_id == doc.id,
         )
         .scalar()
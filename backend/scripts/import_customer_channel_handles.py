@@ -0,0 +1,63 @@
+import sys
+from pathlib import Path
+
+# backend/scripts/ -> parents[1] == backend/
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from app.db.session import engine  # noqa: E402
+
+STAGE_TABLE = "customer_channel_handles_stage"
+COLUMNS = "id, tenant_id, customer_profile_id, channel_type, external_user_id, created_at, updated_at, last_seen_at"
+
+
+def main() -> int:
+    """
+    Bulk-load legacy customer channel handles from a CSV file (header row, columns as in COLUMNS).
+    Rows are COPYed into an UNLOGGED staging table first, so the initial load writes no WAL and
+    skips per-row unique checks; duplicates are collapsed in a single INSERT ... SELECT.
+    """
+    if len(sys.argv) != 2:
+        print(f"usage: {Path(__file__).name} <handles.csv>", file=sys.stderr)
+        return 2
+
+    csv_path = Path(sys.argv[1])
+    if engine.dialect.name != "postgresql":
+        print("[FAIL] Staged import requires PostgreSQL", file=sys.stderr)
+        return 1
+
+    raw = engine.raw_connection()
+    try:
+        cur = raw.cursor()
+        cur.execute(
+            f"CREATE UNLOGGED TABLE IF NOT EXISTS {STAGE_TABLE} "
+            "(LIKE customer_channel_handles INCLUDING DEFAULTS)"
+        )
+        cur.execute(f"TRUNCATE {STAGE_TABLE}")
+        with csv_path.open("rb") as fh, cur.copy(
+            f"COPY {STAGE_TABLE} ({COLUMNS}) FROM STDIN WITH (FORMAT csv, HEADER true)"
+        ) as copy:
+            while chunk := fh.read(1 << 20):
+                copy.write(chunk)
+
+        cur.execute(
+            f"INSERT INTO customer_channel_handles ({COLUMNS}) "
+            f"SELECT DISTINCT ON (tenant_id, channel_type, external_user_id) {COLUMNS} "
+            f"FROM {STAGE_TABLE} "
+            "ORDER BY tenant_id, channel_type, external_user_id, updated_at DESC "
+            "ON CONFLICT ON CONSTRAINT uq_customer_channel_handles_tenant_channel_external DO NOTHING"
+        )
+        inserted = cur.rowcount
+        cur.execute(f"DROP TABLE {STAGE_TABLE}")
+        raw.commit()
+    except Exception:
+        raw.rollback()
+        raise
+    finally:
+        raw.close()
+
+    print(f"[OK] Imported {inserted} customer channel handles")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
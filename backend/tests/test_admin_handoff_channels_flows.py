@@ -3,8 +3,10 @@ from uuid import uuid4
 
 from fastapi.testclient import TestClient
 
+from app.audit.models import ChatAuditLog
 from app.chat.memory_models import Conversation, Message
-from app.channels.models import CustomerChannelHandle
+from app.channels.models import CustomerChannelHandle, CustomerProfile
+from app.channels.schemas import ChannelAccountOut, CustomerProfilesResponse
 from app.db.session import SessionLocal
 from app.handoff.models import HandoffRequest
 from app.main import app
@@ -231,7 +233,7 @@ def test_channel_identity_linking_and_profile_merge(monkeypatch):
                 },
             )
             assert webhook_resp.status_code == 200
-            assert webhook_resp.json()["processed_messages"] == 1
+            assert webhook_resp.json()["queued"] is True
 
         ig_link_resp = client.post(
             "/api/v1/channels/meta/webhook",
@@ -251,7 +253,7 @@ def test_channel_identity_linking_and_profile_merge(monkeypatch):
             },
         )
         assert ig_link_resp.status_code == 200
-        assert ig_link_resp.json()["processed_messages"] == 1
+        assert ig_link_resp.json()["queued"] is True
 
         profiles_resp = client.get("/api/v1/admin/channels/profiles?limit=100", headers=headers)
         assert profiles_resp.status_code == 200
@@ -299,6 +301,152 @@ def test_channel_identity_linking_and_profile_merge(monkeypatch):
         assert ("instagram", sender_target) in target_handle_keys
 
 
+def test_channel_list_endpoints_match_validated_schemas():
+    with TestClient(app) as client:
+        _, token = _onboard_and_token(client)
+        headers = _headers(token)
+
+        create_resp = client.post(
+            "/api/v1/admin/channels/accounts",
+            headers=headers,
+            json={
+                "channel_type": "messenger",
+                "name": "Messenger QA",
+                "page_id": f"pg_{uuid4().hex[:10]}",
+                "access_token": "test-token",
+                "metadata_json": {"region": "eu"},
+            },
+        )
+        assert create_resp.status_code == 200
+        page_id = create_resp.json()["page_id"]
+
+        webhook_resp = client.post(
+            "/api/v1/channels/meta/webhook",
+            json={
+                "object": "page",
+                "entry": [
+                    {
+                        "messaging": [
+                            {
+                                "sender": {"id": f"ext_{uuid4().hex[:10]}"},
+                                "recipient": {"id": page_id},
+                                "message": {"text": "hello"},
+                            }
+                        ]
+                    }
+                ],
+            },
+        )
+        assert webhook_resp.status_code == 200
+
+        # List endpoints build their output without validation; it must survive a validating round trip.
+        accounts_resp = client.get("/api/v1/admin/channels/accounts", headers=headers)
+        assert accounts_resp.status_code == 200
+        assert accounts_resp.headers["content-type"] == "application/json"
+        accounts = accounts_resp.json()
+        assert [a["id"] for a in accounts] == [create_resp.json()["id"]]
+        assert accounts[0]["metadata_json"] == {"region": "eu"}
+        assert accounts == [ChannelAccountOut.model_validate(a).model_dump(mode="json") for a in accounts]
+
+        profiles_resp = client.get("/api/v1/admin/channels/profiles", headers=headers)
+        assert profiles_resp.status_code == 200
+        profiles = profiles_resp.json()
+        assert len(profiles["profiles"]) == 1
+        assert len(profiles["profiles"][0]["handles"]) == 1
+        assert profiles == CustomerProfilesResponse.model_validate(profiles).model_dump(mode="json")
+
+
+def test_customer_profile_listing_pages_with_cursor():
+    with TestClient(app) as client:
+        tenant_id, token = _onboard_and_token(client)
+        headers = _headers(token)
+
+        # Two profiles share updated_at, so the id tie-breaker has to split pages cleanly.
+        tied_at = datetime.now(timezone.utc).replace(microsecond=0)
+        updated = {f"cp_page_{uuid4().hex[:8]}": tied_at + timedelta(minutes=m) for m in [0, 0, -1, 1]}
+        with SessionLocal() as db:
+            for profile_id, ts in updated.items():
+                db.add(CustomerProfile(id=profile_id, tenant_id=tenant_id, created_at=ts, updated_at=ts))
+                db.add(
+                    CustomerChannelHandle(
+                        id=f"ch_{profile_id}",
+                        tenant_id=tenant_id,
+                        customer_profile_id=profile_id,
+                        channel_type="messenger",
+                        external_user_id=f"ext_{profile_id}",
+                    )
+                )
+            db.commit()
+        expected = sorted(updated, key=lambda profile_id: (updated[profile_id], profile_id), reverse=True)
+
+        first = client.get("/api/v1/admin/channels/profiles", params={"limit": 2}, headers=headers)
+        assert first.status_code == 200
+        first_body = first.json()
+        assert [p["id"] for p in first_body["profiles"]] == expected[:2]
+        assert [h["id"] for p in first_body["profiles"] for h in p["handles"]] == [
+            f"ch_{profile_id}" for profile_id in expected[:2]
+        ]
+        assert first_body["next_cursor"]
+
+        # The last page is exactly full, yet carries no cursor.
+        second = client.get(
+            "/api/v1/admin/channels/profiles",
+            params={"limit": 2, "cursor": first_body["next_cursor"]},
+            headers=headers,
+        )
+        assert second.status_code == 200
+        second_body = second.json()
+        assert [p["id"] for p in second_body["profiles"]] == expected[2:]
+        assert second_body["next_cursor"] is None
+        assert second_body == CustomerProfilesResponse.model_validate(second_body).model_dump(mode="json")
+
+        bad = client.get(
+            "/api/v1/admin/channels/profiles", params={"limit": 2, "cursor": "not-a-cursor"}, headers=headers
+        )
+        assert bad.status_code == 422
+
+
+def test_channel_account_conditional_gets():
+    with TestClient(app) as client:
+        _, token = _onboard_and_token(client)
+        headers = _headers(token)
+
+        create_resp = client.post(
+            "/api/v1/admin/channels/accounts",
+            headers=headers,
+            json={
+                "channel_type": "messenger",
+                "name": "Messenger QA",
+                "page_id": f"pg_{uuid4().hex[:10]}",
+                "access_token": "test-token",
+            },
+        )
+        assert create_resp.status_code == 200
+        account_id = create_resp.json()["id"]
+
+        list_resp = client.get("/api/v1/admin/channels/accounts", headers=headers)
+        etag = list_resp.headers["etag"]
+        not_modified = client.get("/api/v1/admin/channels/accounts", headers={**headers, "If-None-Match": etag})
+        assert not_modified.status_code == 304
+        assert not_modified.headers["etag"] == etag
+
+        patch_resp = client.patch(
+            f"/api/v1/admin/channels/accounts/{account_id}", headers=headers, json={"name": "Renamed"}
+        )
+        assert patch_resp.status_code == 200
+        changed = client.get("/api/v1/admin/channels/accounts", headers={**headers, "If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+        assert changed.json()[0]["name"] == "Renamed"
+
+        health_url = f"/api/v1/admin/channels/accounts/{account_id}/health"
+        health_resp = client.get(health_url, headers=headers)
+        assert health_resp.status_code == 200
+        assert "max-age=5" in health_resp.headers["cache-control"]
+        health_etag = health_resp.headers["etag"]
+        assert client.get(health_url, headers={**headers, "If-None-Match": health_etag}).status_code == 304
+
+
 def test_handoff_notes_reply_review_agent_reply_and_ai_toggle():
     with TestClient(app) as client:
         tenant_id, token = _onboard_and_token(client)
@@ -504,3 +652,55 @@ def test_support_role_blocked_from_advanced_admin_actions():
             or "Missing required scope: channels:write" in merge_resp.json()["detail"]
         )
 
+
+
+def test_retention_purge_runs_as_background_job():
+    with TestClient(app) as client:
+        tenant_id, token = _onboard_and_token(client)
+        headers = _headers(token)
+
+        old = datetime.now(timezone.utc) - timedelta(days=400)
+        db = SessionLocal()
+        try:
+            for idx in range(3):
+                db.add(
+                    ChatAuditLog(
+                        id=_unique("al"),
+                        tenant_id=tenant_id,
+                        user_id="u_purge",
+                        question=f"old question {idx}",
+                        answer="old answer",
+                        retrieved_chunks=[],
+                        citations=[],
+                        refused=False,
+                        created_at=old,
+                    )
+                )
+            db.add(
+                ChatAuditLog(
+                    id=_unique("al"),
+                    tenant_id=tenant_id,
+                    user_id="u_purge",
+                    question="recent question",
+                    answer="recent answer",
+                    retrieved_chunks=[],
+                    citations=[],
+                    refused=False,
+                )
+            )
+            db.commit()
+        finally:
+            db.close()
+
+        purge_resp = client.post("/api/v1/admin/retention/purge", headers=headers)
+        assert purge_resp.status_code == 202, purge_resp.text
+        job = purge_resp.json()
+        assert job["status"] == "queued"
+
+        job_resp = client.get(f"/api/v1/admin/retention/purge/{job['job_id']}", headers=headers)
+        assert job_resp.status_code == 200, job_resp.text
+        assert job_resp.json()["status"] == "succeeded"
+        assert job_resp.json()["audit_deleted"] == 3
+
+        missing_resp = client.get("/api/v1/admin/retention/purge/rpj_missing", headers=headers)
+        assert missing_resp.status_code == 404
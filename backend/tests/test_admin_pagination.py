@@ -0,0 +1,63 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+
+from app.db.session import SessionLocal
+from app.main import app
+from app.rag.models import Document
+
+
+def test_documents_keyset_pagination_handles_ties():
+    with TestClient(app) as client:
+        onboard_resp = client.post(
+            "/api/v1/tenant/onboard",
+            json={
+                "tenant_name": f"Paging Tenant {uuid4().hex[:8]}",
+                "admin_email": f"paging_{uuid4().hex[:8]}@example.com",
+                "admin_password": "StrongPass123!",
+                "compliance_level": "standard",
+                "bot_name": "Paging Bot",
+                "allowed_origins": ["https://example.com"],
+            },
+        )
+        assert onboard_resp.status_code == 200
+        tenant_id = onboard_resp.json()["tenant"]["id"]
+        headers = {"Authorization": f"Bearer {onboard_resp.json()['access_token']}"}
+
+        # Three documents share one created_at, so only the id tie-breaker orders them.
+        tied_at = datetime.now(timezone.utc).replace(microsecond=0)
+        offsets = [0, 0, 0, -1, 1]
+        created = {f"d_page_{uuid4().hex[:8]}": tied_at + timedelta(minutes=m) for m in offsets}
+        with SessionLocal() as db:
+            db.execute(
+                insert(Document),
+                [
+                    {"id": doc_id, "tenant_id": tenant_id, "filename": f"{doc_id}.txt", "created_at": ts}
+                    for doc_id, ts in created.items()
+                ],
+            )
+            db.commit()
+        expected = sorted(created, key=lambda doc_id: (created[doc_id], doc_id), reverse=True)
+
+        seen: list[str] = []
+        cursor = None
+        for _ in range(len(expected) + 1):
+            params = {"limit": 1}
+            if cursor:
+                params["cursor"] = cursor
+            page = client.get("/api/v1/admin/documents", params=params, headers=headers)
+            assert page.status_code == 200
+            body = page.json()
+            seen.extend(d["id"] for d in body["documents"])
+            cursor = body["next_cursor"]
+            if cursor is None:
+                break
+
+        # No duplicates, no gaps, and the last non-empty page carries no cursor.
+        assert seen == expected
+        assert cursor is None
+
+        bad = client.get("/api/v1/admin/documents", params={"limit": 1, "cursor": "not-a-cursor"}, headers=headers)
+        assert bad.status_code == 422
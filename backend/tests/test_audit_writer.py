@@ -0,0 +1,60 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import select
+
+from app.audit import writer
+from app.audit.models import ChatAuditLog
+from app.db.base import Base
+from app.db.session import SessionLocal, engine
+
+
+def _row(row_id: str, question: str | None = "q") -> dict:
+    return {
+        "id": row_id,
+        "tenant_id": "t_audit_writer",
+        "user_id": "u1",
+        "question": question,
+        "answer": "a",
+        "retrieved_chunks": [],
+        "citations": [],
+        "refused": False,
+        "created_at": datetime.now(timezone.utc),
+    }
+
+
+def test_flush_keeps_good_rows_when_one_row_fails(monkeypatch):
+    Base.metadata.create_all(bind=engine)
+    monkeypatch.setattr(writer.time, "sleep", lambda _s: None)
+
+    # question is NOT NULL, so this row fails the whole executemany batch every time.
+    rows = [_row("al_w1"), _row("al_w_bad", question=None), _row("al_w2")]
+    writer._flush(rows)
+
+    with SessionLocal() as db:
+        ids = set(
+            db.execute(select(ChatAuditLog.id).where(ChatAuditLog.tenant_id == "t_audit_writer")).scalars()
+        )
+    assert ids == {"al_w1", "al_w2"}
+
+
+def test_flush_retries_transient_batch_failure(monkeypatch):
+    Base.metadata.create_all(bind=engine)
+    monkeypatch.setattr(writer.time, "sleep", lambda _s: None)
+
+    real_insert = writer._insert
+    calls = []
+
+    def flaky_insert(rows):
+        calls.append(len(rows))
+        if len(calls) == 1:
+            raise RuntimeError("connection reset")
+        real_insert(rows)
+
+    monkeypatch.setattr(writer, "_insert", flaky_insert)
+    writer._flush([_row("al_w3"), _row("al_w4")])
+
+    # Retried as one batch, not split into single-row inserts.
+    assert calls == [2, 2]
+    with SessionLocal() as db:
+        assert db.get(ChatAuditLog, "al_w3") is not None
+        assert db.get(ChatAuditLog, "al_w4") is not None
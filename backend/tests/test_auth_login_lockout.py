@@ -0,0 +1,97 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+from sqlalchemy import select, update
+
+from app.auth.login_guard import MAX_FAILURES, WINDOW_SECONDS
+from app.auth.models import LoginThrottle
+from app.db.session import SessionLocal
+from app.main import app
+
+PASSWORD = "StrongPass123!"
+
+
+def _onboard(client: TestClient) -> tuple[str, str]:
+    email = f"lockout_{uuid4().hex[:8]}@example.com"
+    resp = client.post(
+        "/api/v1/tenant/onboard",
+        json={
+            "tenant_name": f"Lockout Tenant {uuid4().hex[:8]}",
+            "admin_email": email,
+            "admin_password": PASSWORD,
+            "compliance_level": "standard",
+            "bot_name": "Lockout Bot",
+            "allowed_origins": ["https://example.com"],
+        },
+    )
+    assert resp.status_code == 200
+    return resp.json()["tenant"]["id"], email
+
+
+def _login(client: TestClient, tenant_id: str, email: str, password: str):
+    return client.post(
+        "/api/v1/auth/login",
+        json={"tenant_id": tenant_id, "email": email, "password": password},
+    )
+
+
+def _throttle_row(tenant_id: str, email: str) -> LoginThrottle | None:
+    with SessionLocal() as db:
+        return db.execute(
+            select(LoginThrottle).where(LoginThrottle.key.startswith(f"{tenant_id}:{email}:"))
+        ).scalar_one_or_none()
+
+
+def test_login_locks_on_third_failure_even_for_correct_password():
+    with TestClient(app) as client:
+        tenant_id, email = _onboard(client)
+
+        for _ in range(MAX_FAILURES - 1):
+            assert _login(client, tenant_id, email, "wrong-password").status_code == 401
+
+        tripped = _login(client, tenant_id, email, "wrong-password")
+        assert tripped.status_code == 429
+        assert "Too many failed attempts" in tripped.json()["detail"]
+
+        locked = _login(client, tenant_id, email, PASSWORD)
+        assert locked.status_code == 429
+
+
+def test_login_failure_window_resets_after_window_seconds():
+    with TestClient(app) as client:
+        tenant_id, email = _onboard(client)
+
+        for _ in range(MAX_FAILURES - 1):
+            assert _login(client, tenant_id, email, "wrong-password").status_code == 401
+
+        # Age the window past WINDOW_SECONDS instead of sleeping.
+        with SessionLocal() as db:
+            db.execute(
+                update(LoginThrottle)
+                .where(LoginThrottle.key.startswith(f"{tenant_id}:{email}:"))
+                .values(window_started_at=datetime.now(timezone.utc) - timedelta(seconds=WINDOW_SECONDS + 1))
+            )
+            db.commit()
+
+        # Counted as the first failure of a fresh window, not the one that trips the lock.
+        assert _login(client, tenant_id, email, "wrong-password").status_code == 401
+        assert _throttle_row(tenant_id, email).failure_count == 1
+        assert _login(client, tenant_id, email, PASSWORD).status_code == 200
+
+
+def test_successful_login_clears_failures():
+    with TestClient(app) as client:
+        tenant_id, email = _onboard(client)
+
+        for _ in range(MAX_FAILURES - 1):
+            assert _login(client, tenant_id, email, "wrong-password").status_code == 401
+        assert _throttle_row(tenant_id, email).failure_count == MAX_FAILURES - 1
+
+        assert _login(client, tenant_id, email, PASSWORD).status_code == 200
+        assert _throttle_row(tenant_id, email) is None
+
+        # The earlier failures no longer count toward the lock.
+        for _ in range(MAX_FAILURES - 1):
+            assert _login(client, tenant_id, email, "wrong-password").status_code == 401
+        assert _login(client, tenant_id, email, PASSWORD).status_code == 200
@@ -0,0 +1,127 @@
+from datetime import datetime, timedelta, timezone
+from hashlib import sha256
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+from sqlalchemy import insert, select, update
+
+from app.auth.models import RefreshToken
+from app.auth.security import create_refresh_token, hash_refresh_token
+from app.db.session import SessionLocal
+from app.main import app
+
+PASSWORD = "StrongPass123!"
+
+
+def _login_tokens(client: TestClient) -> dict:
+    email = f"refresh_{uuid4().hex[:8]}@example.com"
+    onboard_resp = client.post(
+        "/api/v1/tenant/onboard",
+        json={
+            "tenant_name": f"Refresh Tenant {uuid4().hex[:8]}",
+            "admin_email": email,
+            "admin_password": PASSWORD,
+            "compliance_level": "standard",
+            "bot_name": "Refresh Bot",
+            "allowed_origins": ["https://example.com"],
+        },
+    )
+    assert onboard_resp.status_code == 200
+    login_resp = client.post(
+        "/api/v1/auth/login",
+        json={"tenant_id": onboard_resp.json()["tenant"]["id"], "email": email, "password": PASSWORD},
+    )
+    assert login_resp.status_code == 200
+    return login_resp.json()
+
+
+def test_refresh_rotates_and_rejects_reuse():
+    with TestClient(app) as client:
+        old_refresh = _login_tokens(client)["refresh_token"]
+
+        rotated = client.post("/api/v1/auth/refresh", json={"refresh_token": old_refresh})
+        assert rotated.status_code == 200
+        new_tokens = rotated.json()
+        assert new_tokens["access_token"]
+        assert new_tokens["refresh_token"] and new_tokens["refresh_token"] != old_refresh
+
+        me_resp = client.get(
+            "/api/v1/auth/me", headers={"Authorization": f"Bearer {new_tokens['access_token']}"}
+        )
+        assert me_resp.status_code == 200
+
+        reused = client.post("/api/v1/auth/refresh", json={"refresh_token": old_refresh})
+        assert reused.status_code == 401
+        assert reused.json()["detail"] == "Refresh token revoked"
+
+        # The replacement token is still good.
+        again = client.post("/api/v1/auth/refresh", json={"refresh_token": new_tokens["refresh_token"]})
+        assert again.status_code == 200
+
+
+def test_refresh_after_logout_is_rejected():
+    with TestClient(app) as client:
+        refresh_token = _login_tokens(client)["refresh_token"]
+
+        logout_resp = client.post("/api/v1/auth/logout", json={"refresh_token": refresh_token})
+        assert logout_resp.status_code == 200
+        assert logout_resp.json()["ok"] is True
+
+        refresh_resp = client.post("/api/v1/auth/refresh", json={"refresh_token": refresh_token})
+        assert refresh_resp.status_code == 401
+        assert refresh_resp.json()["detail"] == "Refresh token revoked"
+
+
+def test_refresh_rejects_expired_token_row():
+    with TestClient(app) as client:
+        refresh_token = _login_tokens(client)["refresh_token"]
+
+        # The JWT itself is still valid; only the stored row has expired.
+        with SessionLocal() as db:
+            db.execute(
+                update(RefreshToken)
+                .where(RefreshToken.token_hash == hash_refresh_token(refresh_token))
+                .values(expires_at=datetime.now(timezone.utc) - timedelta(minutes=1))
+            )
+            db.commit()
+
+        refresh_resp = client.post("/api/v1/auth/refresh", json={"refresh_token": refresh_token})
+        assert refresh_resp.status_code == 401
+        assert refresh_resp.json()["detail"] == "Refresh token expired"
+
+
+def test_refresh_accepts_legacy_sha256_row():
+    with TestClient(app) as client:
+        access_token = _login_tokens(client)["access_token"]
+        me = client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {access_token}"}).json()
+
+        # Stored the way rows were written before keyed hashing: raw unkeyed sha256.
+        legacy_token, expires_at = create_refresh_token({"sub": me["id"], "tenant_id": me["tenant_id"]})
+        legacy_hash = sha256(legacy_token.encode("utf-8")).digest()
+        with SessionLocal() as db:
+            db.execute(
+                insert(RefreshToken).values(
+                    id=f"rt_legacy_{uuid4().hex[:8]}",
+                    user_id=me["id"],
+                    tenant_id=me["tenant_id"],
+                    token_hash=legacy_hash,
+                    expires_at=expires_at,
+                )
+            )
+            db.commit()
+
+        refresh_resp = client.post("/api/v1/auth/refresh", json={"refresh_token": legacy_token})
+        assert refresh_resp.status_code == 200
+
+        with SessionLocal() as db:
+            revoked_at = db.execute(
+                select(RefreshToken.revoked_at).where(RefreshToken.token_hash == legacy_hash)
+            ).scalar_one()
+            new_row = db.execute(
+                select(RefreshToken.id).where(
+                    RefreshToken.token_hash == hash_refresh_token(refresh_resp.json()["refresh_token"])
+                )
+            ).scalar_one_or_none()
+        assert revoked_at is not None
+        # The replacement is stored under the keyed hash.
+        assert new_row is not None